@@ -34,7 +34,7 @@ from ocp_resources.virtual_machine import VirtualMachine
 from pytest_harvest import get_fixture_store
 from pytest_testconfig import config as py_config
 from pyVmomi import vim
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from exceptions.exceptions import (
     ForkliftPodsNotRunningError,
@@ -43,15 +43,23 @@ from exceptions.exceptions import (
     MtvOperatorNotInstalledError,
     RemoteClusterAndLocalCluterNamesError,
 )
+from utilities.clone_scheduler import CloneScheduler
 from utilities.copyoffload_constants import FORKLIFT_CONTROLLER_NAME
 from utilities.copyoffload_migration import apply_copyoffload_vm_name_override
 from libs.base_provider import BaseProvider
-from libs.forklift_inventory import ForkliftInventory, create_forklift_inventory
+from libs.forklift_inventory import (
+    DEFAULT_INVENTORY_CACHE_TTL,
+    ForkliftInventory,
+    create_forklift_inventory,
+    create_inventory_transport,
+)
+from libs.inventory_cassette import RecordingInventoryTransport
 from libs.providers.openshift import OCPProvider
 from libs.providers.vmware import VMWareProvider
 from utilities.constants import MTV_OPERATOR_NAME
 from utilities.hooks import create_hook_if_configured
 from utilities.logger import separator, setup_logging
+from utilities.migration_timeline import MIGRATION_TIMELINES
 from utilities.mtv_migration import get_vm_suffix
 from utilities.must_gather import run_must_gather
 from utilities.provider_inventory import wait_for_cloned_vms_in_forklift_inventory
@@ -69,8 +77,9 @@ from utilities.pytest_utils import (
     session_teardown,
     setup_ai_analysis,
 )
-from utilities.resources import create_and_store_resource, get_or_create_namespace
+from utilities.resources import ResourceBatch, create_and_store_resource, get_or_create_namespace
 from utilities.ssh_utils import SSHConnectionManager
+from utilities.transfer_throughput import TRANSFER_THROUGHPUT
 from utilities.utils import (
     create_source_cnv_vms,
     create_source_provider,
@@ -86,6 +95,7 @@ from utilities.utils import (
 )
 from utilities.virtctl import add_to_path, download_virtctl_from_cluster
 from utilities.vmware_guest_operations import detect_guest_nic_names, detect_vmware_ip_origins_via_guest_ops
+from utilities.waiters import WAIT_STATS, BackoffSampler
 from utilities.worker_node_selection import get_worker_nodes, select_node_by_available_memory
 
 RESULTS_PATH = Path("./.xdist_results/")
@@ -102,6 +112,7 @@ def pytest_addoption(parser):
     teardown_group = parser.getgroup(name="Teardown")
     openshift_python_wrapper_group = parser.getgroup(name="Openshift Python Wrapper")
     analyze_with_ai_group = parser.getgroup(name="Analyze with AI")
+    forklift_inventory_group = parser.getgroup(name="Forklift Inventory")
     analyze_with_ai_group.addoption("--analyze-with-ai", action="store_true", help="Analyze test failures using AI")
 
     providers_group = parser.getgroup(name="Providers")
@@ -123,6 +134,11 @@ def pytest_addoption(parser):
         action="store_true",
         help="Enable debug logging in the openshift-python-wrapper module",
     )
+    forklift_inventory_group.addoption(
+        "--record-inventory-cassette",
+        help="Record source provider Forklift inventory responses to this gzip JSONL cassette for offline replay",
+        default=None,
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -208,8 +224,12 @@ def pytest_runtest_setup(item):
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='SETUP')}")
 
 
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_call(item):
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='CALL')}")
+    yield
+    # Report disk transfer throughput of the migrations the test ran, before the junit report is built
+    item.user_properties.extend(TRANSFER_THROUGHPUT.pop_junit_properties())
 
 
 def pytest_runtest_teardown(item):
@@ -247,6 +267,17 @@ def pytest_sessionfinish(session, exitstatus):
 
     if not session.config.getoption("skip_data_collector"):
         collect_created_resources(session_store=_session_store, data_collector_path=_data_collector_path)
+        _worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+        WAIT_STATS.export(
+            path=_data_collector_path / (f"wait-stats-{_worker_id}.json" if _worker_id else "wait-stats.json")
+        )
+        MIGRATION_TIMELINES.export(
+            directory=_data_collector_path / "migration-timelines", suffix=f"-{_worker_id}" if _worker_id else ""
+        )
+        TRANSFER_THROUGHPUT.export(
+            path=_data_collector_path
+            / (f"disk-transfer-throughput-{_worker_id}.json" if _worker_id else "disk-transfer-throughput.json")
+        )
 
     if session.config.getoption("skip_teardown"):
         LOGGER.warning("User requested to skip teardown of resources")
@@ -804,6 +835,7 @@ def vcenter_clone_provider(
         username=clone_provider_data["username"],
         password=clone_provider_data["password"],
         fixture_store=fixture_store,
+        vm_pool_size=py_config.get("vm_pool_size", 0),
     )
     provider.connect()
     try:
@@ -1014,8 +1046,8 @@ def prepared_plan(
     function-scoped `plan` fixture but at class scope. It prepares VMs
     once per test class rather than once per test function.
 
-    Cloning uses a two-phase pattern: all VMs are cloned first, then Forklift
-    inventory sync is waited on for every cloned VM. vSphere inventory sync
+    Cloning uses a two-phase pattern: all VMs are cloned first, concurrently
+    through CloneScheduler, then Forklift inventory sync is waited on for every cloned VM. vSphere inventory sync
     workarounds (MTV-6066) are gated by MTV-6072 via jira_issue_scope_session: active
     while the issue is open or Jira is unavailable, skipped when resolved.
     This avoids inventory sync failures when cloning VM2+ while VM1 inventory
@@ -1170,26 +1202,34 @@ def prepared_plan(
                         source_provider.stop_vm(provider_vm_api)
 
         if not skip_clone:
+            # Phase 1: clone every VM concurrently, see CloneScheduler for the concurrency limits.
+            # VMs are processed below in config order, independent of clone completion order.
+            clone_scheduler = CloneScheduler(provider=clone_provider)
+            provider_vm_apis: list[Any] = []
             for vm in virtual_machines:
                 clone_options = {**vm, "enable_ctk": warm_migration}
+                # Plan level VMware clone_mode (full / linked / instant), a per-VM clone_mode wins
+                if plan.get("clone_mode"):
+                    clone_options.setdefault("clone_mode", plan["clone_mode"])
 
                 # Pin VM2+ to same ESXi host as VM1 (required for per-host inflight throttling).
                 # Uses setdefault to respect any explicit per-VM target_esxi_host override.
                 if plan.get("clone_to_same_host", False) and first_vm_esxi_host:
                     clone_options.setdefault("target_esxi_host", first_vm_esxi_host)
 
-                provider_vm_api = clone_provider.get_vm_by_name(
+                clone_scheduler.add(
                     query=vm["name"],
                     vm_name_suffix=vm_name_suffix,
-                    clone_vm=True,
                     session_uuid=fixture_store["session_uuid"],
                     clone_options=clone_options,
                 )
 
-                # Capture first VM's ESXi hostname for subsequent same-host clones.
+                # Capture first VM's ESXi hostname for subsequent same-host clones, VM1 clones alone.
                 if plan.get("clone_to_same_host", False) and first_vm_esxi_host is None:
-                    runtime_host = provider_vm_api.runtime.host
+                    provider_vm_apis.extend(clone_scheduler.run())
+                    runtime_host = provider_vm_apis[0].runtime.host
                     if runtime_host is None or not runtime_host.name:
+                        clone_scheduler.rollback()
                         raise ValueError(
                             f"clone_to_same_host=True but could not determine ESXi host "
                             f"for VM '{vm['name']}'. Cannot pin subsequent clones."
@@ -1197,6 +1237,9 @@ def prepared_plan(
                     first_vm_esxi_host = runtime_host.name
                     LOGGER.info(f"Same-host cloning: pinning subsequent VMs to ESXi host '{first_vm_esxi_host}'")
 
+            provider_vm_apis.extend(clone_scheduler.run())
+
+            for vm, provider_vm_api in zip(virtual_machines, provider_vm_apis, strict=True):
                 # Disable DRS per VM to prevent relocation after cloning.
                 if plan.get("disable_drs_for_vms", False) and isinstance(clone_provider, VMWareProvider):
                     clone_provider.disable_drs_for_vm(provider_vm_api)
@@ -1294,9 +1337,11 @@ def prepared_plan(
         for vm in virtual_machines:
             vm["targetName"] = sanitize_kubernetes_name(f"{session_uuid}-{vm['name']}")
 
-    # Create Hooks if configured
-    create_hook_if_configured(plan, "pre_hook", "pre", fixture_store, ocp_admin_client, target_namespace)
-    create_hook_if_configured(plan, "post_hook", "post", fixture_store, ocp_admin_client, target_namespace)
+    # Create Hooks if configured, pre and post hooks are created concurrently
+    hooks_batch = ResourceBatch(client=ocp_admin_client, fixture_store=fixture_store)
+    create_hook_if_configured(plan, "pre_hook", "pre", fixture_store, ocp_admin_client, target_namespace, hooks_batch)
+    create_hook_if_configured(plan, "post_hook", "post", fixture_store, ocp_admin_client, target_namespace, hooks_batch)
+    hooks_batch.deploy()
 
     yield plan
 
@@ -1591,10 +1636,10 @@ def forklift_pods_state(ocp_admin_client: DynamicClient) -> None:
 
         return True
 
-    for sample in TimeoutSampler(
+    for sample in BackoffSampler(
         func=_get_not_running_pods,
         _admin_client=ocp_admin_client,
-        sleep=1,
+        sleep=5,
         wait_timeout=60 * 5,
         exceptions_dict={ForkliftPodsNotRunningError: [], NotFoundError: []},
     ):
@@ -1604,9 +1649,33 @@ def forklift_pods_state(ocp_admin_client: DynamicClient) -> None:
 
 @pytest.fixture(scope="session")
 def source_provider_inventory(
-    ocp_admin_client: DynamicClient, mtv_namespace: str, source_provider: BaseProvider
-) -> ForkliftInventory:
-    return create_forklift_inventory(client=ocp_admin_client, mtv_namespace=mtv_namespace, provider=source_provider)
+    request: pytest.FixtureRequest, ocp_admin_client: DynamicClient, mtv_namespace: str, source_provider: BaseProvider
+) -> Generator[ForkliftInventory, None, None]:
+    transport = None
+    if cassette_path := request.config.getoption("--record-inventory-cassette"):
+        # Each xdist worker records its own cassette, gzip appends from several processes would interleave
+        if worker_id := os.environ.get("PYTEST_XDIST_WORKER"):
+            cassette_path = f"{cassette_path}.{worker_id}"
+
+        transport = RecordingInventoryTransport(
+            transport=create_inventory_transport(client=ocp_admin_client, mtv_namespace=mtv_namespace),
+            cassette_path=cassette_path,
+        )
+
+    inventory = create_forklift_inventory(
+        client=ocp_admin_client,
+        mtv_namespace=mtv_namespace,
+        provider=source_provider,
+        cache_ttl=py_config.get("forklift_inventory_cache_ttl", DEFAULT_INVENTORY_CACHE_TTL),
+        transport=transport,
+    )
+    yield inventory
+
+    LOGGER.info(
+        f"Forklift inventory stats for provider '{inventory.provider_name}': "
+        f"cache={inventory.cache.stats}, transport={inventory.transport.stats}"
+    )
+    inventory.transport.close()
 
 
 @pytest.fixture(scope="session")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 from typing import TYPE_CHECKING, Any
 
@@ -28,6 +29,12 @@ class BaseProvider(abc.ABC):
         "power_state": "",
         "firmware": {},
     }
+    # Concurrent clones of one provider, see utilities.clone_scheduler.CloneScheduler
+    CLONE_CONCURRENCY = 1
+    # Providers cloning a batch of VMs with one get_vms_by_name call instead of a thread per clone
+    BATCH_CLONES = False
+    # Concurrent deletions of one provider, see delete_vms
+    DELETE_CONCURRENCY = 4
 
     def __init__(
         self,
@@ -77,6 +84,33 @@ class BaseProvider(abc.ABC):
         """
         pass
 
+    def vm_dicts(self, names: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+        """
+        Create the vm_dict of several vms, kwargs apply to every vm.
+        Providers that can fetch several vms at once override this, the default calls vm_dict per vm.
+        """
+        kwargs.pop("provider_vm_api", None)
+        return [self.vm_dict(name=name, **kwargs) for name in names]
+
+    def delete_vms(self, names: list[str]) -> dict[str, BaseException]:
+        """
+        Delete several vms, up to DELETE_CONCURRENCY at a time, and wait for all of them.
+        A failed deletion does not stop the others, every failure is returned.
+
+        Args:
+            names (list[str]): Names of the vms to delete.
+
+        Returns:
+            dict[str, BaseException]: The failure of every vm that was not deleted, by vm name.
+        """
+        if not names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(names), self.DELETE_CONCURRENCY))) as executor:
+            futures = {name: executor.submit(self.delete_vm, vm_name=name) for name in names}
+
+        return {name: exp for name, future in futures.items() if (exp := future.exception())}
+
     def _generate_clone_vm_name(self, session_uuid: str, base_name: str) -> str:
         """
         Generate a unique clone VM name with UUID and truncate if needed.
@@ -123,6 +157,17 @@ class BaseProvider(abc.ABC):
         """
         pass
 
+    def clone_targets(self, clone_options: dict[str, Any]) -> set[str]:
+        """Shared resources a clone is created on, e.g. datastore and host, limited per target by CloneScheduler.
+
+        Args:
+            clone_options (dict[str, Any]): The clone options of the VM.
+
+        Returns:
+            set[str]: Target keys, empty when the provider has no per target limit.
+        """
+        return set()
+
     def supports_skip_clone(self) -> bool:
         """Whether this provider supports skipping the cloning phase for plan-readiness tests.
 
@@ -1,20 +1,34 @@
 from __future__ import annotations
 
 import abc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any
 
+import requests
+import urllib3
 from kubernetes.dynamic.client import DynamicClient
 from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
 from ocp_resources.provider import Provider
 from ocp_resources.route import Route
+from requests.adapters import HTTPAdapter
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from libs.base_provider import BaseProvider
 
 PROVIDER_INVENTORY_MAP: dict[str, type[ForkliftInventory]] = {}
 
+# Seconds a cached inventory response stays valid; 0 disables caching
+DEFAULT_INVENTORY_CACHE_TTL = 30
+# Keep-alive connections held open to the forklift-inventory route
+INVENTORY_POOL_SIZE = 10
+INVENTORY_REQUEST_TIMEOUT = 120
+
 LOGGER = get_logger(__name__)
 
 
@@ -30,6 +44,256 @@ def _extract_storage_ids(storages: list[dict[str, Any]]) -> set[str]:
     return {storage["id"] for storage in storages if storage.get("id")}
 
 
+class InventoryTransport(abc.ABC):
+    """Backend serving Forklift inventory GET requests for ForkliftInventory.
+
+    Records the latency of every request. Subclasses implement ``_fetch``, which may be
+    called from several threads at once.
+    """
+
+    def __init__(self) -> None:
+        self.latencies: list[tuple[str, float]] = []
+        self._latencies_lock = threading.Lock()
+
+    def get(self, url_path: str = "") -> Any:
+        """GET an inventory path below /providers.
+
+        Args:
+            url_path (str): Inventory path, e.g. ``vsphere/<id>/vms``. Empty string lists provider types.
+
+        Returns:
+            Any: Decoded JSON response, or the raw body when it is not JSON.
+        """
+        start = time.monotonic()
+        try:
+            return self._fetch(url_path=url_path)
+        finally:
+            elapsed = time.monotonic() - start
+            with self._latencies_lock:
+                self.latencies.append((url_path, elapsed))
+            LOGGER.debug(f"Inventory GET '{url_path}' took {elapsed:.3f}s")
+
+    @abc.abstractmethod
+    def _fetch(self, url_path: str) -> Any:
+        pass
+
+    @property
+    def stats(self) -> dict[str, float]:
+        with self._latencies_lock:
+            _latencies = [_latency for _, _latency in self.latencies]
+        return {
+            "requests": len(_latencies),
+            "total_seconds": sum(_latencies),
+            "max_seconds": max(_latencies, default=0.0),
+            "avg_seconds": sum(_latencies) / len(_latencies) if _latencies else 0.0,
+        }
+
+    def close(self) -> None:
+        return
+
+
+class SessionInventoryTransport(InventoryTransport):
+    """Connection-pooled keep-alive HTTPS session bound to the forklift-inventory route host.
+
+    Reuses the cluster client's bearer token and CA settings and asks for gzip-encoded responses.
+    The token is read from the client configuration on every request, so token refreshes apply.
+    """
+
+    def __init__(self, client: DynamicClient, host: str, pool_size: int = INVENTORY_POOL_SIZE) -> None:
+        super().__init__()
+        configuration = client.configuration
+        self.configuration = configuration
+        self.base_url = f"https://{host}/providers"
+        self.session = requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+        self.session.verify = (configuration.ssl_ca_cert or True) if configuration.verify_ssl else False
+        if configuration.cert_file and configuration.key_file:
+            self.session.cert = (configuration.cert_file, configuration.key_file)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+        if not configuration.verify_ssl:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    def _fetch(self, url_path: str) -> Any:
+        """GET an inventory path over the pooled session.
+
+        Raises:
+            requests.HTTPError: If the inventory returns an error status.
+        """
+        # Runs the client's refresh_api_key_hook, if any, before the token is read
+        token = self.configuration.get_api_key_with_prefix("authorization")
+        response = self.session.get(
+            f"{self.base_url}{f'/{url_path}' if url_path else ''}",
+            headers={"authorization": token} if token else None,
+            timeout=INVENTORY_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def create_inventory_transport(client: DynamicClient, mtv_namespace: str) -> SessionInventoryTransport:
+    """Pooled transport bound to the forklift-inventory route of the MTV namespace.
+
+    Args:
+        client (DynamicClient): OpenShift admin client.
+        mtv_namespace (str): MTV operator namespace.
+
+    Returns:
+        SessionInventoryTransport: Transport for ForkliftInventory.
+    """
+    route = Route(client=client, name="forklift-inventory", namespace=mtv_namespace)
+    return SessionInventoryTransport(client=client, host=route.host)
+
+
+class InventoryResponseCache:
+    """TTL cache of Forklift inventory responses keyed by URL path.
+
+    Entries expire after ``ttl`` seconds and can be dropped explicitly with
+    ``invalidate`` when the provider tree is known to have changed (refresh,
+    clone, delete). Hit/miss counters are kept for reporting. Safe to share between
+    the threads of a parallel fan-out.
+    """
+
+    def __init__(self, ttl: int = DEFAULT_INVENTORY_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url_path: str) -> tuple[bool, Any]:
+        """Look up a cached response.
+
+        Args:
+            url_path (str): Inventory URL path the response was fetched from.
+
+        Returns:
+            tuple[bool, Any]: (True, response) on a fresh hit, (False, None) otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(url_path)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                self.hits += 1
+                return True, entry[1]
+
+            self.misses += 1
+            return False, None
+
+    def set(self, url_path: str, response: Any) -> None:
+        if self.ttl > 0:
+            with self._lock:
+                self._entries[url_path] = (time.monotonic(), response)
+
+    def invalidate(self, url_path_prefix: str = "") -> None:
+        """Drop cached responses whose URL path starts with the given prefix.
+
+        Args:
+            url_path_prefix (str): Path prefix to drop. Empty string drops everything.
+        """
+        with self._lock:
+            if not url_path_prefix:
+                self._entries.clear()
+                return
+
+            for _path in [_path for _path in self._entries if _path.startswith(url_path_prefix)]:
+                del self._entries[_path]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+class InventoryVmIndex:
+    """Name-to-ID index built from a Forklift inventory VM-list snapshot.
+
+    Every update re-indexes from the snapshot, so a VM recreated under the same name
+    resolves to its new ID and deleted VMs are dropped. Within a snapshot the first VM
+    seen for a name wins, matching the linear scan it replaces.
+    """
+
+    def __init__(self) -> None:
+        self.by_name: dict[str, str] = {}
+        self.built = False
+
+    def update(self, vms: list[dict[str, Any]]) -> None:
+        """Index the VMs of a full VM-list snapshot.
+
+        Args:
+            vms (list[dict[str, Any]]): VM entries from the inventory /vms endpoint.
+        """
+        by_name: dict[str, str] = {}
+        for _vm in vms:
+            by_name.setdefault(_vm["name"], _vm["id"])
+
+        for _name, _vm_id in by_name.items():
+            if (_indexed_id := self.by_name.get(_name)) and _indexed_id != _vm_id:
+                LOGGER.info(f"VM '{_name}' was recreated (ID {_indexed_id} -> {_vm_id}), re-indexing it")
+
+        self.by_name = by_name
+        self.built = True
+
+    def clear(self) -> None:
+        self.by_name.clear()
+        self.built = False
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.by_name)
+
+
+class ProviderIdRegistry:
+    """Session-wide registry of Forklift inventory provider IDs.
+
+    Keyed by provider name and type so every ForkliftInventory built for the same
+    Provider CR shares one resolved ID. An entry is dropped when the Provider CR UID
+    changes, i.e. the CR was deleted and recreated under the same name.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def get(self, provider_name: str, provider_type: str, provider_uid: str = "") -> str | None:
+        """Get the registered inventory ID of a provider.
+
+        Args:
+            provider_name (str): Provider CR name.
+            provider_type (str): Provider type, e.g. ``vsphere``.
+            provider_uid (str): Provider CR UID the ID must belong to. Defaults to "".
+
+        Returns:
+            str | None: Inventory provider ID, or None when unknown or registered for another UID.
+        """
+        entry = self._ids.get((provider_name, provider_type))
+        if not entry:
+            return None
+
+        if entry[0] != provider_uid:
+            LOGGER.info(f"Provider '{provider_name}' was recreated (UID {entry[0]} -> {provider_uid}), resolving again")
+            self.invalidate(provider_name=provider_name, provider_type=provider_type)
+            return None
+
+        return entry[1]
+
+    def set(self, provider_name: str, provider_type: str, provider_id: str, provider_uid: str = "") -> None:
+        self._ids[(provider_name, provider_type)] = (provider_uid, provider_id)
+
+    def invalidate(self, provider_name: str, provider_type: str) -> None:
+        self._ids.pop((provider_name, provider_type), None)
+
+
+PROVIDER_ID_REGISTRY = ProviderIdRegistry()
+
+
 def _register_inventory_classes() -> None:
     """Populate PROVIDER_INVENTORY_MAP after all classes are defined."""
     PROVIDER_INVENTORY_MAP.update({
@@ -41,10 +305,34 @@ def _register_inventory_classes() -> None:
     })
 
 
+def get_inventory_class(provider_type: str) -> type[ForkliftInventory]:
+    """ForkliftInventory subclass for a provider type.
+
+    Args:
+        provider_type (str): Provider type, e.g. ``vsphere``.
+
+    Returns:
+        type[ForkliftInventory]: Inventory class matching the provider type.
+
+    Raises:
+        ValueError: If the provider type is not supported.
+    """
+    if not PROVIDER_INVENTORY_MAP:
+        _register_inventory_classes()
+
+    provider_class = PROVIDER_INVENTORY_MAP.get(provider_type)
+    if provider_class is None:
+        raise ValueError(f"Provider {provider_type} not implemented")
+
+    return provider_class
+
+
 def create_forklift_inventory(
     client: DynamicClient,
     mtv_namespace: str,
     provider: BaseProvider,
+    cache_ttl: int = DEFAULT_INVENTORY_CACHE_TTL,
+    transport: InventoryTransport | None = None,
 ) -> ForkliftInventory:
     """ForkliftInventory instance for the given provider.
 
@@ -52,6 +340,8 @@ def create_forklift_inventory(
         client (DynamicClient): OpenShift admin client.
         mtv_namespace (str): MTV operator namespace.
         provider (BaseProvider): Source provider instance.
+        cache_ttl (int): Seconds inventory responses are cached for; 0 disables caching.
+        transport (InventoryTransport | None): Inventory backend. Defaults to a pooled session on the route.
 
     Returns:
         ForkliftInventory: Inventory instance matching the provider type.
@@ -60,62 +350,99 @@ def create_forklift_inventory(
         ValueError: If ocp_resource is not set on the provider.
         ValueError: If the provider type is not supported.
     """
-    if not PROVIDER_INVENTORY_MAP:
-        _register_inventory_classes()
-
     if provider.ocp_resource is None:
         raise ValueError(f"{provider.type} provider ocp_resource is not set")
 
-    provider_class = PROVIDER_INVENTORY_MAP.get(provider.type)
-    if provider_class is None:
-        raise ValueError(f"Provider {provider.type} not implemented")
+    provider_class = get_inventory_class(provider_type=provider.type)
 
     return provider_class(  # type: ignore[call-arg]  # Subclasses use 'namespace' param while base class uses 'mtv_namespace'
         client=client,
         namespace=mtv_namespace,
         provider_name=provider.ocp_resource.name,
+        provider_uid=provider.ocp_resource.instance.metadata.uid,
+        cache_ttl=cache_ttl,
+        transport=transport,
     )
 
 
 class ForkliftInventory(abc.ABC):
-    def __init__(self, client: DynamicClient, provider_name: str, mtv_namespace: str, provider_type: str) -> None:
+    def __init__(
+        self,
+        client: DynamicClient,
+        provider_name: str,
+        mtv_namespace: str,
+        provider_type: str,
+        provider_uid: str = "",
+        cache_ttl: int = DEFAULT_INVENTORY_CACHE_TTL,
+        transport: InventoryTransport | None = None,
+    ) -> None:
         self.client = client
-        self.route = Route(client=self.client, name="forklift-inventory", namespace=mtv_namespace)
+        self.transport = transport or create_inventory_transport(client=self.client, mtv_namespace=mtv_namespace)
         self.provider_name = provider_name
         self.provider_type = provider_type
+        self.provider_uid = provider_uid
+        self.cache = InventoryResponseCache(ttl=cache_ttl)
+        self.vm_index = InventoryVmIndex()
         self.provider_id = self._provider_id
         self.provider_url_path = f"{self.provider_type}/{self.provider_id}"
         self.vms_path = f"{self.provider_url_path}/vms"
 
-    def _request(self, url_path: str = "") -> Any:
-        return self.route.api_request(
-            method="GET",
-            url=f"https://{self.route.host}",
-            action=f"providers{f'/{url_path}' if url_path else ''}",
-        )
+    def _request(self, url_path: str = "", use_cache: bool = True) -> Any:
+        if use_cache:
+            cached, response = self.cache.get(url_path=url_path)
+            if cached:
+                return response
+
+        response = self.transport.get(url_path=url_path)
+        self.cache.set(url_path=url_path, response=response)
+        return response
+
+    def invalidate_cache(self, url_path_prefix: str = "") -> None:
+        """Drop cached inventory responses after the provider tree changed.
+
+        Args:
+            url_path_prefix (str): Only drop paths starting with this prefix. Defaults to everything.
+        """
+        LOGGER.debug(f"Invalidating inventory cache for provider '{self.provider_name}': {self.cache.stats}")
+        self.cache.invalidate(url_path_prefix=url_path_prefix)
+        if self.vms_path.startswith(url_path_prefix):
+            self.vm_index.clear()
 
     @property
     def _provider_id(self) -> str:
         """
-        Get the provider ID from the inventory, retrying until it is found.
+        Get the provider ID from the session registry, or from the inventory retrying until it is found.
         """
+        if _provider_id := PROVIDER_ID_REGISTRY.get(
+            provider_name=self.provider_name, provider_type=self.provider_type, provider_uid=self.provider_uid
+        ):
+            return _provider_id
+
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=180,
                 sleep=5,
                 func=lambda: [
                     _provider["id"]
-                    for _provider in self._request(url_path=self.provider_type)
+                    for _provider in self._request(url_path=self.provider_type, use_cache=False)
                     if _provider["name"] == self.provider_name
+                    # Skip a stale entry of a deleted CR with the same name
+                    and (not self.provider_uid or _provider.get("uid", self.provider_uid) == self.provider_uid)
                 ],
             ):
                 if sample:
+                    PROVIDER_ID_REGISTRY.set(
+                        provider_name=self.provider_name,
+                        provider_type=self.provider_type,
+                        provider_id=sample[0],
+                        provider_uid=self.provider_uid,
+                    )
                     return sample[0]
         except TimeoutExpiredError:
             LOGGER.error(f"Timed out waiting for provider {self.provider_name} to appear in inventory.")
             raise
 
-        # Unreachable: TimeoutSampler raises TimeoutExpiredError on timeout, but mypy needs this in order to pass type checking
+        # Unreachable: BackoffSampler raises TimeoutExpiredError on timeout, but mypy needs this in order to pass type checking
         raise ValueError(f"Provider {self.provider_name} not found in inventory after waiting.")
 
     def get_data(self) -> dict[str, Any]:
@@ -125,12 +452,79 @@ class ForkliftInventory(abc.ABC):
     def vms(self) -> list[dict[str, Any]]:
         return self._request(url_path=self.vms_path)
 
+    def _refresh_vm_index(self) -> None:
+        """Index VMs from a fresh VM-list snapshot."""
+        self.cache.invalidate(url_path_prefix=self.vms_path)
+        self.vm_index.update(vms=self.vms)
+
+    def get_vm_id(self, name: str) -> str:
+        """Resolve a VM name to its inventory ID.
+
+        The index is refreshed from one new VM-list snapshot only when the name is missing.
+        An unbuilt index is always built from a fresh list, since it is cleared together
+        with the cached VM list.
+
+        Args:
+            name (str): VM name.
+
+        Returns:
+            str: Inventory ID of the VM.
+
+        Raises:
+            ValueError: If the VM is not in the inventory.
+        """
+        if not self.vm_index.built:
+            self.vm_index.update(vms=self.vms)
+        elif name not in self.vm_index.by_name:
+            self._refresh_vm_index()
+
+        if _vm_id := self.vm_index.by_name.get(name):
+            return _vm_id
+
+        raise ValueError(f"VM {name} not found. Available VMs: {self.vm_index.names}")
+
     def get_vm(self, name: str) -> dict[str, Any]:
-        for _vm in self.vms:
-            if _vm["name"] == name:
-                return self._request(url_path=f"{self.vms_path}/{_vm['id']}")
+        return self._request(url_path=f"{self.vms_path}/{self.get_vm_id(name=name)}")
+
+    def _request_many(self, url_paths: list[str]) -> dict[str, Any]:
+        """GET several inventory paths with a bounded parallel fan-out over the pooled transport.
+
+        Args:
+            url_paths (list[str]): Inventory paths to fetch; duplicates are fetched once.
+
+        Returns:
+            dict[str, Any]: Mapping of URL path to response.
+        """
+        _url_paths = list(dict.fromkeys(url_paths))
+        if not _url_paths:
+            return {}
+
+        responses: dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=min(len(_url_paths), INVENTORY_POOL_SIZE)) as executor:
+            future_to_path = {executor.submit(self._request, url_path=_path): _path for _path in _url_paths}
+            for future in as_completed(future_to_path):
+                responses[future_to_path[future]] = future.result()
+
+        return responses
+
+    def get_vms(self, names: list[str]) -> dict[str, dict[str, Any]]:
+        """Get inventory details for several VMs at once.
+
+        IDs are resolved from one VM-list snapshot and the details are fetched in parallel,
+        so the cost does not grow with the inventory size per VM.
+
+        Args:
+            names (list[str]): VM names.
 
-        raise ValueError(f"VM {name} not found. Available VMs: {self.vms_names}")
+        Returns:
+            dict[str, dict[str, Any]]: Mapping of VM name to VM detail, in the order of ``names``.
+
+        Raises:
+            ValueError: If any VM is not in the inventory.
+        """
+        vm_paths = {_name: f"{self.vms_path}/{self.get_vm_id(name=_name)}" for _name in names}
+        details = self._request_many(url_paths=list(vm_paths.values()))
+        return {_name: details[_path] for _name, _path in vm_paths.items()}
 
     def _check_openstack_volumes_synced(self, vm: dict[str, Any], vm_name: str) -> bool:
         """Verify OpenStack VM's attached volumes are synced and queryable.
@@ -207,76 +601,120 @@ class ForkliftInventory(abc.ABC):
 
         return True
 
-    def wait_for_vm(self, name: str, timeout: int = 300, sleep: int = 10) -> dict[str, Any]:
-        """Wait for a VM to appear in the Forklift inventory after cloning.
+    def _is_vm_synced(self, vm: dict[str, Any], vm_name: str) -> bool:
+        """Check that provider-specific VM data required for mappings is synced.
 
-        For OpenStack VMs, also waits for attached volumes and networks to sync,
-        as these are synced separately from VM metadata and are required for
-        storage/network mapping.
+        For OpenStack, attached volumes and networks are synced separately from VM metadata.
 
         Args:
-            name: VM name to wait for
+            vm (dict[str, Any]): VM detail from Forklift inventory
+            vm_name (str): VM name for logging
+
+        Returns:
+            bool: True if the VM can be used for storage/network mapping
+        """
+        if self.provider_type != Provider.ProviderType.OPENSTACK:
+            return True
+
+        return self._check_openstack_volumes_synced(vm, vm_name) and self._check_openstack_networks_synced(vm, vm_name)
+
+    def wait_for_vms(self, names: list[str], timeout: int = 300, sleep: int = 10) -> dict[str, dict[str, Any]]:
+        """Wait for several VMs to appear in the Forklift inventory after cloning.
+
+        Each tick lists the provider VMs once for all pending names and fetches details only
+        for VMs that became visible, so the wait costs one list request per tick regardless
+        of how many VMs are pending. For OpenStack VMs, details are re-fetched until attached
+        volumes and networks are synced.
+
+        Args:
+            names: VM names to wait for
             timeout: Maximum time to wait in seconds (default: 300)
             sleep: Time to sleep between checks in seconds (default: 10)
 
         Returns:
-            VM dictionary from inventory
+            Mapping of VM name to VM dictionary from inventory
 
         Raises:
-            TimeoutExpiredError: If VM doesn't appear within timeout or attached volumes/networks don't sync
+            TimeoutExpiredError: If any VM doesn't appear within timeout or its attached volumes/networks don't sync
         """
-        LOGGER.info(f"Waiting for VM '{name}' to appear in Forklift inventory...")
-        last_vm: dict[str, Any] = {}
+        LOGGER.info(f"Waiting for VMs {names} to appear in Forklift inventory...")
+        ready: dict[str, dict[str, Any]] = {}
+        unsynced: dict[str, dict[str, Any]] = {}
+
+        def _check_vms_ready() -> bool:
+            """Fetch one VM-list snapshot and collect the VMs that are fully synced."""
+            # Each tick must see fresh inventory; calls within the tick share one fetch
+            self.invalidate_cache(url_path_prefix=self.provider_url_path)
+            self.vm_index.update(vms=self.vms)
+
+            for _name in names:
+                if _name in ready or not (_vm_id := self.vm_index.by_name.get(_name)):
+                    continue
 
-        def _check_vm_ready() -> dict[str, Any] | None:
-            """Check if VM exists and has all required data synced."""
-            nonlocal last_vm
-            try:
-                vm = self.get_vm(name=name)
-                last_vm = vm
-
-                # For OpenStack, verify volumes and networks are synced
-                if self.provider_type == Provider.ProviderType.OPENSTACK:
-                    if not (
-                        self._check_openstack_volumes_synced(vm, name)
-                        and self._check_openstack_networks_synced(vm, name)
-                    ):
-                        return None
-
-                return vm
-            except ValueError:
-                return None
+                _vm = self._request(url_path=f"{self.vms_path}/{_vm_id}")
+                if not self._is_vm_synced(_vm, _name):
+                    unsynced[_name] = _vm
+                    continue
+
+                unsynced.pop(_name, None)
+                ready[_name] = _vm
+                LOGGER.info(f"VM '{_name}' found in inventory with all required data")
+
+            return len(ready) == len(set(names))
 
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=timeout,
                 sleep=sleep,
-                func=_check_vm_ready,
+                func=_check_vms_ready,
             ):
                 if sample:
-                    LOGGER.info(f"VM '{name}' found in inventory with all required data")
-                    return sample
+                    return ready
         except TimeoutExpiredError:
-            if last_vm:
-                raise TimeoutExpiredError(
-                    f"VM '{name}' found in Forklift inventory but attached volumes or networks did not sync after {timeout}s. "
-                    f"Attached volumes: {last_vm.get('attachedVolumes', [])}, "
-                    f"VM addresses: {last_vm.get('addresses', {})}"
+            missing = [_name for _name in names if _name not in ready and _name not in unsynced]
+            errors: list[str] = []
+            for _name, _vm in unsynced.items():
+                errors.append(
+                    f"VM '{_name}' found in Forklift inventory but attached volumes or networks did not sync after {timeout}s. "
+                    f"Attached volumes: {_vm.get('attachedVolumes', [])}, "
+                    f"VM addresses: {_vm.get('addresses', {})}"
                 )
-            raise TimeoutExpiredError(
-                f"VM '{name}' did not appear in Forklift inventory after {timeout}s. Available VMs: {self.vms_names}"
-            )
+            if missing:
+                errors.append(
+                    f"VMs {missing} did not appear in Forklift inventory after {timeout}s. "
+                    f"Available VMs: {self.vms_names}"
+                )
+            raise TimeoutExpiredError("\n".join(errors))
 
         # This should never be reached, but satisfies type checker
-        raise TimeoutExpiredError(f"VM '{name}' wait completed unexpectedly without returning")
+        raise TimeoutExpiredError(f"VMs {names} wait completed unexpectedly without returning")
+
+    def wait_for_vm(self, name: str, timeout: int = 300, sleep: int = 10) -> dict[str, Any]:
+        """Wait for a VM to appear in the Forklift inventory after cloning.
+
+        For OpenStack VMs, also waits for attached volumes and networks to sync,
+        as these are synced separately from VM metadata and are required for
+        storage/network mapping.
+
+        Args:
+            name: VM name to wait for
+            timeout: Maximum time to wait in seconds (default: 300)
+            sleep: Time to sleep between checks in seconds (default: 10)
+
+        Returns:
+            VM dictionary from inventory
+
+        Raises:
+            TimeoutExpiredError: If VM doesn't appear within timeout or attached volumes/networks don't sync
+        """
+        return self.wait_for_vms(names=[name], timeout=timeout, sleep=sleep)[name]
 
     @property
     def vms_names(self) -> list[str]:
-        _vms: list[str] = []
-        for _vm in self.vms:
-            _vms.append(_vm["name"])
+        if not self.vm_index.built:
+            self.vm_index.update(vms=self.vms)
 
-        return _vms
+        return self.vm_index.names
 
     @property
     def networks(self) -> list[dict[str, Any]]:
@@ -308,10 +746,14 @@ class ForkliftInventory(abc.ABC):
 
 
 class OvirtForkliftInventory(ForkliftInventory):
-    def __init__(self, client: DynamicClient, provider_name: str, namespace: str) -> None:
+    def __init__(self, client: DynamicClient, provider_name: str, namespace: str, **kwargs: Any) -> None:
         self.provider_type = Provider.ProviderType.RHV
         super().__init__(
-            client=client, provider_name=provider_name, mtv_namespace=namespace, provider_type=self.provider_type
+            client=client,
+            provider_name=provider_name,
+            mtv_namespace=namespace,
+            provider_type=self.provider_type,
+            **kwargs,
         )
 
     @property
@@ -325,15 +767,18 @@ class OvirtForkliftInventory(ForkliftInventory):
         if not _storages:
             raise ValueError(f"Storages not found for provider {self.provider_type}")
 
-        for _vm_name in vms:
-            _vm = self.get_vm(name=_vm_name)
+        _storage_names = {_stg["id"]: _stg["name"] for _stg in reversed(_storages)}
+        _disk_paths = [
+            f"{self.provider_url_path}/disks/{_disk['id']}"
+            for _vm in self.get_vms(names=vms).values()
+            for _disk in _vm.get("diskAttachments", [])
+        ]
+        _disks = self._request_many(url_paths=_disk_paths)
 
-            for _disk in _vm.get("diskAttachments", []):
-                _disk_id = _disk["id"]
-                _disk_id_info = self._request(f"{self.provider_url_path}/disks/{_disk_id}")
-                _storage_id = _disk_id_info["storageDomain"]
-                if _storage_name_match := [_stg["name"] for _stg in _storages if _storage_id == _stg["id"]]:
-                    _mappings.append({"name": _storage_name_match[0]})
+        for _disk_path in _disk_paths:
+            if _storage_name := _storage_names.get(_disks[_disk_path]["storageDomain"]):
+                if {"name": _storage_name} not in _mappings:
+                    _mappings.append({"name": _storage_name})
 
         if not _mappings:
             raise ValueError(f"Storages not found for VMs {vms} on provider {self.provider_type}")
@@ -342,25 +787,26 @@ class OvirtForkliftInventory(ForkliftInventory):
 
     def vms_networks_mappings(self, vms: list[str], deduplicate: bool = True) -> list[dict[str, str]]:
         _mappings: list[dict[str, str]] = []
+        _vms = self.get_vms(names=vms)
+        nic_profiles = self._request(f"{self.provider_url_path}/nicprofiles")
+        _network_paths = {_net["id"]: _net["path"] for _net in reversed(self.networks)}
+
+        # One profile path per matching (NIC, profile) pair, in VM/NIC order
+        _profile_paths = [
+            _nic_profile["selfLink"].replace("providers/", "")
+            for _vm in _vms.values()
+            for _network in _vm.get("nics", [])
+            for _nic_profile in nic_profiles
+            if _nic_profile["id"] in _network["profile"]
+        ]
+        _profiles = self._request_many(url_paths=_profile_paths)
+
+        for _profile_path in _profile_paths:
+            if _network_path := _network_paths.get(_profiles[_profile_path]["network"]):
+                if deduplicate and [_map for _map in _mappings if _map.get("name") == _network_path]:
+                    continue
 
-        for _vm_name in vms:
-            _vm = self.get_vm(name=_vm_name)
-
-            nic_profiles = self._request(f"{self.provider_url_path}/nicprofiles")
-            for _network in _vm.get("nics", []):
-                _network_profile = _network["profile"]
-
-                for _nic_profile in nic_profiles:
-                    if _nic_profile["id"] in _network_profile:
-                        _selfLink = _nic_profile["selfLink"].replace("providers/", "")
-                        _network_id = self._request(url_path=_selfLink)["network"]
-                        if _network_name_match := [_net["path"] for _net in self.networks if _network_id == _net["id"]]:
-                            if deduplicate and [
-                                _map for _map in _mappings if _map.get("name") == _network_name_match[0]
-                            ]:
-                                continue
-
-                            _mappings.append({"name": _network_name_match[0]})
+                _mappings.append({"name": _network_path})
 
         if not _mappings:
             raise ValueError(f"Networks not found for vms {vms} on provider {self.provider_type}")
@@ -369,10 +815,14 @@ class OvirtForkliftInventory(ForkliftInventory):
 
 
 class OpenstackForliftinventory(ForkliftInventory):
-    def __init__(self, client: DynamicClient, provider_name: str, namespace: str) -> None:
+    def __init__(self, client: DynamicClient, provider_name: str, namespace: str, **kwargs: Any) -> None:
         self.provider_type = Provider.ProviderType.OPENSTACK
         super().__init__(
-            client=client, provider_name=provider_name, mtv_namespace=namespace, provider_type=self.provider_type
+            client=client,
+            provider_name=provider_name,
+            mtv_namespace=namespace,
+            provider_type=self.provider_type,
+            **kwargs,
         )
 
     @property
@@ -384,21 +834,20 @@ class OpenstackForliftinventory(ForkliftInventory):
         """Get storage mappings for OpenStack VMs based on volume types."""
         _mappings: list[dict[str, str]] = []
 
-        for _vm_name in vms:
-            _vm = self.get_vm(name=_vm_name)
-
-            # Get volumes attached to this VM
-            for attached_volume in _vm.get("attachedVolumes", []):
-                volume_id = attached_volume.get("ID")
-                if not volume_id:
-                    continue
+        # Volumes attached to the VMs, fetched together to find their volume types
+        _volume_paths = [
+            f"{self.provider_url_path}/volumes/{volume_id}"
+            for _vm in self.get_vms(names=vms).values()
+            for attached_volume in _vm.get("attachedVolumes", [])
+            if (volume_id := attached_volume.get("ID"))
+        ]
+        _volumes = self._request_many(url_paths=_volume_paths)
 
-                # Get volume details to find volume type
-                volume_info = self._request(url_path=f"{self.provider_url_path}/volumes/{volume_id}")
-                volume_type = volume_info.get("volumeType")
+        for _volume_path in _volume_paths:
+            volume_type = _volumes[_volume_path].get("volumeType")
 
-                if volume_type and not any(m.get("name") == volume_type for m in _mappings):
-                    _mappings.append({"name": volume_type})
+            if volume_type and not any(m.get("name") == volume_type for m in _mappings):
+                _mappings.append({"name": volume_type})
 
         if not _mappings:
             raise ValueError(f"No storage volumes found for VMs {vms} on provider {self.provider_type}")
@@ -407,24 +856,23 @@ class OpenstackForliftinventory(ForkliftInventory):
 
     def vms_networks_mappings(self, vms: list[str], deduplicate: bool = True) -> list[dict[str, str]]:
         _mappings: list[dict[str, str]] = []
+        _network_ids = {_net["name"]: _net["id"] for _net in reversed(self.networks)}
 
-        for _vm_name in vms:
-            _vm = self.get_vm(name=_vm_name)
-
+        for _vm_name, _vm in self.get_vms(names=vms).items():
             addresses = _vm.get("addresses", {})
             if not isinstance(addresses, dict):
                 raise TypeError(
                     f"Expected 'addresses' to be a mapping for VM '{_vm_name}', got {type(addresses).__name__}"
                 )
             for _name, _ports in addresses.items():
-                if _network_id_match := [_net["id"] for _net in self.networks if _name == _net["name"]]:
+                if _network_id := _network_ids.get(_name):
                     if deduplicate:
-                        if [_map for _map in _mappings if _map.get("id") == _network_id_match[0]]:
+                        if [_map for _map in _mappings if _map.get("id") == _network_id]:
                             continue
-                        _mappings.append({"id": _network_id_match[0], "name": _name})
+                        _mappings.append({"id": _network_id, "name": _name})
                     else:
                         for _ in _ports:
-                            _mappings.append({"id": _network_id_match[0], "name": _name})
+                            _mappings.append({"id": _network_id, "name": _name})
 
         if not _mappings:
             raise ValueError(f"Networks not found for vms {vms} on provider {self.provider_type}")
@@ -433,10 +881,14 @@ class OpenstackForliftinventory(ForkliftInventory):
 
 
 class VsphereForkliftInventory(ForkliftInventory):
-    def __init__(self, client: DynamicClient, provider_name: str, namespace: str) -> None:
+    def __init__(self, client: DynamicClient, provider_name: str, namespace: str, **kwargs: Any) -> None:
         self.provider_type = Provider.ProviderType.VSPHERE
         super().__init__(
-            client=client, provider_name=provider_name, mtv_namespace=namespace, provider_type=self.provider_type
+            client=client,
+            provider_name=provider_name,
+            mtv_namespace=namespace,
+            provider_type=self.provider_type,
+            **kwargs,
         )
 
     @property
@@ -452,6 +904,10 @@ class VsphereForkliftInventory(ForkliftInventory):
     def storages(self) -> list[dict[str, Any]]:
         return self._request(url_path=f"{self.provider_url_path}/datastores")
 
+    def _fresh_hosts(self) -> list[dict[str, Any]]:
+        self.invalidate_cache(url_path_prefix=f"{self.provider_url_path}/hosts")
+        return self.hosts
+
     def wait_for_hosts(self, timeout: int = 300, sleep: int = 10) -> list[dict[str, Any]]:
         """Wait for hosts to appear in the Forklift inventory.
 
@@ -471,10 +927,10 @@ class VsphereForkliftInventory(ForkliftInventory):
         LOGGER.info(f"Waiting for hosts to appear in Forklift inventory for provider '{self.provider_name}'...")
 
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=timeout,
                 sleep=sleep,
-                func=lambda: self.hosts,
+                func=self._fresh_hosts,
             ):
                 if sample:
                     LOGGER.info(f"Found {len(sample)} hosts in inventory for provider '{self.provider_name}'")
@@ -521,6 +977,7 @@ class VsphereForkliftInventory(ForkliftInventory):
                 list[dict[str, Any]]: Matching storage entries when all requested IDs are present.
                 None: If any requested IDs are still missing.
             """
+            self.invalidate_cache(url_path_prefix=f"{self.provider_url_path}/datastores")
             storages = self.storages
             found_ids = _extract_storage_ids(storages)
             if requested_ids - found_ids:
@@ -528,7 +985,7 @@ class VsphereForkliftInventory(ForkliftInventory):
             return [storage for storage in storages if storage.get("id") in requested_ids]
 
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=timeout,
                 sleep=sleep,
                 func=_check_datastores,
@@ -542,6 +999,7 @@ class VsphereForkliftInventory(ForkliftInventory):
         except TimeoutExpiredError:
             pass
 
+        self.invalidate_cache(url_path_prefix=f"{self.provider_url_path}/datastores")
         found_ids = _extract_storage_ids(self.storages)
         missing_ids = sorted(requested_ids - found_ids)
         raise TimeoutExpiredError(
@@ -556,12 +1014,13 @@ class VsphereForkliftInventory(ForkliftInventory):
         if not _storages:
             raise ValueError(f"Storages not found for provider {self.provider_type}")
 
-        for _vm_name in vms:
-            _vm = self.get_vm(name=_vm_name)
+        _storage_names = {_stg["id"]: _stg["name"] for _stg in reversed(_storages)}
+
+        for _vm in self.get_vms(names=vms).values():
             for _disk in _vm.get("disks", []):
-                if _storage_id := _disk.get("datastore", {}).get("id"):
-                    if _storage_name_match := [_stg["name"] for _stg in _storages if _storage_id == _stg["id"]]:
-                        _mappings.append({"name": _storage_name_match[0]})
+                if _storage_name := _storage_names.get(_disk.get("datastore", {}).get("id")):
+                    if {"name": _storage_name} not in _mappings:
+                        _mappings.append({"name": _storage_name})
 
         if not _mappings:
             raise ValueError(f"Storages not found for VMs {vms} on provider {self.provider_type}")
@@ -571,15 +1030,15 @@ class VsphereForkliftInventory(ForkliftInventory):
     def vms_networks_mappings(self, vms: list[str], deduplicate: bool = True) -> list[dict[str, str]]:
         _mappings: list[dict[str, str]] = []
 
-        for _vm_name in vms:
-            _vm = self.get_vm(name=_vm_name)
+        _network_names = {_net["id"]: _net["name"] for _net in reversed(self.networks)}
+
+        for _vm in self.get_vms(names=vms).values():
             for _nic in _vm.get("nics", []):
-                if _network_id := (_nic.get("network") or {}).get("id"):
-                    if _network_name_match := [_net["name"] for _net in self.networks if _network_id == _net["id"]]:
-                        if deduplicate and [_map for _map in _mappings if _map.get("name") == _network_name_match[0]]:
-                            continue
+                if _network_name := _network_names.get((_nic.get("network") or {}).get("id")):
+                    if deduplicate and [_map for _map in _mappings if _map.get("name") == _network_name]:
+                        continue
 
-                        _mappings.append({"name": _network_name_match[0]})
+                    _mappings.append({"name": _network_name})
 
         if not _mappings:
             raise ValueError(f"Networks not found for vms {vms} on provider {self.provider_type}")
@@ -588,10 +1047,14 @@ class VsphereForkliftInventory(ForkliftInventory):
 
 
 class OvaForkliftInventory(ForkliftInventory):
-    def __init__(self, client: DynamicClient, provider_name: str, namespace: str) -> None:
+    def __init__(self, client: DynamicClient, provider_name: str, namespace: str, **kwargs: Any) -> None:
         self.provider_type = Provider.ProviderType.OVA
         super().__init__(
-            client=client, provider_name=provider_name, mtv_namespace=namespace, provider_type=self.provider_type
+            client=client,
+            provider_name=provider_name,
+            mtv_namespace=namespace,
+            provider_type=self.provider_type,
+            **kwargs,
         )
 
     @property
@@ -617,16 +1080,15 @@ class OvaForkliftInventory(ForkliftInventory):
     def vms_networks_mappings(self, vms: list[str], deduplicate: bool = True) -> list[dict[str, str]]:
         _mappings: list[dict[str, str]] = []
 
-        for _vm_name in vms:
-            _vm = self.get_vm(name=_vm_name)
+        _network_names = {_net["id"]: _net["name"] for _net in reversed(self.networks)}
 
+        for _vm in self.get_vms(names=vms).values():
             for _network in _vm.get("networks", []):
-                if _network_id := _network.get("ID"):
-                    if _network_name_match := [_net["name"] for _net in self.networks if _network_id == _net["id"]]:
-                        if deduplicate and [_map for _map in _mappings if _map.get("name") == _network_name_match[0]]:
-                            continue
+                if _network_name := _network_names.get(_network.get("ID")):
+                    if deduplicate and [_map for _map in _mappings if _map.get("name") == _network_name]:
+                        continue
 
-                        _mappings.append({"name": _network_name_match[0]})
+                    _mappings.append({"name": _network_name})
 
         if not _mappings:
             raise ValueError(f"Networks not found for vms {vms} on provider {self.provider_type}")
@@ -635,10 +1097,14 @@ class OvaForkliftInventory(ForkliftInventory):
 
 
 class OpenshiftForkliftInventory(ForkliftInventory):
-    def __init__(self, client: DynamicClient, provider_name: str, namespace: str) -> None:
+    def __init__(self, client: DynamicClient, provider_name: str, namespace: str, **kwargs: Any) -> None:
         self.provider_type = Provider.ProviderType.OPENSHIFT
         super().__init__(
-            client=client, provider_name=provider_name, mtv_namespace=namespace, provider_type=self.provider_type
+            client=client,
+            provider_name=provider_name,
+            mtv_namespace=namespace,
+            provider_type=self.provider_type,
+            **kwargs,
         )
 
     @property
@@ -648,8 +1114,7 @@ class OpenshiftForkliftInventory(ForkliftInventory):
     def vms_storages_mappings(self, vms: list[str]) -> list[dict[str, str]]:
         _mappings: list[dict[str, str]] = []
 
-        for vm in vms:
-            _vm = self.get_vm(name=vm)
+        for _vm in self.get_vms(names=vms).values():
             _namespace = _vm["object"]["metadata"]["namespace"]
 
             for _volume in _vm["object"]["spec"]["template"]["spec"]["volumes"]:
@@ -672,9 +1137,7 @@ class OpenshiftForkliftInventory(ForkliftInventory):
     def vms_networks_mappings(self, vms: list[str], deduplicate: bool = True) -> list[dict[str, str]]:
         _mappings: list[dict[str, str]] = []
 
-        for vm in vms:
-            _vm = self.get_vm(name=vm)
-
+        for _vm in self.get_vms(names=vms).values():
             for _network in _vm["object"]["spec"]["template"]["spec"]["networks"]:
                 _network_map = None
 
@@ -0,0 +1,141 @@
+"""Record and replay Forklift inventory responses.
+
+A cassette is a gzip-compressed JSONL file holding one ``{"path": ..., "response": ...}``
+record per inventory request, in request order. Recording wraps the live transport of a
+real run; replaying serves the recorded responses through an injected transport, so the
+inventory helpers can be exercised against production-sized inventories without a cluster.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from libs.forklift_inventory import ForkliftInventory, InventoryTransport, get_inventory_class
+
+LOGGER = get_logger(__name__)
+
+
+def load_cassette(cassette_path: str | Path) -> dict[str, list[Any]]:
+    """Load a cassette into recorded responses per inventory path.
+
+    Args:
+        cassette_path (str | Path): Path to the gzip-compressed JSONL cassette.
+
+    Returns:
+        dict[str, list[Any]]: Mapping of inventory path to its responses, in recording order.
+    """
+    responses: dict[str, list[Any]] = {}
+    with gzip.open(cassette_path, "rt", encoding="utf-8") as fd:
+        for line in fd:
+            if line.strip():
+                record = json.loads(line)
+                responses.setdefault(record["path"], []).append(record["response"])
+
+    return responses
+
+
+class RecordingInventoryTransport(InventoryTransport):
+    """Transport that forwards to another transport and appends every response to a cassette."""
+
+    def __init__(self, transport: InventoryTransport, cassette_path: str | Path) -> None:
+        super().__init__()
+        self.transport = transport
+        self.cassette_path = Path(cassette_path)
+        self.cassette_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Append mode adds a gzip member per session; gzip readers concatenate members transparently
+        self._cassette = gzip.open(self.cassette_path, "at", encoding="utf-8")
+        LOGGER.info(f"Recording Forklift inventory responses to {self.cassette_path}")
+
+    def _fetch(self, url_path: str) -> Any:
+        response = self.transport.get(url_path=url_path)
+        record = json.dumps({"path": url_path, "response": response})
+        with self._lock:
+            self._cassette.write(f"{record}\n")
+
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            self._cassette.close()
+
+        self.transport.close()
+
+
+class ReplayInventoryTransport(InventoryTransport):
+    """Transport that serves responses from a cassette instead of the forklift-inventory route.
+
+    By default every path returns its last recorded response. With ``sequential=True`` the
+    responses of a path are served in recording order and the last one repeats, which
+    replays wait loops (e.g. a VM appearing after a few polls) as they happened.
+    """
+
+    def __init__(self, cassette_path: str | Path, sequential: bool = False) -> None:
+        super().__init__()
+        self.sequential = sequential
+        self._responses = load_cassette(cassette_path=cassette_path)
+        self._positions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _fetch(self, url_path: str) -> Any:
+        """Serve the recorded response of an inventory path.
+
+        Raises:
+            ValueError: If the path was not recorded in the cassette.
+        """
+        responses = self._responses.get(url_path)
+        if not responses:
+            raise ValueError(f"Inventory path '{url_path}' was not recorded in the cassette")
+
+        if not self.sequential:
+            return responses[-1]
+
+        with self._lock:
+            position = self._positions.get(url_path, 0)
+            self._positions[url_path] = min(position + 1, len(responses) - 1)
+
+        return responses[position]
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self._responses)
+
+
+def create_replay_inventory(
+    cassette_path: str | Path,
+    provider_type: str,
+    provider_name: str,
+    sequential: bool = False,
+    cache_ttl: int = 0,
+) -> ForkliftInventory:
+    """ForkliftInventory backed by a recorded cassette, usable without a cluster.
+
+    Helpers that talk to the cluster directly (e.g. OpenShift PVC lookups) are not replayable.
+
+    Args:
+        cassette_path (str | Path): Path to the gzip-compressed JSONL cassette.
+        provider_type (str): Provider type the cassette was recorded for, e.g. ``vsphere``.
+        provider_name (str): Provider CR name the cassette was recorded for.
+        sequential (bool): Serve each path's responses in recording order. Defaults to False.
+        cache_ttl (int): Response cache TTL in seconds. Defaults to 0 (disabled).
+
+    Returns:
+        ForkliftInventory: Inventory instance matching the provider type.
+
+    Raises:
+        ValueError: If the provider type is not supported.
+    """
+    provider_class = get_inventory_class(provider_type=provider_type)
+    return provider_class(  # type: ignore[call-arg]  # Subclasses use 'namespace' param; no cluster client when replaying
+        client=None,
+        namespace="",
+        provider_name=provider_name,
+        cache_ttl=cache_ttl,
+        transport=ReplayInventoryTransport(cassette_path=cassette_path, sequential=sequential),
+    )
@@ -6,19 +6,25 @@ from typing import TYPE_CHECKING, Any, Self
 
 import humanfriendly
 from kubernetes.client.exceptions import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from ocp_resources.datavolume import DataVolume
 from ocp_resources.persistent_volume_claim import PersistentVolumeClaim
 from ocp_resources.provider import Provider
-from ocp_resources.resource import NotFoundError, Resource
+from ocp_resources.resource import NamespacedResource, Resource
 from ocp_resources.virtual_machine import VirtualMachine
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from exceptions.exceptions import InvalidVMNameError
 from libs.base_provider import BaseProvider
 from utilities.naming import sanitize_kubernetes_name
 from utilities.ssh_utils import VMSSHConnection, create_vm_ssh_connection
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
+    from kubernetes.dynamic import DynamicClient
+
     from libs.forklift_inventory import ForkliftInventory
 
 LOGGER = get_logger(__name__)
@@ -57,7 +63,7 @@ class OCPProvider(BaseProvider):
 
         vmi = vm_resource.vmi
         self.log.info(f"Wait until guest agent is active on {vmi.name}")
-        sampler = TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: vmi.instance)
+        sampler = BackoffSampler(wait_timeout=timeout, sleep=5, func=lambda: vmi.instance)
         try:
             for sample in sampler:
                 status = sample.get("status", {})
@@ -138,74 +144,213 @@ class OCPProvider(BaseProvider):
                 or secureBoot is missing from an EFI VM's firmware config.
             InvalidVMNameError: If destination VM name fails Kubernetes validation.
         """
-        if not self.ocp_resource:
-            raise ValueError("Missing `ocp_resource`")
-
-        dynamic_client = self.ocp_resource.client
-        _source = kwargs.get("source", False)
-
-        cnv_vm_name = f"{kwargs['name']}{kwargs.get('vm_name_suffix', '')}"
+        return self.vm_dicts(
+            names=[kwargs.pop("name")],
+            wait_for_guest_agent=wait_for_guest_agent,
+            guest_agent_timeout=guest_agent_timeout,
+            **kwargs,
+        )[0]
 
+    @staticmethod
+    def _cnv_vm_name(name: str, namespace: str, source: bool) -> str:
         # For destination VMs, sanitize the name to match Kubernetes naming conventions
         # The MTV operator converts source VM names (which may have capitals and underscores)
         # to valid Kubernetes resource names (lowercase, hyphens instead of underscores)
-        original_name = cnv_vm_name
-        if not _source:
-            try:
-                cnv_vm_name = sanitize_kubernetes_name(cnv_vm_name)
-            except InvalidVMNameError:
-                LOGGER.error(
-                    f"Failed to sanitize VM name for Kubernetes lookup. original_name='{original_name}', namespace='{kwargs.get('namespace')}'"
-                )
-                raise
+        if source:
+            return name
 
-            if original_name != cnv_vm_name:
-                LOGGER.info(
-                    "Sanitized VM name for Kubernetes lookup: '%s' -> '%s'",
-                    original_name,
-                    cnv_vm_name,
-                )
-        cnv_vm_namespace = kwargs["namespace"]
+        try:
+            cnv_vm_name = sanitize_kubernetes_name(name)
+        except InvalidVMNameError:
+            LOGGER.error(
+                f"Failed to sanitize VM name for Kubernetes lookup. original_name='{name}', namespace='{namespace}'"
+            )
+            raise
+
+        if name != cnv_vm_name:
+            LOGGER.info(
+                "Sanitized VM name for Kubernetes lookup: '%s' -> '%s'",
+                name,
+                cnv_vm_name,
+            )
 
-        result_vm_info = copy.deepcopy(self.VIRTUAL_MACHINE_TEMPLATE)
-        result_vm_info["provider_type"] = Resource.ProviderType.OPENSHIFT
-        result_vm_info["name"] = cnv_vm_name
+        return cnv_vm_name
 
-        cnv_vm = VirtualMachine(
-            client=dynamic_client,
-            name=cnv_vm_name,
-            namespace=cnv_vm_namespace,
-            ensure_exists=True,
-        )
+    def vm_dicts(
+        self,
+        names: list[str],
+        *,
+        wait_for_guest_agent: bool = False,
+        guest_agent_timeout: int = 301,
+        label_selector: str | None = None,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Create the vm_dict of several VMs of one namespace, served from one OCPVmBundle.
+
+        The VMs, VMIs, PVCs and DataVolumes of the namespace are listed once instead of fetched per
+        VM and disk, and the VMs are waited for, started and checked together.
 
-        result_vm_info["provider_vm_api"] = cnv_vm
-        result_vm_info["id"] = cnv_vm.instance.metadata.uid
+        Args:
+            names (list[str]): VM names, vm_name_suffix is appended to every name.
+            wait_for_guest_agent (bool): Whether to wait for the guest agents to be ready.
+            guest_agent_timeout (int): Timeout in seconds to wait for each guest agent.
+            label_selector (str | None): Label selector of the bundle LISTs, None lists the whole namespace.
+            **kwargs: Additional arguments (e.g., namespace, source, vm_name_suffix).
 
-        # Wait for VM to reach stable state before recording power state
+        Returns:
+            list[dict[str, Any]]: VM information dictionaries, in the order of names.
+
+        Raises:
+            ValueError: If `ocp_resource` is not set, a VM fails to start,
+                or secureBoot is missing from an EFI VM's firmware config.
+            InvalidVMNameError: If a destination VM name fails Kubernetes validation.
+            ResourceNotFoundError: If a VM does not exist.
+        """
+        if not self.ocp_resource:
+            raise ValueError("Missing `ocp_resource`")
+
+        dynamic_client = self.ocp_resource.client
+        _source = kwargs.get("source", False)
+        cnv_vm_namespace = kwargs["namespace"]
+        cnv_vm_names = [
+            self._cnv_vm_name(
+                name=f"{name}{kwargs.get('vm_name_suffix', '')}", namespace=cnv_vm_namespace, source=_source
+            )
+            for name in names
+        ]
+
+        bundle = OCPVmBundle(client=dynamic_client, namespace=cnv_vm_namespace, label_selector=label_selector)
+        missing_vms = [name for name in cnv_vm_names if name not in bundle.vms]
+        if missing_vms:
+            raise ResourceNotFoundError(
+                f"Resource `VirtualMachine` `{cnv_vm_namespace}/{missing_vms[0]}` does not exist"
+            )
+
+        # Wait for VMs to reach stable state before recording power state
         # Transitional states (Starting, Stopping, Provisioning, Migrating) would cause incorrect state recording
-        STABLE_STATES = (cnv_vm.Status.RUNNING, cnv_vm.Status.STOPPED)
+        STABLE_STATES = (VirtualMachine.Status.RUNNING, VirtualMachine.Status.STOPPED)
+
+        def _unstable_vms() -> list[str]:
+            return [name for name in cnv_vm_names if bundle.vms[name].status.printableStatus not in STABLE_STATES]
+
+        def _vms_stable() -> bool:
+            if _unstable_vms():
+                bundle.refresh(vms_only=True)
+
+            return not _unstable_vms()
 
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=120,
                 sleep=2,
-                func=lambda: cnv_vm.instance.status.printableStatus in STABLE_STATES,
+                func=_vms_stable,
             ):
                 if sample:
                     break
         except TimeoutExpiredError:
-            LOGGER.warning(
-                f"VM {cnv_vm_name} did not reach stable state within 120s. "
-                f"Current state: {cnv_vm.instance.status.printableStatus}"
+            for name in _unstable_vms():
+                LOGGER.warning(
+                    f"VM {name} did not reach stable state within 120s. "
+                    f"Current state: {bundle.vms[name].status.printableStatus}"
+                )
+
+        vm_infos: list[dict[str, Any]] = []
+        for cnv_vm_name in cnv_vm_names:
+            vm_instance = bundle.vms[cnv_vm_name]
+            result_vm_info = copy.deepcopy(self.VIRTUAL_MACHINE_TEMPLATE)
+            result_vm_info["provider_type"] = Resource.ProviderType.OPENSHIFT
+            result_vm_info["name"] = cnv_vm_name
+            result_vm_info["provider_vm_api"] = VirtualMachine(
+                client=dynamic_client, name=cnv_vm_name, namespace=cnv_vm_namespace
             )
+            result_vm_info["id"] = vm_instance.metadata.uid
 
-        # Power state
-        result_vm_info["power_state"] = (
-            "on" if cnv_vm.instance.status.printableStatus == cnv_vm.Status.RUNNING else "off"
-        )
+            # Power state
+            result_vm_info["power_state"] = (
+                "on" if vm_instance.status.printableStatus == VirtualMachine.Status.RUNNING else "off"
+            )
+            self._set_template_details(result_vm_info=result_vm_info, vm_instance=vm_instance)
+            vm_infos.append(result_vm_info)
+
+        stopped_vms = [vm_info for vm_info in vm_infos if vm_info["power_state"] == "off"]
+        for vm_info in stopped_vms:
+            self.start_vm(vm_info["provider_vm_api"])
+
+        if stopped_vms:
+            # The started VMs have new statuses and VMIs
+            bundle.refresh()
+
+        for vm_info in vm_infos:
+            vm_status = bundle.vms[vm_info["name"]].status
+            printable_status = vm_status.printableStatus
+            if printable_status != VirtualMachine.Status.RUNNING:
+                conditions: list[dict[str, Any]] = vm_status.get("conditions", [])
+                condition_details = "; ".join(
+                    f"{c['type']}: {c.get('reason', '')} - {c.get('message', '')}" for c in conditions
+                )
+                raise ValueError(
+                    f"VM '{vm_info['name']}' in namespace '{cnv_vm_namespace}' failed to start. "
+                    f"Status: '{printable_status}'. Conditions: {condition_details}"
+                )
+
+        for vm_info in vm_infos:
+            # True guest agent is reporting all ok
+            vm_info["guest_agent_running"] = (
+                self.wait_for_cnv_vm_guest_agent(vm_dict=vm_info, timeout=guest_agent_timeout)
+                if wait_for_guest_agent
+                else False
+            )
+
+        # Interface names and guest IPs are reported by the guest agent, list the VMIs after it is up
+        if _source:
+            # Source VM IPs are not read
+            bundle.refresh()
+        else:
+            self._wait_for_vmi_interfaces(bundle=bundle, names=cnv_vm_names)
+
+        for vm_info in vm_infos:
+            self._set_vmi_details(result_vm_info=vm_info, bundle=bundle, source=_source)
+
+            if vm_info["power_state"] == "off":
+                self.log.info("Restoring VM Power State (turning off)")
+                self.stop_vm(vm_info["provider_vm_api"])
+
+            vm_info["snapshots_data"] = None
+
+        return vm_infos
+
+    @staticmethod
+    def _wait_for_vmi_interfaces(bundle: OCPVmBundle, names: list[str], timeout: int = 150) -> None:
+        """Refresh the bundle until the VMIs of names report their network interfaces.
+
+        Args:
+            bundle (OCPVmBundle): The bundle of the VMs.
+            names (list[str]): Names of the running VMs.
+            timeout (int): Timeout in seconds to wait for the interfaces.
+        """
+
+        def _without_interfaces() -> list[str]:
+            return [name for name in names if name not in bundle.vmis or not bundle.vmis[name].status.get("interfaces")]
+
+        def _interfaces_reported() -> bool:
+            bundle.refresh()
+            return not _without_interfaces()
+
+        try:
+            for sample in BackoffSampler(wait_timeout=timeout, sleep=5, func=_interfaces_reported):
+                if sample:
+                    return
+        except TimeoutExpiredError:
+            LOGGER.warning(f"VMIs {_without_interfaces()} did not report network interfaces within {timeout}s")
+
+    @staticmethod
+    def _set_template_details(result_vm_info: dict[str, Any], vm_instance: Any) -> None:
+        """Serial, firmware, labels and affinity of a VM, from its spec."""
+        cnv_vm_name = result_vm_info["name"]
 
         # Serial number (from firmware) - for serial preservation verification
-        domain: dict[str, Any] = cnv_vm.instance.spec.template.spec.domain
+        domain: dict[str, Any] = vm_instance.spec.template.spec.domain
 
         firmware_spec: dict[str, Any] | None = domain.get("firmware")
         result_vm_info["serial"] = firmware_spec.get("serial") if firmware_spec else None
@@ -233,7 +378,7 @@ class OCPProvider(BaseProvider):
         result_vm_info["firmware"] = firmware_info
 
         # Extract template once to avoid duplicate attribute access
-        template = cnv_vm.instance.spec.template
+        template = vm_instance.spec.template
 
         # VM labels - from template.metadata.labels (VMI template)
         template_metadata: dict[str, Any] = template.metadata if template else {}
@@ -243,37 +388,27 @@ class OCPProvider(BaseProvider):
         template_spec: dict[str, Any] = template.spec if template else {}
         result_vm_info["affinity"] = template_spec.get("affinity", {})
 
-        self.start_vm(cnv_vm)
+        # CPU features are read from the VM template spec (not VMI) because features are configured at template level.
+        template_cpu: dict[str, Any] = domain.get("cpu", {})
+        result_vm_info["cpu"]["features"] = list(template_cpu.get("features", []))
 
-        printable_status = cnv_vm.instance.status.printableStatus
-        if printable_status != cnv_vm.Status.RUNNING:
-            conditions: list[dict[str, Any]] = cnv_vm.instance.status.get("conditions", [])
-            condition_details = "; ".join(
-                f"{c['type']}: {c.get('reason', '')} - {c.get('message', '')}" for c in conditions
-            )
-            raise ValueError(
-                f"VM '{cnv_vm_name}' in namespace '{cnv_vm_namespace}' failed to start. "
-                f"Status: '{printable_status}'. Conditions: {condition_details}"
-            )
-
-        # True guest agent is reporting all ok
-        result_vm_info["guest_agent_running"] = (
-            self.wait_for_cnv_vm_guest_agent(vm_dict=result_vm_info, timeout=guest_agent_timeout)
-            if wait_for_guest_agent
-            else False
-        )
+    def _set_vmi_details(self, result_vm_info: dict[str, Any], bundle: OCPVmBundle, source: bool) -> None:
+        """Node, network interfaces, disks, CPU and memory of a running VM, from its VMI and PVCs."""
+        cnv_vm_name = result_vm_info["name"]
+        cnv_vm = result_vm_info["provider_vm_api"]
+        vmi = bundle.vmis.get(cnv_vm_name)
+        if vmi is None:
+            # Listed before the VMI existed
+            vmi = cnv_vm.vmi.instance
 
         # Node name - where the VM is scheduled (collected after VM start)
-        try:
-            result_vm_info["node_name"] = cnv_vm.vmi.instance.status.nodeName
-        except (AttributeError, NotFoundError):
+        result_vm_info["node_name"] = vmi.status.get("nodeName")
+        if not result_vm_info["node_name"]:
             LOGGER.debug("Could not retrieve node name for VM %s", cnv_vm_name)
-            result_vm_info["node_name"] = None
 
-        for interface in cnv_vm.vmi.interfaces:
-            matching_networks = [
-                network for network in cnv_vm.vmi.instance.spec.networks if network.name == interface.name
-            ]
+        vmi_interfaces: list[Any] = vmi.status.get("interfaces") or []
+        for interface in vmi_interfaces:
+            matching_networks = [network for network in vmi.spec.networks if network.name == interface.name]
 
             if not matching_networks:
                 LOGGER.debug(
@@ -286,14 +421,16 @@ class OCPProvider(BaseProvider):
             result_vm_info["network_interfaces"].append({
                 "name": interface.name,
                 "macAddress": mac_addr,
-                "ip": self.get_ip_by_mac_address(mac_address=mac_addr, vm=cnv_vm) if not _source else "",
+                "ip": interface.get("ipAddress") or self.get_ip_by_mac_address(mac_address=mac_addr, vm=cnv_vm)
+                if not source
+                else "",
                 "network": "pod" if network.get("pod", False) else network["multus"]["networkName"].split("/")[1],
                 "guest_interface_name": interface.get("interfaceName") or "",
             })
 
         disk_idx = 0
-        for pvc in cnv_vm.vmi.instance.spec.volumes:
-            if not _source:
+        for pvc in vmi.spec.volumes:
+            if not source:
                 name = pvc.persistentVolumeClaim.claimName
             else:
                 if pvc.name in ("cloudinitdisk", "cloudInitNoCloud", "cloudinit"):
@@ -301,48 +438,31 @@ class OCPProvider(BaseProvider):
 
                 name = pvc.dataVolume.name
 
-            _pvc = PersistentVolumeClaim(
-                namespace=cnv_vm.namespace,
-                name=name,
-                client=dynamic_client,
-            )
+            _pvc = bundle.pvc(name=name)
             result_vm_info["disks"].append({
-                "name": _pvc.name,
-                "size_in_kb": int(
-                    humanfriendly.parse_size(_pvc.instance.spec.resources.requests.storage, binary=True) / 1024
-                ),
+                "name": _pvc.metadata.name,
+                "size_in_kb": int(humanfriendly.parse_size(_pvc.spec.resources.requests.storage, binary=True) / 1024),
                 "storage": {
-                    "name": _pvc.instance.spec.storageClassName,
-                    "access_mode": _pvc.instance.spec.accessModes,
+                    "name": _pvc.spec.storageClassName,
+                    "access_mode": _pvc.spec.accessModes,
                 },
-                "device_key": _pvc.name,  # PVC name as unique identifier
+                "device_key": _pvc.metadata.name,  # PVC name as unique identifier
                 "unit_number": disk_idx,  # Order in volumes list (excluding cloud-init)
             })
             disk_idx += 1
 
-        result_vm_info["cpu"]["num_cores"] = cnv_vm.vmi.instance.spec.domain.cpu.cores
-        result_vm_info["cpu"]["num_sockets"] = cnv_vm.vmi.instance.spec.domain.cpu.sockets
-        # CPU features are read from the VM template spec (not VMI) because features are configured at template level.
-        template_cpu: dict[str, Any] = cnv_vm.instance.spec.template.spec.domain.get("cpu", {})
-        result_vm_info["cpu"]["features"] = list(template_cpu.get("features", []))
+        result_vm_info["cpu"]["num_cores"] = vmi.spec.domain.cpu.cores
+        result_vm_info["cpu"]["num_sockets"] = vmi.spec.domain.cpu.sockets
 
         result_vm_info["memory_in_mb"] = int(
             humanfriendly.parse_size(
-                cnv_vm.vmi.instance.spec.domain.memory.guest,
+                vmi.spec.domain.memory.guest,
                 binary=True,
             )
             / 1024
             / 1024
         )
 
-        if result_vm_info["power_state"] == "off":
-            self.log.info("Restoring VM Power State (turning off)")
-            self.stop_vm(cnv_vm)
-
-        result_vm_info["snapshots_data"] = None
-
-        return result_vm_info
-
     def clone_vm(self, source_vm_name: str, clone_vm_name: str, session_uuid: str, **kwargs: Any) -> Any:
         return
 
@@ -414,3 +534,70 @@ class OCPProvider(BaseProvider):
             ocp_insecure=ocp_insecure,
             **kwargs,
         )
+
+
+class OCPVmBundle:
+    """VMs, VMIs, PVCs and DataVolumes of one namespace, fetched with one LIST per kind.
+
+    Items are raw resource instances, the same objects ``Resource.instance`` returns.
+
+    Args:
+        client (DynamicClient): The cluster client.
+        namespace (str): The namespace to list.
+        label_selector (str | None): Label selector of every LIST, None lists the whole namespace.
+    """
+
+    def __init__(self, client: DynamicClient, namespace: str, label_selector: str | None = None) -> None:
+        self.client = client
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.vms: dict[str, Any] = {}
+        self.vmis: dict[str, Any] = {}
+        self.pvcs: dict[str, Any] = {}
+        self.data_volumes: dict[str, Any] = {}
+        # PVCs by owner (kind, name), e.g. the PVC of a DataVolume
+        self.pvcs_by_owner: dict[tuple[str, str], list[Any]] = {}
+        self.refresh()
+
+    def _list(self, resource: type[NamespacedResource]) -> dict[str, Any]:
+        return {
+            item.metadata.name: item
+            for item in resource.get(
+                client=self.client, namespace=self.namespace, label_selector=self.label_selector, raw=True
+            )
+        }
+
+    def refresh(self, vms_only: bool = False) -> None:
+        """List the resources again.
+
+        Args:
+            vms_only (bool): Only list the VirtualMachines, e.g. while waiting for their status.
+        """
+        self.vms = self._list(resource=VirtualMachine)
+        if vms_only:
+            return
+
+        self.vmis = self._list(resource=VirtualMachineInstance)
+        self.pvcs = self._list(resource=PersistentVolumeClaim)
+        self.data_volumes = self._list(resource=DataVolume)
+        self.pvcs_by_owner = {}
+        for pvc in self.pvcs.values():
+            for owner in pvc.metadata.get("ownerReferences") or []:
+                self.pvcs_by_owner.setdefault((owner["kind"], owner["name"]), []).append(pvc)
+
+    def pvc(self, name: str) -> Any:
+        """A PVC by its name or by the DataVolume owning it, fetched when the bundle does not have it.
+
+        Args:
+            name (str): PVC or DataVolume name.
+
+        Returns:
+            Any: The raw PVC instance.
+        """
+        if name in self.pvcs:
+            return self.pvcs[name]
+
+        if owned := self.pvcs_by_owner.get((DataVolume.kind, name)):
+            return owned[0]
+
+        return PersistentVolumeClaim(client=self.client, name=name, namespace=self.namespace).instance
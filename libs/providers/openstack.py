@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import copy
+import threading
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Self
 
 from ocp_resources.provider import Provider
 from openstack import exceptions as os_exc
 from openstack.compute.v2.server import Server as OSP_Server
 from openstack.connection import Connection
-from openstack.image.v2.image import Image as OSP_Image
 from simple_logger.logger import get_logger
 
 from exceptions.exceptions import VmNotFoundError
@@ -20,11 +21,25 @@ if TYPE_CHECKING:
 LOGGER = get_logger(__name__)
 
 
+@dataclass
+class OpenStackSourceVm:
+    """Clone source metadata, resolved once per session by OpenStackProvider._source_vm."""
+
+    server: OSP_Server
+    flavor: Any
+    # Attached volumes in attachment order
+    volumes: list[Any]
+    networks: list[dict[str, Any]]
+
+
 class OpenStackProvider(BaseProvider):
     """
     https://docs.openstack.org/openstacksdk/latest/user/guides/compute.html
     """
 
+    # The openstacksdk Connection is not shared safely across threads, deletions run one at a time like clones
+    DELETE_CONCURRENCY = 1
+
     def __init__(
         self,
         host: str,
@@ -55,6 +70,9 @@ class OpenStackProvider(BaseProvider):
         self.region_name = region_name
         self.user_domain_id = user_domain_id
         self.project_domain_id = project_domain_id
+        # Clone sources by name, cloning one source again does not repeat the discovery
+        self._source_vms: dict[str, OpenStackSourceVm] = {}
+        self._source_vms_lock = threading.Lock()
 
     def disconnect(self) -> None:
         LOGGER.info(f"Disconnecting OpenStackProvider source provider {self.host}")
@@ -138,14 +156,16 @@ class OpenStackProvider(BaseProvider):
             return [port for port in self.api.network.ports(device_id=instance_id)]
         return []
 
-    def vm_networks_details(self, vm_name: str) -> list[dict[str, Any]]:
-        instance_id = self.get_instance_id_by_name(name_filter=vm_name)
-        vm_networks_details = [
+    def _server_networks(self, server_id: str) -> list[dict[str, Any]]:
+        return [
             {"net_name": network.name, "net_id": network.id}
-            for port in self.api.network.ports(device_id=instance_id)
+            for port in self.api.network.ports(device_id=server_id)
             if (network := self.api.network.get_network(port.network_id))
         ]
-        return vm_networks_details
+
+    def vm_networks_details(self, vm_name: str) -> list[dict[str, Any]]:
+        instance_id = self.get_instance_id_by_name(name_filter=vm_name)
+        return self._server_networks(server_id=instance_id)
 
     def list_volumes(self, vm_name: str) -> list[Any]:
         instance_obj = self.get_instance_obj(name_filter=vm_name)
@@ -158,8 +178,11 @@ class OpenStackProvider(BaseProvider):
             LOGGER.warning(f"Instance {vm_name} not found.")
             return None
 
+        return self._server_flavor(server=instance_obj)
+
+    def _server_flavor(self, server: OSP_Server) -> Any:
         return next(
-            (flavor for flavor in self.api.compute.flavors() if flavor.name == instance_obj.flavor.original_name), None
+            (flavor for flavor in self.api.compute.flavors() if flavor.name == server.flavor.original_name), None
         )
 
     def get_volume_metadata(self, vm_name: str) -> Any:
@@ -285,6 +308,46 @@ class OpenStackProvider(BaseProvider):
 
         return result_vm_info
 
+    def _source_vm(self, vm_name: str) -> OpenStackSourceVm:
+        """Resolve the flavor, volumes and networks of a clone source, once per provider session.
+
+        Args:
+            vm_name: Name of the source VM.
+
+        Returns:
+            OpenStackSourceVm: The source VM metadata.
+
+        Raises:
+            VmNotFoundError: If the source VM does not exist.
+            ValueError: If the flavor or a network of the source VM can not be found.
+        """
+        with self._source_vms_lock:
+            if vm_name in self._source_vms:
+                return self._source_vms[vm_name]
+
+        server = self.get_instance_obj(name_filter=vm_name)
+        if not server:
+            raise VmNotFoundError(f"Source VM '{vm_name}' not found.")
+
+        # Get the flavor object to retrieve the actual UUID (not the string name)
+        flavor = self._server_flavor(server=server)
+        if not flavor:
+            raise ValueError(f"Could not find flavor for source VM '{vm_name}'.")
+
+        networks = self._server_networks(server_id=server.id)
+        if not networks:
+            raise ValueError(f"Could not find a network for source VM '{vm_name}'.")
+
+        # Sort by device path to preserve attachment order. Fall back to volume ID if device is missing.
+        # Device paths like /dev/vda, /dev/vdb naturally sort in attachment order.
+        volumes = sorted(
+            self._get_attached_volumes(server=server),
+            key=lambda v: next((a.get("device") for a in v.attachments if a.get("device")), v.id),
+        )
+        source = OpenStackSourceVm(server=server, flavor=flavor, volumes=volumes, networks=networks)
+        with self._source_vms_lock:
+            return self._source_vms.setdefault(vm_name, source)
+
     def clone_vm(
         self,
         source_vm_name: str,
@@ -296,6 +359,9 @@ class OpenStackProvider(BaseProvider):
         """
         Clones a VM, always reusing the flavor and network from the source.
 
+        The source is resolved once per session. Every attached volume is snapshotted and every
+        clone volume is created concurrently, the requests are submitted before waiting for any.
+
         Args:
             source_vm_name: The name of the VM to clone.
             clone_vm_name: The name for the new cloned VM.
@@ -307,83 +373,47 @@ class OpenStackProvider(BaseProvider):
         """
         clone_vm_name = self._generate_clone_vm_name(session_uuid=session_uuid, base_name=clone_vm_name)
         LOGGER.info(f"Starting clone of '{source_vm_name}' to '{clone_vm_name}'")
-        source_vm = self.get_instance_obj(name_filter=source_vm_name)
-        if not source_vm:
-            raise VmNotFoundError(f"Source VM '{source_vm_name}' not found.")
-
-        # Get the flavor object to retrieve the actual UUID (not the string name)
-        flavor_obj = self.get_flavor_obj(vm_name=source_vm_name)
-        if not flavor_obj:
-            raise ValueError(f"Could not find flavor for source VM '{source_vm_name}'.")
-        flavor_id: str = flavor_obj.id
-
-        source_volumes = self._get_attached_volumes(server=source_vm)
+        source = self._source_vm(vm_name=source_vm_name)
+        flavor_id: str = source.flavor.id
 
-        bootable_volumes = [vol for vol in source_volumes if vol.is_bootable]
+        bootable_volumes = [vol for vol in source.volumes if vol.is_bootable]
         if len(bootable_volumes) == 1:
             boot_volume_size = bootable_volumes[0].size
-        elif source_vm.image:
-            boot_volume_size = flavor_obj.disk
+        elif source.server.image:
+            boot_volume_size = source.flavor.disk
         else:
             raise ValueError(f"Could not determine boot volume size for '{source_vm_name}'.")
 
-        networks: list[dict[str, Any]] = self.vm_networks_details(vm_name=source_vm_name)
-
-        if not networks:
-            raise ValueError(f"Could not find a network for source VM '{source_vm_name}'.")
-
-        network_id: str = networks[0]["net_id"]
-        LOGGER.info(f"Using source flavor '{flavor_obj.name}' (ID: {flavor_id}) and network '{network_id}'")
+        if not source.volumes:
+            raise ValueError(f"No volumes attached to source VM '{source_vm_name}'.")
 
-        snapshot: OSP_Image | None = None
-        snapshot_name = f"{clone_vm_name}-snapshot"
+        network_id: str = source.networks[0]["net_id"]
+        LOGGER.info(f"Using source flavor '{source.flavor.name}' (ID: {flavor_id}) and network '{network_id}'")
 
+        boot_volume = bootable_volumes[0] if bootable_volumes else None
+        volume_snapshots: list[Any] = []
         created_volume_ids: list[str] = []
         server_created = False
 
         try:
-            LOGGER.info(f"Creating snapshot '{snapshot_name}'...")
-            snapshot = self.api.compute.create_server_image(server=source_vm.id, name=snapshot_name, wait=True)
-
-            # Get all volume snapshots created by create_server_image()
-            volume_snapshot_name = f"snapshot for {snapshot_name}"
-            volume_snapshots = list(self.api.block_storage.snapshots(name=volume_snapshot_name))
-
-            if not volume_snapshots:
-                raise ValueError(f"No volume snapshots found for '{volume_snapshot_name}'.")
-
-            LOGGER.info(f"Found {len(volume_snapshots)} volume snapshot(s) for cloning")
-
-            # Sort by device path to preserve attachment order. Fall back to volume ID if device is missing.
-            # Device paths like /dev/vda, /dev/vdb naturally sort in attachment order.
-            source_volumes_sorted = sorted(
-                source_volumes, key=lambda v: next((a.get("device") for a in v.attachments if a.get("device")), v.id)
-            )
-
-            if len(source_volumes) != len(volume_snapshots):
-                raise ValueError(
-                    f"Volume count mismatch for '{source_vm_name}': "
-                    f"source VM has {len(source_volumes)} volumes but "
-                    f"{len(volume_snapshots)} snapshots were created. "
-                    f"Source volumes: {[v.id for v in source_volumes]}, "
-                    f"Snapshots: {[s.id for s in volume_snapshots]}"
+            # Snapshots of in-use volumes have to be forced
+            LOGGER.info(f"Creating {len(source.volumes)} volume snapshot(s) of '{source_vm_name}'...")
+            for idx, source_vol in enumerate(source.volumes):
+                volume_snapshots.append(
+                    self.api.block_storage.create_snapshot(
+                        volume_id=source_vol.id, name=f"{clone_vm_name}-snapshot-{idx}", is_forced=True
+                    )
                 )
 
-            snapshot_by_volume_id = {snap.volume_id: snap for snap in volume_snapshots}
-
-            boot_volume = next((vol for vol in source_volumes_sorted if vol.is_bootable), None)
+            volume_snapshots = [
+                self.api.block_storage.wait_for_status(snap, status="available", failures=["error"], wait=600)
+                for snap in volume_snapshots
+            ]
 
             bdm = []
             next_data_boot_index = 1
-
-            for idx, source_vol in enumerate(source_volumes_sorted):
-                vol_snapshot = snapshot_by_volume_id.get(source_vol.id)
-                if not vol_snapshot:
-                    raise ValueError(
-                        f"No snapshot found for source volume '{source_vol.name}' (ID: {source_vol.id}). "
-                        f"Available snapshots: {[s.id for s in volume_snapshots]}"
-                    )
-
+            new_volumes = []
+            for idx, (source_vol, vol_snapshot) in enumerate(zip(source.volumes, volume_snapshots, strict=True)):
                 is_boot = source_vol.id == boot_volume.id if boot_volume else idx == 0
                 volume_size = boot_volume_size if is_boot else source_vol.size
                 volume_name_suffix = "boot-vol" if is_boot else f"data-vol-{idx}"
@@ -399,10 +429,8 @@ class OpenStackProvider(BaseProvider):
                     snapshot_id=vol_snapshot.id,
                     size=volume_size,
                 )
-                new_volume = self.api.block_storage.wait_for_status(
-                    new_volume, status="available", failures=["error"], wait=300
-                )
                 created_volume_ids.append(new_volume.id)
+                new_volumes.append(new_volume)
 
                 bdm.append({
                     "uuid": new_volume.id,
@@ -415,6 +443,9 @@ class OpenStackProvider(BaseProvider):
                 if not is_boot:
                     next_data_boot_index += 1
 
+            for new_volume in new_volumes:
+                self.api.block_storage.wait_for_status(new_volume, status="available", failures=["error"], wait=300)
+
             # Validate exactly one boot volume exists
             if sum(1 for item in bdm if item["boot_index"] == 0) != 1:
                 raise ValueError(f"Expected exactly 1 boot volume for '{clone_vm_name}'")
@@ -455,24 +486,13 @@ class OpenStackProvider(BaseProvider):
                 for vol_id in created_volume_ids:
                     self.api.block_storage.delete_volume(vol_id, ignore_missing=True)
 
-            # Clean up Glance image snapshot if it exists
-            if snapshot:
-                LOGGER.info(f"Cleaning up Glance image snapshot '{snapshot.name}'...")
-                self.api.image.delete_image(snapshot.id, ignore_missing=True)
-
-                # Track volume snapshot for session cleanup - OpenStack prepends "snapshot for " to the name
-                volume_snapshot_name = f"snapshot for {snapshot_name}"
-                # Find all volume snapshots for cleanup. OpenStack may create multiple volume snapshots
-                # with the same name when snapshotting VMs with multiple attached volumes.
-                matching_snapshots = list(self.api.block_storage.snapshots(name=volume_snapshot_name))
-
-                # Track all matching snapshots for cleanup
-                if matching_snapshots and self.fixture_store:
-                    for snap in matching_snapshots:
-                        self.fixture_store["teardown"].setdefault("VolumeSnapshot", []).append({
-                            "id": snap.id,
-                            "name": snap.name,
-                        })
+            # Track volume snapshots for session cleanup, the clone volumes may still depend on them
+            if self.fixture_store:
+                for snap in volume_snapshots:
+                    self.fixture_store["teardown"].setdefault("VolumeSnapshot", []).append({
+                        "id": snap.id,
+                        "name": snap.name,
+                    })
 
     def delete_vm(self, vm_name: str) -> None:
         """
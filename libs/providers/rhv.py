@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import copy
 import os
+import uuid
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Self
 
 import ovirtsdk4
@@ -11,23 +13,52 @@ from ocp_resources.resource import Resource
 from ovirtsdk4 import NotFoundError, types
 from ovirtsdk4.types import VmStatus
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
-
-from exceptions.exceptions import OvirtMTVDatacenterNotFoundError, OvirtMTVDatacenterStatusError, VmNotFoundError
+from timeout_sampler import TimeoutExpiredError
+
+from exceptions.exceptions import (
+    OvirtMTVDatacenterNotFoundError,
+    OvirtMTVDatacenterStatusError,
+    VmCloneError,
+    VmNotFoundError,
+)
 from libs.base_provider import BaseProvider
 from utilities.naming import generate_name_with_uuid
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from libs.forklift_inventory import ForkliftInventory
 
 LOGGER = get_logger(__name__)
 
+# Links expanded by vm_dict, the VM with its NICs, disks and snapshots in one request
+VM_DICT_FOLLOW = "nics.vnic_profile.network,disk_attachments.disk.storage_domains,snapshots"
+
+
+@dataclass
+class OvirtCloneHandle:
+    """A template clone submitted by OvirtProvider.start_clone, awaited with OvirtProvider.wait_for_clones."""
+
+    name: str
+    template_name: str
+    correlation_id: str
+    power_on: bool
+    # ovirtsdk4 Future of the add request, resolved to the VM by wait_for_clones
+    future: Any
+    # Engine event index from before the clone was submitted, wait_for_clones reads the events after it
+    event_index: int
+    vm: types.Vm | None = None
+    error: str = ""
+    done: bool = False
+
 
 class OvirtProvider(BaseProvider):
     """
     https://github.com/oVirt/ovirt-engine-sdk/tree/master/sdk/examples
     """
 
+    # Clones are awaited together by get_vms_by_name, the SDK connection is not shared across threads
+    BATCH_CLONES = True
+
     def __init__(
         self,
         host: str,
@@ -132,13 +163,51 @@ class OvirtProvider(BaseProvider):
             else:
                 raise VmNotFoundError(f"VM '{target_vm_name}' not found on RHV host [{self.host}]") from None
 
+    def get_vms_by_name(self, vms: list[dict[str, Any]]) -> list[types.Vm]:
+        """Look up several VMs, cloning the missing ones from their templates concurrently.
+
+        Args:
+            vms (list[dict[str, Any]]): get_vm_by_name arguments of every VM.
+
+        Returns:
+            list[types.Vm]: The VMs, in the order of vms.
+        """
+        results: list[types.Vm | OvirtCloneHandle] = []
+        event_index: int | None = None
+        for _vm in vms:
+            try:
+                results.append(self.get_vm_by_name(**{**_vm, "clone_vm": False}))
+            except VmNotFoundError:
+                if not _vm.get("clone_vm"):
+                    raise
+
+                if event_index is None:
+                    event_index = self._last_event_index()
+
+                results.append(
+                    self.start_clone(
+                        event_index=event_index,
+                        source_vm_name=_vm["query"],
+                        clone_vm_name=f"{_vm['query']}{_vm.get('vm_name_suffix', '')}",
+                        session_uuid=_vm.get("session_uuid", ""),
+                        **(_vm.get("clone_options") or {}),
+                    )
+                )
+
+        handles = [result for result in results if isinstance(result, OvirtCloneHandle)]
+        cloned = iter(self.wait_for_clones(handles=handles))
+        return [next(cloned) if isinstance(result, OvirtCloneHandle) else result for result in results]
+
     def vm_nics(self, vm: types.Vm) -> list[Any]:
-        return [self.api.follow_link(nic) for nic in self.vms_services.vm_service(id=vm.id).nics_service().list()]
+        return list(self.vms_services.vm_service(id=vm.id).nics_service().list(follow="vnic_profile.network"))
 
     def vm_disk_attachments(self, vm: types.Vm) -> list[Any]:
         return [
-            self.api.follow_link(disk.disk)
-            for disk in self.vms_services.vm_service(id=vm.id).disk_attachments_service().list()
+            attachment.disk
+            for attachment in self.vms_services
+            .vm_service(id=vm.id)
+            .disk_attachments_service()
+            .list(follow="disk.storage_domains")
         ]
 
     def list_snapshots(self, vm: types.Vm) -> list[Any]:
@@ -205,9 +274,12 @@ class OvirtProvider(BaseProvider):
         result_vm_info["name"] = source_vm.name
         result_vm_info["id"] = source_vm.id
 
+        # NICs, disks and snapshots are expanded in the same request instead of a request per link
+        expanded_vm = self.vms_services.vm_service(id=source_vm.id).get(follow=VM_DICT_FOLLOW)
+
         # Network Interfaces
-        for nic in self.vm_nics(vm=source_vm):
-            network = self.api.follow_link(self.api.follow_link(nic.__getattribute__("vnic_profile")).network)
+        for nic in expanded_vm.nics or []:
+            network = nic.vnic_profile.network
             result_vm_info["network_interfaces"].append({
                 "name": nic.name,
                 "macAddress": nic.mac.address,
@@ -215,8 +287,9 @@ class OvirtProvider(BaseProvider):
             })
 
         # Disks
-        for disk in self.vm_disk_attachments(vm=source_vm):
-            storage_domain = self.api.follow_link(disk.storage_domains[0])
+        for attachment in expanded_vm.disk_attachments or []:
+            disk = attachment.disk
+            storage_domain = disk.storage_domains[0]
             result_vm_info["disks"].append({
                 "name": disk.name,
                 "size_in_kb": disk.total_size,
@@ -233,7 +306,7 @@ class OvirtProvider(BaseProvider):
         result_vm_info["memory_in_mb"] = source_vm.memory / 1024 / 1024
 
         # Snapshots details
-        for snapshot in self.list_snapshots(source_vm):
+        for snapshot in expanded_vm.snapshots or []:
             result_vm_info["snapshots_data"].append(
                 dict({
                     "description": snapshot.description,
@@ -285,7 +358,7 @@ class OvirtProvider(BaseProvider):
         sleep: int = 1,
     ) -> None:
         """
-        Waits for a specific condition to be True using TimeoutSampler.
+        Waits for a specific condition to be True using BackoffSampler.
 
         Args:
             entity_name: The name of the entity being waited on.
@@ -296,7 +369,7 @@ class OvirtProvider(BaseProvider):
         """
         LOGGER.info(f"Waiting for '{action_name}' on '{entity_name}' to complete...")
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=timeout,
                 sleep=sleep,
                 func=condition_func,
@@ -339,6 +412,75 @@ class OvirtProvider(BaseProvider):
             condition_func=_check_vm_deleted,
         )
 
+    def delete_vms(self, names: list[str]) -> dict[str, BaseException]:
+        """Delete several VMs together: shut down the running ones, remove all and wait for each step in batch.
+
+        The SDK connection is not shared across threads, so the requests are submitted one after another
+        and every wait checks all VMs with one search.
+
+        Args:
+            names (list[str]): Names of the VMs to delete.
+
+        Returns:
+            dict[str, BaseException]: The failure of every VM that was not deleted, by VM name.
+        """
+        failures: dict[str, BaseException] = {}
+        if not names:
+            return failures
+
+        vms = {vm.name: vm for vm in self.vms_services.list(search=" or ".join(f"name={name}" for name in names))}
+        for name in set(names) - vms.keys():
+            LOGGER.warning(f"VM '{name}' not found. Nothing to delete.")
+
+        def _submit(action_name: str, vm_names: list[str], action: Callable[[types.Vm], Any]) -> list[str]:
+            submitted = []
+            for vm_name in vm_names:
+                try:
+                    LOGGER.info(f"{action_name} VM '{vm_name}'")
+                    action(self.vms_services.vm_service(vms[vm_name].id))
+                    submitted.append(vm_name)
+                except ovirtsdk4.Error as exp:
+                    failures[vm_name] = exp
+
+            return submitted
+
+        def _wait(action_name: str, vm_names: list[str], condition_func: Callable[[], bool]) -> None:
+            if not vm_names:
+                return
+
+            try:
+                self._wait_for_condition(
+                    entity_name=", ".join(vm_names), action_name=action_name, condition_func=condition_func
+                )
+            except TimeoutExpiredError as exp:
+                failures.update(dict.fromkeys(vm_names, exp))
+
+        stopping = _submit(
+            action_name="Stopping",
+            vm_names=[name for name, vm in vms.items() if vm.status == VmStatus.UP],
+            action=lambda vm_service: vm_service.shutdown(),
+        )
+        _wait(
+            action_name="Power Off",
+            vm_names=stopping,
+            condition_func=lambda: all(
+                status == VmStatus.DOWN for status in self._vm_statuses(names=stopping).values()
+            ),
+        )
+
+        removing = _submit(
+            action_name="Deleting",
+            vm_names=[name for name in vms if name not in failures],
+            action=lambda vm_service: vm_service.remove(),
+        )
+        _wait(
+            action_name="Deletion",
+            vm_names=removing,
+            condition_func=lambda: not self._vm_statuses(names=removing),
+        )
+
+        return failures
+
     def get_template_by_name(self, name: str) -> Any:
         """Get template by name from oVirt."""
         query = f"name={name}"
@@ -399,6 +541,43 @@ class OvirtProvider(BaseProvider):
         In RHV/oVirt, source_vm_name is actually a template name.
         Raises an exception if the process fails.
         """
+        handle = self.start_clone(
+            source_vm_name=source_vm_name,
+            clone_vm_name=clone_vm_name,
+            session_uuid=session_uuid,
+            power_on=power_on,
+            **kwargs,
+        )
+        return self.wait_for_clones(handles=[handle])[0]
+
+    def start_clone(
+        self,
+        source_vm_name: str,
+        clone_vm_name: str,
+        session_uuid: str,
+        power_on: bool = False,
+        event_index: int | None = None,
+        **kwargs: Any,
+    ) -> OvirtCloneHandle:
+        """Submit a clone of a template without waiting for it.
+
+        The clone is tracked for teardown right away, a clone failing later is still cleaned up.
+
+        Args:
+            source_vm_name (str): The template name.
+            clone_vm_name (str): Base name of the clone.
+            session_uuid (str): The session identifier.
+            power_on (bool): Start the VM once it is created.
+            event_index (int | None): Engine event index taken before the first clone of a batch,
+                the current index when None.
+            **kwargs (Any): Clone options, unused by RHV.
+
+        Returns:
+            OvirtCloneHandle: The submitted clone, to pass to wait_for_clones.
+
+        Raises:
+            NotFoundError: If the template does not exist.
+        """
         clone_vm_name = self._generate_clone_vm_name(session_uuid=session_uuid, base_name=clone_vm_name)
         LOGGER.info(f"Starting clone of '{source_vm_name}' template to '{clone_vm_name}'")
 
@@ -410,39 +589,124 @@ class OvirtProvider(BaseProvider):
             LOGGER.error(f"Template '{source_vm_name}' not found in oVirt")
             raise
 
-        try:
-            # Clone from template
-            new_vm = self.vms_services.add(
-                vm=types.Vm(
-                    name=clone_vm_name,
-                    cluster=types.Cluster(id=template.cluster.id),
-                    template=types.Template(id=template.id),
-                    memory_policy=types.MemoryPolicy(guaranteed=0),
-                ),
-                clone=True,
-            )
-            new_vm_service = self.vms_services.vm_service(new_vm.id)
+        # The engine tags the events of the clone with the correlation ID, wait_for_clones matches failures by it
+        if event_index is None:
+            event_index = self._last_event_index()
+
+        correlation_id = uuid.uuid4().hex
+        future = self.vms_services.add(
+            vm=types.Vm(
+                name=clone_vm_name,
+                cluster=types.Cluster(id=template.cluster.id),
+                template=types.Template(id=template.id),
+                memory_policy=types.MemoryPolicy(guaranteed=0),
+            ),
+            clone=True,
+            query={"correlation_id": correlation_id},
+            wait=False,
+        )
 
-            # Wait for VM to be ready
-            self._wait_for_condition(
-                entity_name=clone_vm_name,
-                action_name="VM Creation from Template",
-                condition_func=lambda: new_vm_service.get().status == types.VmStatus.DOWN,
-                timeout=60 * 20,
-            )
+        # Track cloned VM for cleanup
+        if self.fixture_store:
+            self.fixture_store["teardown"].setdefault(self.type, []).append({
+                "name": clone_vm_name,
+            })
 
-            # Track cloned VM for cleanup
-            if self.fixture_store:
-                self.fixture_store["teardown"].setdefault(self.type, []).append({
-                    "name": clone_vm_name,
-                })
+        return OvirtCloneHandle(
+            name=clone_vm_name,
+            template_name=source_vm_name,
+            correlation_id=correlation_id,
+            power_on=power_on,
+            future=future,
+            event_index=event_index,
+        )
 
-            if power_on:
-                self.start_vm(new_vm)
+    def _vm_statuses(self, names: list[str]) -> dict[str, types.VmStatus]:
+        """Status of the existing VMs among names, with one search."""
+        return {
+            vm.name: vm.status for vm in self.vms_services.list(search=" or ".join(f"name={name}" for name in names))
+        }
 
-            LOGGER.info(f"Successfully cloned template '{source_vm_name}' to VM '{clone_vm_name}'")
-            return new_vm
+    def _last_event_index(self) -> int:
+        events = self.events_service().list(max=1)
+        return events[0].index if events else 0
 
-        except Exception as e:
-            LOGGER.error(f"Clone process failed: {e}")
-            raise
+    def wait_for_clones(self, handles: list[OvirtCloneHandle], timeout: int = 60 * 20) -> list[types.Vm]:
+        """Wait for submitted clones together, with one VM and one event query per check for all of them.
+
+        A clone is done when its VM is down. It failed when the add request failed, the engine logged
+        an error event with its correlation ID or its VM disappeared. Failures are raised once every
+        clone finished, so no VM is deleted while its disks are still locked.
+
+        Args:
+            handles (list[OvirtCloneHandle]): Clones submitted by start_clone.
+            timeout (int): Time in seconds to wait for all clones.
+
+        Returns:
+            list[types.Vm]: The cloned VMs, in the order of handles.
+
+        Raises:
+            VmCloneError: If any clone failed.
+            TimeoutExpiredError: If the clones did not finish within timeout.
+        """
+        if not handles:
+            return []
+
+        # Events logged between submitting the clones and this wait are read as well
+        event_index = min(handle.event_index for handle in handles)
+        for handle in handles:
+            try:
+                handle.vm = handle.future.wait()
+            except ovirtsdk4.Error as exp:
+                handle.error = str(exp)
+                handle.done = True
+
+        by_correlation_id = {handle.correlation_id: handle for handle in handles}
+
+        def _check_clones_done() -> bool:
+            nonlocal event_index
+            pending = [handle for handle in handles if not handle.done]
+            if not pending:
+                return True
+
+            for event in self.events_service().list(from_=event_index):
+                event_index = max(event_index, event.index)
+                handle = by_correlation_id.get(event.correlation_id or "")
+                if handle and not handle.done and event.severity == types.LogSeverity.ERROR:
+                    handle.error = event.description
+                    handle.done = True
+
+            statuses = self._vm_statuses(names=[handle.name for handle in pending])
+            for handle in pending:
+                if handle.done:
+                    continue
+
+                if handle.name not in statuses:
+                    handle.error = "VM was removed before the clone finished"
+                    handle.done = True
+                elif statuses[handle.name] == types.VmStatus.DOWN:
+                    LOGGER.info(f"Successfully cloned template '{handle.template_name}' to VM '{handle.name}'")
+                    handle.done = True
+
+            return all(handle.done for handle in handles)
+
+        self._wait_for_condition(
+            entity_name=", ".join(handle.name for handle in handles),
+            action_name="VM Creation from Template",
+            condition_func=_check_clones_done,
+            timeout=timeout,
+        )
+
+        failures = [handle for handle in handles if handle.error]
+        if failures:
+            for handle in failures:
+                LOGGER.error(f"Clone of '{handle.template_name}' to '{handle.name}' failed: {handle.error}")
+
+            raise VmCloneError(f"Failed to clone {', '.join(handle.name for handle in failures)}")
+
+        vms = [handle.vm for handle in handles if handle.vm]
+        for handle, vm in zip(handles, vms, strict=True):
+            if handle.power_on:
+                self.start_vm(vm)
+
+        return vms
@@ -3,7 +3,8 @@ from __future__ import annotations
 import base64
 import copy
 import ipaddress
-
+import threading
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Literal, Self
 
 import shortuuid
@@ -14,7 +15,7 @@ from ocp_resources.secret import Secret
 from pyVim.connect import Disconnect, SmartConnect
 from pyVmomi import vim, vmodl
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from exceptions.exceptions import VmBadDatastoreError, VmCloneError, VmMissingVmxError, VmNotFoundError
 from libs.base_provider import BaseProvider
@@ -25,6 +26,9 @@ from utilities.copyoffload_datastore import (
     format_custom_datastore_not_found_message,
     resolve_datastore_moid_from_disk_config,
 )
+from utilities.vmware_tasks import VSphereTaskWaiter
+from utilities.vmware_vm_pool import VMwareVmPool
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from libs.forklift_inventory import ForkliftInventory
@@ -37,6 +41,59 @@ LOGGER = get_logger(__name__)
 # Reference: VMware vSphere API VirtualEthernetCard documentation
 VSPHERE_NIC_DEVICE_KEY_OFFSET = 4000
 
+# clone_vm modes: full copies every disk, linked creates delta disks off a session base snapshot
+# of the source, instant forks a powered on source VM including its memory state
+CLONE_MODE_FULL = "full"
+CLONE_MODE_LINKED = "linked"
+CLONE_MODE_INSTANT = "instant"
+CLONE_MODES = (CLONE_MODE_FULL, CLONE_MODE_LINKED, CLONE_MODE_INSTANT)
+# fixture_store teardown key of the linked clone base snapshots, removed after the clones
+LINKED_CLONE_BASE_SNAPSHOTS = "VMwareSnapshot"
+
+# VirtualMachine properties vm_dict reads, retrieved for any number of VMs with one
+# RetrievePropertiesEx call instead of one SOAP round trip per attribute dereference
+VM_DICT_PROPERTIES = (
+    "name",
+    "config.uuid",
+    "config.guestId",
+    "config.firmware",
+    "config.bootOptions",
+    "config.hardware.device",
+    "config.hardware.numCPU",
+    "config.hardware.numCoresPerSocket",
+    "config.hardware.memoryMB",
+    "guest.net",
+    "guest.ipStack",
+    "guest.toolsStatus",
+    "runtime.powerState",
+    "snapshot",
+)
+
+# VirtualMachine properties the get_vm_by_name health checks read, with one RetrievePropertiesEx call
+VM_HEALTH_PROPERTIES = ("config.changeVersion", "summary.runtime.connectionState")
+
+
+def _nest_properties(properties: dict[str, Any]) -> SimpleNamespace:
+    """Dotted property paths as nested attributes, {"runtime.powerState": x} -> obj.runtime.powerState == x.
+
+    Gives retrieved properties the attribute layout of the managed object, without its round trips.
+    """
+    root = SimpleNamespace()
+    for path, value in properties.items():
+        node = root
+        *parents, leaf = path.split(".")
+        for parent in parents:
+            if not isinstance(getattr(node, parent, None), SimpleNamespace):
+                setattr(node, parent, SimpleNamespace())
+            node = getattr(node, parent)
+        setattr(node, leaf, value)
+
+    return root
+
+
+def _task_error_message(error: Any) -> str:
+    return str(error.localizedMessage) if hasattr(error, "localizedMessage") else str(error)
+
 
 def format_insufficient_capacity_message(datastore_name: str, required_gb: float, available_gb: float) -> str:
     """Format error/log message for insufficient datastore capacity.
@@ -87,6 +144,8 @@ class VMWareProvider(BaseProvider):
         "thick-lazy": {"thinProvisioned": False, "eagerlyScrub": False},
         "thick-eager": {"thinProvisioned": False, "eagerlyScrub": True},
     }
+    # vCenter runs provisioning tasks concurrently, the SOAP stub draws its connections from a pool
+    CLONE_CONCURRENCY = 4
 
     def __init__(
         self,
@@ -94,10 +153,23 @@ class VMWareProvider(BaseProvider):
         username: str,
         password: str,
         ocp_resource: Provider | None = None,
+        vm_pool_size: int = 0,
         **kwargs: Any,
     ) -> None:
         # Extract copyoffload configuration before calling parent
         self.copyoffload_config = kwargs.pop("copyoffload", {})
+        # get_obj index per vimtype: (objects by name, objects by MoRef ID)
+        self._obj_index: dict[tuple[Any, ...], tuple[dict[str, Any], dict[str, Any]]] = {}
+        self._obj_index_lock = threading.Lock()
+        self.task_waiter: VSphereTaskWaiter | None = None
+        # Linked clone base snapshot per source VM MoRef ID
+        self._linked_clone_bases: dict[str, vim.vm.Snapshot] = {}
+        self._linked_clone_bases_lock = threading.Lock()
+        # Config changeVersion per VM MoRef ID at its last passing vmx file check
+        self._vmx_checked: dict[str, str] = {}
+        self._vmx_checked_lock = threading.Lock()
+        # Ready clones reused across sessions, see utilities.vmware_vm_pool
+        self.vm_pool = VMwareVmPool(provider=self, size=vm_pool_size) if vm_pool_size > 0 else None
 
         super().__init__(ocp_resource=ocp_resource, host=host, username=username, password=password, **kwargs)
         self.update_provider_clone_method()
@@ -106,6 +178,26 @@ class VMWareProvider(BaseProvider):
         self.username = username
         self.password = password
 
+    def clone_targets(self, clone_options: dict[str, Any]) -> set[str]:
+        """Target datastore and ESXi host of a clone, with the copy-offload defaults get_vm_by_name applies.
+
+        Clones without an explicit target land on the source VM datastore and host and are only
+        limited by CLONE_CONCURRENCY.
+
+        Args:
+            clone_options (dict[str, Any]): The clone options of the VM.
+
+        Returns:
+            set[str]: "datastore:<id>" and "host:<name>" keys of the configured targets.
+        """
+        targets = set()
+        if datastore_id := clone_options.get("target_datastore_id") or self.copyoffload_config.get("datastore_id"):
+            targets.add(f"datastore:{datastore_id}")
+        if esxi_host := clone_options.get("target_esxi_host") or self.copyoffload_config.get("esxi_host"):
+            targets.add(f"host:{esxi_host}")
+
+        return targets
+
     def update_provider_clone_method(self) -> None:
         """Update the provider's esxiCloneMethod setting if specified in the config."""
         clone_method = self.copyoffload_config.get("esxi_clone_method")
@@ -154,7 +246,7 @@ class VMWareProvider(BaseProvider):
         secret = Secret(client=self.ocp_resource.client, name=secret_name, namespace=self.ocp_resource.namespace)
 
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=wait_timeout,
                 sleep=5,
                 func=lambda: secret.exists,
@@ -168,7 +260,7 @@ class VMWareProvider(BaseProvider):
             LOGGER.exception("Timed out waiting for secret '%s' to be created.", secret_name)
             raise VmCloneError(f"SSH public key secret '{secret_name}' not found.") from exc
 
-        # This part should not be reached if TimeoutSampler works as expected
+        # This part should not be reached if BackoffSampler works as expected
         raise VmCloneError(f"Could not retrieve SSH public key from secret '{secret_name}'.")
 
     def get_datastore_name_by_id(self, datastore_id: str) -> str:
@@ -198,6 +290,9 @@ class VMWareProvider(BaseProvider):
             port=443,
             disableSslCertValidation=True,
         )
+        # MoRefs of the index are bound to the previous session stub
+        self.invalidate_obj_index()
+        self.task_waiter = VSphereTaskWaiter(service_instance=self.api)
         return self
 
     @property
@@ -263,7 +358,16 @@ class VMWareProvider(BaseProvider):
                     if target_esxi_host:
                         clone_vm_options["target_esxi_host"] = target_esxi_host
 
-                target_vm = self.clone_vm(
+                # A ready clone of the pool, reverted to its clean snapshot, instead of a fresh clone
+                if self.vm_pool:
+                    target_vm = self.vm_pool.lease(
+                        base_vm_name=query,
+                        clone_vm_name=target_vm_name,
+                        session_uuid=session_uuid,
+                        clone_options=clone_options,
+                    )
+
+                target_vm = target_vm or self.clone_vm(
                     source_vm_name=query,
                     clone_vm_name=target_vm_name,
                     session_uuid=session_uuid,
@@ -281,29 +385,86 @@ class VMWareProvider(BaseProvider):
             raise VmNotFoundError(f"VM {target_vm_name} not found on host [{self.host}]")
 
         # Perform health checks on the VM
-        if self.is_vm_missing_vmx_file(vm=target_vm):
-            raise VmMissingVmxError(vm=target_vm.name)
+        health = self._retrieve_health_properties(vm=target_vm)
+        if not self._is_vmx_checked(vm=target_vm, change_version=health.get("config.changeVersion")):
+            if self.is_vm_missing_vmx_file(vm=target_vm):
+                raise VmMissingVmxError(vm=target_vm.name)
+
+            self._set_vmx_checked(vm=target_vm, change_version=health.get("config.changeVersion"))
 
-        if self.is_vm_with_bad_datastore(vm=target_vm):
+        if self.is_vm_with_bad_datastore(vm=target_vm, connection_state=health.get("summary.runtime.connectionState")):
             raise VmBadDatastoreError(vm=target_vm.name)
 
         return target_vm
 
+    def _retrieve_health_properties(self, vm: vim.VirtualMachine) -> dict[str, Any]:
+        """VM_HEALTH_PROPERTIES of a VM by path, unset properties are missing."""
+        collector = vmodl.query.PropertyCollector
+        result = self.content.propertyCollector.RetrievePropertiesEx(
+            specSet=[
+                collector.FilterSpec(
+                    objectSet=[collector.ObjectSpec(obj=vm, skip=False)],
+                    propSet=[collector.PropertySpec(type=vim.VirtualMachine, pathSet=list(VM_HEALTH_PROPERTIES))],
+                )
+            ],
+            options=collector.RetrieveOptions(),
+        )
+        if not result or not result.objects:
+            return {}
+
+        return {prop.name: prop.val for prop in result.objects[0].propSet or []}
+
+    def _is_vmx_checked(self, vm: vim.VirtualMachine, change_version: str | None) -> bool:
+        """Whether the vmx file check passed for the current VM config, reconfigurations bump changeVersion."""
+        if not change_version:
+            return False
+
+        with self._vmx_checked_lock:
+            return self._vmx_checked.get(vm._moId) == change_version
+
+    def _set_vmx_checked(self, vm: vim.VirtualMachine, change_version: str | None) -> None:
+        if change_version:
+            with self._vmx_checked_lock:
+                self._vmx_checked[vm._moId] = change_version
+
     def wait_task(self, task: vim.Task, action_name: str, wait_timeout: int = 60, sleep: int = 1) -> Any:
-        """Waits and provides updates on a vSphere task."""
+        """Waits and provides updates on a vSphere task.
+
+        The task is awaited through the session VSphereTaskWaiter, polling ``task.info`` every
+        ``sleep`` seconds is the fallback when its update loop is not available.
+        """
+        if self.task_waiter is None:
+            return self._poll_task(task=task, action_name=action_name, wait_timeout=wait_timeout, sleep=sleep)
+
+        try:
+            task_wait = self.task_waiter.wait(task=task, action_name=action_name, wait_timeout=wait_timeout)
+        except TimeoutExpiredError:
+            self.log.error(msg=f"{action_name} did not complete successfully: {task.info.error}")
+            raise
+
+        if task_wait.lost:
+            # Poll at least once, the task may have finished right as the update loop failed
+            return self._poll_task(
+                task=task, action_name=action_name, wait_timeout=max(task_wait.remaining, sleep), sleep=sleep
+            )
+
+        if task_wait.error:
+            raise VmCloneError(f"vSphere task failed: {_task_error_message(error=task_wait.error)}")
+
+        self.log.info(
+            msg=(f"{action_name} completed successfully. {f'result: {task_wait.result}' if task_wait.result else ''}"),
+        )
+        return task_wait.result
+
+    def _poll_task(self, task: vim.Task, action_name: str, wait_timeout: float, sleep: int) -> Any:
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=wait_timeout,
                 sleep=sleep,
                 func=lambda: task.info.state == vim.TaskInfo.State.success,
             ):
                 if task.info.error:
-                    error_msg = (
-                        str(task.info.error.localizedMessage)
-                        if hasattr(task.info.error, "localizedMessage")
-                        else str(task.info.error)
-                    )
-                    raise VmCloneError(f"vSphere task failed: {error_msg}")
+                    raise VmCloneError(f"vSphere task failed: {_task_error_message(error=task.info.error)}")
 
                 if sample:
                     self.log.info(
@@ -405,7 +566,7 @@ class VMWareProvider(BaseProvider):
         try:
             vm.ShutdownGuest()
             LOGGER.info(f"Requested graceful shutdown for VM {vm.name}, waiting up to {timeout}s")
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=timeout,
                 sleep=5,
                 func=lambda: vm.runtime.powerState,
@@ -447,7 +608,7 @@ class VMWareProvider(BaseProvider):
         memory: bool = False,
         quiesce: bool = False,
         wait_timeout: int = 60 * 10,
-    ) -> None:
+    ) -> vim.vm.Snapshot:
         """Create a VMware snapshot for a VM and wait until it completes.
 
         Args:
@@ -458,6 +619,9 @@ class VMWareProvider(BaseProvider):
             quiesce: If True, quiesce the file system (requires VMware Tools / guest support).
             wait_timeout: Max time to wait for snapshot task completion.
 
+        Returns:
+            vim.vm.Snapshot: The created snapshot.
+
         """
         self.reconnect_if_not_connected
         LOGGER.info("Creating snapshot '%s' for VM '%s' (memory=%s, quiesce=%s)", name, vm.name, memory, quiesce)
@@ -467,14 +631,67 @@ class VMWareProvider(BaseProvider):
             memory=memory,
             quiesce=quiesce,
         )
-        self.wait_task(
+        return self.wait_task(
             task=task,
             action_name=f"Creating snapshot '{name}' for VM {vm.name}",
             wait_timeout=wait_timeout,
             sleep=5,
         )
 
-    def _get_network_name_from_device(self, device: vim.vm.device.VirtualEthernetCard) -> str:
+    @staticmethod
+    def snapshot_trees(vm: vim.VirtualMachine) -> list[vim.vm.SnapshotTree]:
+        """Every node of the snapshot tree of a VM, unlike list_snapshots not only the first branch.
+
+        Args:
+            vm: VMware VM object.
+
+        Returns:
+            list[vim.vm.SnapshotTree]: The snapshot tree nodes.
+        """
+        nodes = []
+        # vm.snapshot has no rootSnapshotList attribute if the VMWare VM does not have snapshots
+        trees = list(getattr(vm.snapshot, "rootSnapshotList", None) or [])
+        while trees:
+            tree = trees.pop()
+            nodes.append(tree)
+            trees.extend(tree.childSnapshotList or [])
+
+        return nodes
+
+    def find_snapshots(self, vm: vim.VirtualMachine, name: str) -> list[vim.vm.Snapshot]:
+        """All snapshots of a VM with the given name, anywhere in the snapshot tree.
+
+        Args:
+            vm: VMware VM object.
+            name: Snapshot name.
+
+        Returns:
+            list[vim.vm.Snapshot]: The matching snapshots.
+        """
+        return [tree.snapshot for tree in self.snapshot_trees(vm=vm) if tree.name == name]
+
+    def remove_snapshots(self, vm_name: str, name: str) -> None:
+        """Remove every snapshot of a VM with the given name, keeping their child snapshots.
+
+        Args:
+            vm_name: Name of the VM.
+            name: Snapshot name.
+        """
+        vm = self.get_obj(vimtype=[vim.VirtualMachine], name=vm_name)
+        for snapshot in self.find_snapshots(vm=vm, name=name):
+            self.wait_task(
+                task=snapshot.RemoveSnapshot_Task(removeChildren=False, consolidate=True),
+                action_name=f"Removing snapshot '{name}' of VM {vm_name}",
+                wait_timeout=60 * 10,
+                sleep=5,
+            )
+
+    def _get_network_name_from_device(
+        self,
+        device: vim.vm.device.VirtualEthernetCard,
+        network_names: dict[str, str] | None = None,
+        portgroup_names: dict[str, str] | None = None,
+    ) -> str:
         """Extract network name from a virtual ethernet device.
 
         Handles different network backing types:
@@ -483,24 +700,30 @@ class VMWareProvider(BaseProvider):
 
         Args:
             device: Virtual ethernet card device
+            network_names: Pre-fetched network names by MoRef ID, skips the network name lookup
+            portgroup_names: Pre-fetched DVS portgroup names by portgroup key, skips the portgroup search
 
         Returns:
             str: Network name or "Unknown" if unable to determine
 
         """
         network_name = "Unknown"
+        network_names = network_names or {}
+        portgroup_names = portgroup_names or {}
 
         if not device.backing:
             return network_name
 
         # Standard network backing (vSwitch)
         if hasattr(device.backing, "network") and device.backing.network:
-            return device.backing.network.name
+            return network_names.get(device.backing.network._moId) or device.backing.network.name
 
         # Distributed virtual port backing (DVS)
         if hasattr(device.backing, "port") and device.backing.port:
             port = device.backing.port
-            if hasattr(port, "portgroupKey"):
+            if hasattr(port, "portgroupKey") and port.portgroupKey in portgroup_names:
+                network_name = portgroup_names[port.portgroupKey]
+            elif hasattr(port, "portgroupKey"):
                 # Resolve the portgroup key to its name by searching all DVS portgroups
                 try:
                     container = self.view_manager.CreateContainerView(
@@ -525,7 +748,9 @@ class VMWareProvider(BaseProvider):
 
         return network_name
 
-    def _extract_nic_ip_info(self, vm: vim.VirtualMachine, device: vim.vm.device.VirtualEthernetCard) -> dict[str, Any]:
+    def _extract_nic_ip_info(
+        self, vm: vim.VirtualMachine | SimpleNamespace, device: vim.vm.device.VirtualEthernetCard
+    ) -> dict[str, Any]:
         """Extract IP address information from a virtual network interface.
 
         This method retrieves IP configuration from VMware Tools guest information including:
@@ -535,7 +760,7 @@ class VMWareProvider(BaseProvider):
         - IP assignment method (static vs DHCP)
 
         Args:
-            vm: VMware VM object
+            vm: VMware VM object, or its properties retrieved by _retrieve_vm_properties
             device: Virtual ethernet card device
 
         Returns:
@@ -699,36 +924,103 @@ class VMWareProvider(BaseProvider):
 
         return result
 
-    def vm_dict(self, **kwargs: Any) -> dict[str, Any]:
-        # If VM object already provided, use it directly (avoids re-searching for cloned VMs)
-        _vm = kwargs.get("provider_vm_api")
+    def _retrieve_vm_properties(
+        self, vms: list[vim.VirtualMachine]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, str], dict[str, str]]:
+        """Retrieve the vm_dict properties of VMs, their datastores and networks in one PropertyCollector call.
 
-        if not _vm:
-            vm_name = kwargs["name"]
-            _vm = self.get_vm_by_name(
-                query=f"{vm_name}",
-                vm_name_suffix=kwargs.get("vm_name_suffix", ""),
-                clone_vm=kwargs.get("clone", False),
-                session_uuid=kwargs.get("session_uuid", ""),
-                clone_options=kwargs.get("clone_options"),
+        Traverses from every VM to its datastores and networks so their names come with the same
+        RetrievePropertiesEx call, instead of one round trip per disk and NIC backing.
+
+        Args:
+            vms: VMware VM objects.
+
+        Returns:
+            tuple: VM_DICT_PROPERTIES values per VM MoRef ID (None when unset), datastore and network
+                names per MoRef ID, and DVS portgroup names per portgroup key.
+        """
+        collector = vmodl.query.PropertyCollector
+        traversal_specs = [
+            collector.TraversalSpec(
+                name=f"vmTo{path.capitalize()}",
+                type=vim.VirtualMachine,  # type: ignore[arg-type]
+                path=path,
+                skip=False,
             )
+            for path in ("datastore", "network")
+        ]
+        filter_spec = collector.FilterSpec(
+            objectSet=[collector.ObjectSpec(obj=vm, skip=False, selectSet=traversal_specs) for vm in vms],
+            propSet=[
+                collector.PropertySpec(type=vim.VirtualMachine, pathSet=list(VM_DICT_PROPERTIES)),
+                collector.PropertySpec(type=vim.Datastore, pathSet=["name"]),
+                collector.PropertySpec(type=vim.Network, pathSet=["name"]),
+                collector.PropertySpec(type=vim.dvs.DistributedVirtualPortgroup, pathSet=["name", "key"]),
+            ],
+        )
 
-        vm_config: Any = _vm.config
-        if not vm_config:
+        property_collector = self.content.propertyCollector
+        object_contents = []
+        result: vmodl.query.PropertyCollector.RetrieveResult | None = property_collector.RetrievePropertiesEx(
+            specSet=[filter_spec], options=collector.RetrieveOptions()
+        )
+        while result:
+            object_contents.extend(result.objects)
+            result = property_collector.ContinueRetrievePropertiesEx(token=result.token) if result.token else None
+
+        vm_properties: dict[str, dict[str, Any]] = {}
+        names: dict[str, str] = {}
+        portgroup_names: dict[str, str] = {}
+        for object_content in object_contents:
+            properties = {prop.name: prop.val for prop in object_content.propSet}
+            if isinstance(object_content.obj, vim.VirtualMachine):
+                vm_properties[object_content.obj._moId] = {path: properties.get(path) for path in VM_DICT_PROPERTIES}
+                continue
+
+            names[object_content.obj._moId] = properties.get("name", "")
+            if "key" in properties:
+                portgroup_names[properties["key"]] = properties.get("name", "")
+
+        return vm_properties, names, portgroup_names
+
+    def _build_vm_dict(
+        self,
+        vm: vim.VirtualMachine,
+        properties: dict[str, Any],
+        names: dict[str, str],
+        portgroup_names: dict[str, str],
+    ) -> dict[str, Any]:
+        """Build the vm_dict of a VM from its retrieved properties, without further API calls.
+
+        Args:
+            vm: VMware VM object.
+            properties: The VM_DICT_PROPERTIES values of the VM.
+            names: Datastore and network names by MoRef ID.
+            portgroup_names: DVS portgroup names by portgroup key.
+
+        Returns:
+            dict[str, Any]: The VM details, see BaseProvider.VIRTUAL_MACHINE_TEMPLATE.
+        """
+        _vm = _nest_properties(properties=properties)
+        if properties["config.hardware.device"] is None:
             raise ValueError(f"No config found for VM {_vm.name}")
 
+        vm_config: Any = _vm.config
+
         result_vm_info = copy.deepcopy(self.VIRTUAL_MACHINE_TEMPLATE)
         result_vm_info["provider_type"] = Resource.ProviderType.VSPHERE
-        result_vm_info["provider_vm_api"] = _vm
+        result_vm_info["provider_vm_api"] = vm
         result_vm_info["name"] = _vm.name
-        result_vm_info["id"] = _vm._moId  # VMware Managed Object ID
+        result_vm_info["id"] = vm._moId  # VMware Managed Object ID
         result_vm_info["uuid"] = vm_config.uuid
 
         # Devices
         for device in vm_config.hardware.device:
             # Network Interfaces
             if isinstance(device, vim.vm.device.VirtualEthernetCard):
-                network_name = self._get_network_name_from_device(device)
+                network_name = self._get_network_name_from_device(
+                    device, network_names=names, portgroup_names=portgroup_names
+                )
                 nic_info = {
                     "name": device.deviceInfo.label if device.deviceInfo else "Unknown",
                     "macAddress": device.macAddress,
@@ -748,7 +1040,7 @@ class VMWareProvider(BaseProvider):
                     "name": device.deviceInfo.label if device.deviceInfo else "Unknown",
                     "size_in_kb": device.capacityInKB,
                     "storage": dict(
-                        name=device.backing.datastore.name
+                        name=names.get(device.backing.datastore._moId) or device.backing.datastore.name
                         if device.backing and device.backing.datastore
                         else "Unknown",
                     ),
@@ -777,10 +1069,7 @@ class VMWareProvider(BaseProvider):
 
         # Guest Agent Status (bool)
         result_vm_info["guest_agent_running"] = (
-            hasattr(_vm, "runtime")
-            and _vm.runtime.powerState == "poweredOn"
-            and _vm.guest
-            and _vm.guest.toolsStatus == "toolsOk"
+            _vm.runtime.powerState == "poweredOn" and _vm.guest.toolsStatus == "toolsOk"
         )
 
         # Guest OS
@@ -818,6 +1107,45 @@ class VMWareProvider(BaseProvider):
 
         return result_vm_info
 
+    def _vm_dicts_for(self, vms: list[vim.VirtualMachine]) -> list[dict[str, Any]]:
+        vm_properties, names, portgroup_names = self._retrieve_vm_properties(vms=vms)
+        return [
+            self._build_vm_dict(vm=vm, properties=vm_properties[vm._moId], names=names, portgroup_names=portgroup_names)
+            for vm in vms
+        ]
+
+    def _resolve_vm(self, **kwargs: Any) -> vim.VirtualMachine:
+        # If VM object already provided, use it directly (avoids re-searching for cloned VMs)
+        _vm = kwargs.get("provider_vm_api")
+
+        if not _vm:
+            vm_name = kwargs["name"]
+            _vm = self.get_vm_by_name(
+                query=f"{vm_name}",
+                vm_name_suffix=kwargs.get("vm_name_suffix", ""),
+                clone_vm=kwargs.get("clone", False),
+                session_uuid=kwargs.get("session_uuid", ""),
+                clone_options=kwargs.get("clone_options"),
+            )
+
+        return _vm
+
+    def vm_dict(self, **kwargs: Any) -> dict[str, Any]:
+        return self._vm_dicts_for(vms=[self._resolve_vm(**kwargs)])[0]
+
+    def vm_dicts(self, names: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+        """vm_dict of several VMs, with the properties of all of them retrieved in one call.
+
+        Args:
+            names (list[str]): VM names.
+            **kwargs (Any): vm_dict arguments applied to every VM (vm_name_suffix, clone, ...).
+
+        Returns:
+            list[dict[str, Any]]: The vm_dict of every VM, in the order of ``names``.
+        """
+        kwargs.pop("provider_vm_api", None)
+        return self._vm_dicts_for(vms=[self._resolve_vm(**kwargs, name=name) for name in names])
+
     def is_vm_missing_vmx_file(self, vm: vim.VirtualMachine) -> bool:
         if not vm.datastore:
             self.log.error(f"VM {vm.name} is inaccessible due to datastore error")
@@ -852,35 +1180,131 @@ class VMWareProvider(BaseProvider):
 
         return False
 
-    def is_vm_with_bad_datastore(self, vm: vim.VirtualMachine) -> bool:
-        if vm.summary.runtime.connectionState == "inaccessible":
+    def is_vm_with_bad_datastore(self, vm: vim.VirtualMachine, connection_state: str | None = None) -> bool:
+        if (connection_state or vm.summary.runtime.connectionState) == "inaccessible":
             self.log.error(f"VM {vm.name} is inaccessible due to connection error")
             return True
         return False
 
     def get_obj(self, vimtype: Any, name: str) -> Any:
+        """Get a managed object by name, or by MoRef ID for datastores.
+
+        Lookups go through a per vimtype name index built with one PropertyCollector call. A miss
+        rebuilds the index once, so objects created outside this provider are still found.
+
+        Args:
+            vimtype: List of managed object types, e.g. [vim.VirtualMachine].
+            name: Object name, or MoRef ID for [vim.Datastore].
+
+        Returns:
+            Any: The managed object.
+
+        Raises:
+            ValueError: If no object of that type has that name.
+        """
         self.reconnect_if_not_connected
+        key = tuple(vimtype)
+        for refresh in (False, True):
+            by_name, by_moid = self._get_obj_index(key=key, refresh=refresh)
+            if (obj := by_name.get(name)) is not None:
+                return obj
+            # For datastores, also check by MoRef ID
+            if vimtype == [vim.Datastore] and (obj := by_moid.get(name)) is not None:
+                return obj
+
+        raise ValueError(f"Object of type {vimtype} with name '{name}' not found.")
+
+    def _get_obj_index(self, key: tuple[Any, ...], refresh: bool = False) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Objects of the vimtypes in key by name and by MoRef ID, built on first use or on refresh."""
+        with self._obj_index_lock:
+            if refresh or key not in self._obj_index:
+                self._obj_index[key] = self._retrieve_obj_index(vimtype=list(key))
+
+            return self._obj_index[key]
+
+    def retrieve_properties(self, vimtype: list[Any], path_set: list[str]) -> list[tuple[Any, dict[str, Any]]]:
+        """Retrieve properties of every object of vimtype with one RetrievePropertiesEx call.
+
+        Replaces dereferencing the properties of every object of a ContainerView, one round trip
+        each. Objects deleted while the view is traversed are not returned by the collector, so
+        there are no stale references to skip.
+
+        Args:
+            vimtype: List of managed object types.
+            path_set: Property paths to retrieve, unset properties are missing from the result.
+
+        Returns:
+            list[tuple[Any, dict[str, Any]]]: Every object with its properties by path.
+        """
+        collector = vmodl.query.PropertyCollector
         container = self.view_manager.CreateContainerView(self.content.rootFolder, vimtype, True)
         try:
-            # Access the view property which contains the managed objects
-            managed_objects = getattr(container, "view", [])
-            for obj in managed_objects:
-                try:
-                    # Check by name first
-                    if obj.name == name:
-                        return obj
-                    # For datastores, also check by MoRef ID
-                    if vimtype == [vim.Datastore] and hasattr(obj, "_moId") and obj._moId == name:
-                        return obj
-                except vmodl.fault.ManagedObjectNotFound:
-                    LOGGER.debug(f"Skipping stale managed object reference while searching for '{name}'")
-                    continue
-
-            raise ValueError(f"Object of type {vimtype} with name '{name}' not found.")
+            filter_spec = collector.FilterSpec(
+                objectSet=[
+                    collector.ObjectSpec(
+                        obj=container,
+                        skip=True,
+                        selectSet=[
+                            collector.TraversalSpec(
+                                name="traverseView",
+                                type=vim.view.ContainerView,
+                                path="view",
+                                skip=False,
+                            )
+                        ],
+                    )
+                ],
+                propSet=[collector.PropertySpec(type=_type, pathSet=path_set) for _type in vimtype],
+            )
+            property_collector = self.content.propertyCollector
+            object_contents = []
+            result: vmodl.query.PropertyCollector.RetrieveResult | None = property_collector.RetrievePropertiesEx(
+                specSet=[filter_spec], options=collector.RetrieveOptions()
+            )
+            while result:
+                object_contents.extend(result.objects)
+                result = property_collector.ContinueRetrievePropertiesEx(token=result.token) if result.token else None
 
         finally:
             container.Destroy()
 
+        return [
+            (object_content.obj, {prop.name: prop.val for prop in object_content.propSet or []})
+            for object_content in object_contents
+        ]
+
+    def _retrieve_obj_index(self, vimtype: list[Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Retrieve the name of every object of vimtype, see retrieve_properties.
+
+        Args:
+            vimtype: List of managed object types.
+
+        Returns:
+            tuple: Objects by name (first object wins on duplicate names) and by MoRef ID.
+        """
+        by_name: dict[str, Any] = {}
+        by_moid: dict[str, Any] = {}
+        for obj, properties in self.retrieve_properties(vimtype=vimtype, path_set=["name"]):
+            if "name" in properties:
+                by_name.setdefault(properties["name"], obj)
+            by_moid[obj._moId] = obj
+
+        LOGGER.debug(f"Indexed {len(by_moid)} objects of type {vimtype}")
+        return by_name, by_moid
+
+    def invalidate_obj_index(self, vimtype: Any = None) -> None:
+        """Drop the get_obj index of every key containing vimtype, or the whole index.
+
+        Called after this provider creates, deletes or renames objects, so the next lookup sees them.
+
+        Args:
+            vimtype: Managed object type, e.g. vim.VirtualMachine. None drops every index.
+        """
+        with self._obj_index_lock:
+            for key in list(self._obj_index):
+                if vimtype is None or vimtype in key:
+                    del self._obj_index[key]
+
     def add_rdm_disk_to_vm(
         self,
         vm: vim.VirtualMachine,
@@ -1244,6 +1668,7 @@ class VMWareProvider(BaseProvider):
         session_uuid: str,
         power_on: bool = False,
         regenerate_mac: bool = True,
+        track_teardown: bool = True,
         **kwargs: Any,
     ) -> vim.VirtualMachine:
         """Clones a virtual machine from an existing VM or template.
@@ -1255,6 +1680,8 @@ class VMWareProvider(BaseProvider):
             power_on: Whether to power on the VM after cloning. Defaults to False.
             regenerate_mac: Whether to regenerate MAC addresses for network interfaces.
                           Prevents MAC address conflicts between cloned VMs. Default: True.
+            track_teardown: Whether the session teardown deletes the clone. False for clones that
+                          outlive the session, e.g. VM pool members. Default: True.
             **kwargs: Additional keyword arguments for cloning options:
                 - add_disks (list[dict], optional): A list of dictionaries, where each dict
                     defines a new disk to be added to the cloned VM.
@@ -1272,6 +1699,11 @@ class VMWareProvider(BaseProvider):
                     format (e.g., capitals, underscores) instead of the default
                     sanitization. Used for testing non-conforming name handling.
                     Defaults to False.
+                - clone_mode (str, optional): One of CLONE_MODES. 'linked' creates delta disks off
+                    a base snapshot of the source created once per session, 'instant' forks a
+                    powered on source, the forked clone is powered off unless power_on is set.
+                    Falls back to 'full' when the requested mode can not give the clone the
+                    requested layout or CTK, see _resolve_clone_mode. Defaults to 'full'.
 
         Returns:
             vim.VirtualMachine: The cloned VM object.
@@ -1309,6 +1741,9 @@ class VMWareProvider(BaseProvider):
         LOGGER.info(f"Starting clone process for '{clone_vm_name}' from '{source_vm_name}'")
 
         source_vm = self.get_obj([vim.VirtualMachine], source_vm_name)
+        clone_mode = self._resolve_clone_mode(
+            source_vm=source_vm, clone_mode=kwargs.get("clone_mode") or CLONE_MODE_FULL, clone_options=kwargs
+        )
 
         relocate_spec = vim.vm.RelocateSpec()
 
@@ -1554,9 +1989,22 @@ class VMWareProvider(BaseProvider):
             template=False,
             config=config_spec,
         )
-
-        task = source_vm.CloneVM_Task(folder=source_vm.parent, name=clone_vm_name, spec=clone_spec)
-        LOGGER.info("Clone task started for %s. Waiting for completion...", clone_vm_name)
+        if clone_mode == CLONE_MODE_LINKED:
+            clone_spec.snapshot = self._linked_clone_base_snapshot(source_vm=source_vm, session_uuid=session_uuid)
+            relocate_spec.diskMoveType = vim.vm.RelocateSpec.DiskMoveOptions.createNewChildDiskBacking
+
+        if clone_mode == CLONE_MODE_INSTANT:
+            # Instant clones take NIC changes with the location and extra config as option values
+            relocate_spec.folder = source_vm.parent
+            relocate_spec.deviceChange = config_spec.deviceChange
+            task = source_vm.InstantClone_Task(
+                spec=vim.vm.InstantCloneSpec(
+                    name=clone_vm_name, location=relocate_spec, config=config_spec.extraConfig or []
+                )
+            )
+        else:
+            task = source_vm.CloneVM_Task(folder=source_vm.parent, name=clone_vm_name, spec=clone_spec)
+        LOGGER.info(f"{clone_mode.capitalize()} clone task started for {clone_vm_name}. Waiting for completion...")
 
         try:
             res = self.wait_task(
@@ -1566,7 +2014,7 @@ class VMWareProvider(BaseProvider):
                 sleep=5,
             )
         except VmCloneError as e:
-            if regenerate_mac and "in use" in str(e).lower():
+            if regenerate_mac and clone_mode != CLONE_MODE_INSTANT and "in use" in str(e).lower():
                 LOGGER.warning("Clone failed with resource conflict, retrying without MAC regeneration")
                 uppercase_mac_nics.clear()
                 if clone_spec.config and clone_spec.config.deviceChange:
@@ -1589,12 +2037,17 @@ class VMWareProvider(BaseProvider):
             else:
                 raise
 
-        if self.fixture_store:
+        self.invalidate_obj_index(vimtype=vim.VirtualMachine)
+        if self.fixture_store and track_teardown:
             self.fixture_store["teardown"].setdefault(self.type, []).append({"name": clone_vm_name})
 
         if not res:
             raise VmCloneError(f"Clone task for '{clone_vm_name}' returned no VM object")
 
+        if clone_mode == CLONE_MODE_INSTANT and not power_on:
+            # Instant clones are always created running
+            self.stop_vm(vm=res)
+
         # Add RDM disks post-clone (RDM requires VMFS datastore, can't be added during clone on NFS)
         for rdm_config in rdm_disks:
             self.add_rdm_disk_to_vm(vm=res, rdm_type=rdm_config["rdm_type"], enable_cbt=enable_ctk)
@@ -1606,6 +2059,87 @@ class VMWareProvider(BaseProvider):
 
         return res
 
+    def _resolve_clone_mode(self, source_vm: vim.VirtualMachine, clone_mode: str, clone_options: dict[str, Any]) -> str:
+        """The clone mode clone_vm uses, full when the requested mode can not give the requested clone.
+
+        Linked and instant clones share the source disks through delta disks, so copy-offload
+        (XCOPY offloads full disk copies between datastores) and explicit disk provisioning
+        keep full clones, as do instant clones with CTK.
+
+        Args:
+            source_vm: The VM or template to clone from.
+            clone_mode: The requested mode, one of CLONE_MODES.
+            clone_options: The clone_vm keyword arguments.
+
+        Returns:
+            str: The clone mode to use.
+
+        Raises:
+            ValueError: If clone_mode is not one of CLONE_MODES.
+        """
+        if clone_mode not in CLONE_MODES:
+            raise ValueError(f"Unknown clone_mode '{clone_mode}', expected one of {CLONE_MODES}")
+
+        if clone_mode == CLONE_MODE_FULL:
+            return clone_mode
+
+        reason = ""
+        if self.copyoffload_config:
+            reason = "copy-offload tests need full disks"
+        elif clone_options.get("disk_type"):
+            reason = f"disk_type '{clone_options['disk_type']}' needs full disks"
+        elif source_vm.config.template:
+            reason = "the source is a template"
+        elif clone_mode == CLONE_MODE_INSTANT and not self.is_vm_powered_on(vm=source_vm):
+            reason = "instant clones need a powered on source"
+        elif clone_mode == CLONE_MODE_INSTANT and any(
+            "rdm_type" not in disk for disk in clone_options.get("add_disks", [])
+        ):
+            reason = "instant clones can not add disks"
+        elif clone_mode == CLONE_MODE_INSTANT and clone_options.get("enable_ctk"):
+            # ctkEnabled in the instant clone config does not enable CBT on the disks of the running fork
+            reason = "warm migrations need CTK enabled disks"
+
+        if reason:
+            LOGGER.warning(f"Can not {clone_mode} clone '{source_vm.name}', {reason}. Using a full clone.")
+            return CLONE_MODE_FULL
+
+        return clone_mode
+
+    def _linked_clone_base_snapshot(self, source_vm: vim.VirtualMachine, session_uuid: str) -> vim.vm.Snapshot:
+        """The session base snapshot linked clones of a source VM are created from.
+
+        Created on the first linked clone of the source and registered for removal in the
+        session teardown, after the clones are deleted.
+
+        Args:
+            source_vm: The VM to clone from.
+            session_uuid: The session identifier, names the snapshot.
+
+        Returns:
+            vim.vm.Snapshot: The base snapshot.
+        """
+        snapshot_name = f"{session_uuid}-linked-clone-base"
+        with self._linked_clone_bases_lock:
+            if snapshot := self._linked_clone_bases.get(source_vm._moId):
+                return snapshot
+
+            if snapshots := self.find_snapshots(vm=source_vm, name=snapshot_name):
+                snapshot = snapshots[0]
+                LOGGER.info(f"Using linked clone base snapshot '{snapshot_name}' of VM {source_vm.name}")
+            else:
+                snapshot = self.create_snapshot(
+                    vm=source_vm, name=snapshot_name, description="Base of the linked clones of an MTV test session"
+                )
+                if self.fixture_store:
+                    self.fixture_store["teardown"].setdefault(LINKED_CLONE_BASE_SNAPSHOTS, []).append({
+                        "vm_name": source_vm.name,
+                        "name": snapshot_name,
+                    })
+
+            self._linked_clone_bases[source_vm._moId] = snapshot
+            return snapshot
+
     def _reconfigure_uppercase_manual_macs(
         self, vm: vim.VirtualMachine, clone_vm_name: str, uppercase_mac_nics: set[str]
     ) -> None:
@@ -1919,7 +2453,10 @@ class VMWareProvider(BaseProvider):
         vm = self.get_obj(vimtype=[vim.VirtualMachine], name=vm_name)
         self.stop_vm(vm=vm)
         task = vm.Destroy_Task()
-        self.wait_task(task=task, action_name=f"Deleting VM {vm_name}")
+        try:
+            self.wait_task(task=task, action_name=f"Deleting VM {vm_name}")
+        finally:
+            self.invalidate_obj_index(vimtype=vim.VirtualMachine)
 
     def get_vm_or_template_networks(
         self,
@@ -2003,7 +2540,7 @@ class VMWareProvider(BaseProvider):
         LOGGER.info(f"Waiting for VMware Tools guest info for VM {vm.name} (timeout: {timeout}s)")
 
         try:
-            for sample in TimeoutSampler(
+            for sample in BackoffSampler(
                 wait_timeout=timeout,
                 sleep=5,
                 func=lambda: (
@@ -63,7 +63,7 @@ def ca_crt_source_provider_inventory(
     ocp_admin_client: DynamicClient,
     mtv_namespace: str,
     ca_crt_source_provider: BaseProvider,
-) -> ForkliftInventory:
+) -> Generator[ForkliftInventory, None, None]:
     """ForkliftInventory instance for the ca.crt provider.
 
     Args:
@@ -71,11 +71,14 @@ def ca_crt_source_provider_inventory(
         mtv_namespace (str): MTV operator namespace.
         ca_crt_source_provider (BaseProvider): Source provider using ca.crt secret field.
 
-    Returns:
+    Yields:
         ForkliftInventory: Inventory instance for the ca.crt provider.
     """
-    return create_forklift_inventory(
+    inventory = create_forklift_inventory(
         client=ocp_admin_client,
         mtv_namespace=mtv_namespace,
         provider=ca_crt_source_provider,
     )
+    yield inventory
+
+    inventory.transport.close()
@@ -13,6 +13,8 @@ remote_ocp_cluster: str = ""
 snapshots_interval: int = 2
 mins_before_cutover: int = 5
 plan_wait_timeout: int = 3600
+forklift_inventory_cache_ttl: int = 30  # Seconds Forklift inventory responses are cached, 0 disables
+vm_pool_size: int = 0  # Reusable VMware clones kept per source VM across sessions, 0 disables the pool
 tests_params: dict = {
     "test_sanity_warm_mtv_migration": {
         "virtual_machines": [
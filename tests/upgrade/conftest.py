@@ -16,6 +16,7 @@ from utilities.mtv_migration import (
     get_network_migration_map,
     get_storage_migration_map,
 )
+from utilities.resources import ResourceBatch
 from utilities.utils import populate_vm_ids
 
 if TYPE_CHECKING:
@@ -69,31 +70,36 @@ def upgrade_script_path(tmp_path_factory: pytest.TempPathFactory) -> str:
 
 
 @pytest.fixture(scope="class")
-def pre_upgrade_storage_map(
+def pre_upgrade_migration_resources(
     prepared_plan: dict[str, Any],
     fixture_store: dict[str, Any],
     ocp_admin_client: DynamicClient,
     source_provider: BaseProvider,
-    destination_provider: BaseProvider,
+    destination_provider: OCPProvider,
     source_provider_inventory: ForkliftInventory,
     target_namespace: str,
-) -> StorageMap:
-    """Create StorageMap resource for upgrade migration tests.
+    multus_network_name: dict[str, str],
+) -> dict[str, Any]:
+    """Create the StorageMap, NetworkMap and Plan for upgrade migration tests in one resource batch.
+
+    The maps are created concurrently, the Plan once both exist.
 
     Args:
         prepared_plan (dict[str, Any]): Test plan configuration with VM details.
         fixture_store (dict[str, Any]): Resource tracking dictionary.
         ocp_admin_client (DynamicClient): OpenShift admin client.
         source_provider (BaseProvider): Source provider connection.
-        destination_provider (BaseProvider): Destination provider.
+        destination_provider (OCPProvider): Destination provider.
         source_provider_inventory (ForkliftInventory): Provider inventory.
         target_namespace (str): Target namespace.
+        multus_network_name (dict[str, str]): Multus network name mapping.
 
     Returns:
-        StorageMap: The created StorageMap resource.
+        dict[str, Any]: The created resources under "storage_map", "network_map" and "plan".
     """
     vms: list[str] = [vm["name"] for vm in prepared_plan["virtual_machines"]]
-    return get_storage_migration_map(
+    batch = ResourceBatch(client=ocp_admin_client, fixture_store=fixture_store)
+    storage_map = get_storage_migration_map(
         fixture_store=fixture_store,
         source_provider=source_provider,
         destination_provider=destination_provider,
@@ -101,37 +107,9 @@ def pre_upgrade_storage_map(
         ocp_admin_client=ocp_admin_client,
         target_namespace=target_namespace,
         vms=vms,
+        batch=batch,
     )
-
-
-@pytest.fixture(scope="class")
-def pre_upgrade_network_map(
-    prepared_plan: dict[str, Any],
-    fixture_store: dict[str, Any],
-    ocp_admin_client: DynamicClient,
-    source_provider: BaseProvider,
-    destination_provider: BaseProvider,
-    source_provider_inventory: ForkliftInventory,
-    target_namespace: str,
-    multus_network_name: dict[str, str],
-) -> NetworkMap:
-    """Create NetworkMap resource for upgrade migration tests.
-
-    Args:
-        prepared_plan (dict[str, Any]): Test plan configuration with VM details.
-        fixture_store (dict[str, Any]): Resource tracking dictionary.
-        ocp_admin_client (DynamicClient): OpenShift admin client.
-        source_provider (BaseProvider): Source provider connection.
-        destination_provider (BaseProvider): Destination provider.
-        source_provider_inventory (ForkliftInventory): Provider inventory.
-        target_namespace (str): Target namespace.
-        multus_network_name (dict[str, str]): Multus network name mapping.
-
-    Returns:
-        NetworkMap: The created NetworkMap resource.
-    """
-    vms: list[str] = [vm["name"] for vm in prepared_plan["virtual_machines"]]
-    return get_network_migration_map(
+    network_map = get_network_migration_map(
         fixture_store=fixture_store,
         source_provider=source_provider,
         destination_provider=destination_provider,
@@ -140,46 +118,59 @@ def pre_upgrade_network_map(
         target_namespace=target_namespace,
         multus_network_name=multus_network_name,
         vms=vms,
+        batch=batch,
     )
-
-
-@pytest.fixture(scope="class")
-def pre_upgrade_plan_resource(
-    prepared_plan: dict[str, Any],
-    fixture_store: dict[str, Any],
-    ocp_admin_client: DynamicClient,
-    source_provider: BaseProvider,
-    destination_provider: OCPProvider,
-    source_provider_inventory: ForkliftInventory,
-    target_namespace: str,
-    pre_upgrade_storage_map: StorageMap,
-    pre_upgrade_network_map: NetworkMap,
-) -> Plan:
-    """Create MTV Plan CR resource for upgrade migration tests.
-
-    Args:
-        prepared_plan (dict[str, Any]): Test plan configuration with VM details.
-        fixture_store (dict[str, Any]): Resource tracking dictionary.
-        ocp_admin_client (DynamicClient): OpenShift admin client.
-        source_provider (BaseProvider): Source provider connection.
-        destination_provider (OCPProvider): Destination provider.
-        source_provider_inventory (ForkliftInventory): Provider inventory.
-        target_namespace (str): Target namespace.
-        pre_upgrade_storage_map (StorageMap): Storage map for the migration.
-        pre_upgrade_network_map (NetworkMap): Network map for the migration.
-
-    Returns:
-        Plan: The created Plan CR resource.
-    """
     populate_vm_ids(prepared_plan, source_provider_inventory)
-    return create_plan_resource(
+    plan = create_plan_resource(
         ocp_admin_client=ocp_admin_client,
         fixture_store=fixture_store,
         source_provider=source_provider,
         destination_provider=destination_provider,
-        storage_map=pre_upgrade_storage_map,
-        network_map=pre_upgrade_network_map,
+        storage_map=storage_map,
+        network_map=network_map,
         virtual_machines_list=prepared_plan["virtual_machines"],
         target_namespace=target_namespace,
         warm_migration=prepared_plan.get("warm_migration", False),
+        batch=batch,
     )
+    batch.deploy()
+    return {"storage_map": storage_map, "network_map": network_map, "plan": plan}
+
+
+@pytest.fixture(scope="class")
+def pre_upgrade_storage_map(pre_upgrade_migration_resources: dict[str, Any]) -> StorageMap:
+    """StorageMap resource for upgrade migration tests.
+
+    Args:
+        pre_upgrade_migration_resources (dict[str, Any]): Batch created upgrade migration resources.
+
+    Returns:
+        StorageMap: The created StorageMap resource.
+    """
+    return pre_upgrade_migration_resources["storage_map"]
+
+
+@pytest.fixture(scope="class")
+def pre_upgrade_network_map(pre_upgrade_migration_resources: dict[str, Any]) -> NetworkMap:
+    """NetworkMap resource for upgrade migration tests.
+
+    Args:
+        pre_upgrade_migration_resources (dict[str, Any]): Batch created upgrade migration resources.
+
+    Returns:
+        NetworkMap: The created NetworkMap resource.
+    """
+    return pre_upgrade_migration_resources["network_map"]
+
+
+@pytest.fixture(scope="class")
+def pre_upgrade_plan_resource(pre_upgrade_migration_resources: dict[str, Any]) -> Plan:
+    """MTV Plan CR resource for upgrade migration tests.
+
+    Args:
+        pre_upgrade_migration_resources (dict[str, Any]): Batch created upgrade migration resources.
+
+    Returns:
+        Plan: The created Plan CR resource.
+    """
+    return pre_upgrade_migration_resources["plan"]
@@ -11,10 +11,11 @@ from ocp_resources.provider import Provider
 from ocp_resources.role_binding import RoleBinding
 from ocp_resources.secret import Secret
 from ocp_resources.service_account import ServiceAccount
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from libs.providers.openshift import OCPProvider
 from utilities.resources import create_and_store_resource
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
@@ -92,7 +93,7 @@ def clusterrole_destination_ocp_provider(
     )
 
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=60,
             sleep=2,
             func=lambda: (token_secret_ref.instance.data or {}).get("token"),
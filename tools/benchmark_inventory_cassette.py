@@ -0,0 +1,90 @@
+"""Benchmark Forklift inventory helpers against a recorded inventory cassette.
+
+Record a cassette during a real run with ``--record-inventory-cassette <path>``, then replay it
+offline from the repository root:
+
+    python -m tools.benchmark_inventory_cassette <cassette> <provider_type> <provider_name> [--vms a,b] [--iterations 5]
+
+Every benchmark prints its wall time and the number of inventory requests per iteration, so both
+CPU regressions and round-trip regressions show up without a cluster.
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ocp_resources.provider import Provider
+
+from libs.forklift_inventory import ForkliftInventory, VsphereForkliftInventory, _extract_storage_ids
+from libs.inventory_cassette import create_replay_inventory
+from utilities.utils import populate_vm_ids
+
+
+def _benchmark(inventory: ForkliftInventory, func: Callable[[], Any], iterations: int) -> dict[str, float]:
+    durations: list[float] = []
+    requests_before = inventory.transport.stats["requests"]
+    for _ in range(iterations):
+        inventory.invalidate_cache()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+
+    return {
+        "min_seconds": round(min(durations), 6),
+        "avg_seconds": round(sum(durations) / iterations, 6),
+        "max_seconds": round(max(durations), 6),
+        "requests_per_iteration": (inventory.transport.stats["requests"] - requests_before) / iterations,
+    }
+
+
+def benchmark_inventory_cassette(
+    cassette_path: str, provider_type: str, provider_name: str, vms: list[str], iterations: int
+) -> dict[str, dict[str, float]]:
+    inventory = create_replay_inventory(
+        cassette_path=cassette_path, provider_type=provider_type, provider_name=provider_name
+    )
+    if not vms:
+        # Only VMs whose details were recorded can be replayed
+        recorded_paths = set(inventory.transport.paths)  # type: ignore[attr-defined]
+        vms = [
+            vm for vm in inventory.vms_names if f"{inventory.vms_path}/{inventory.get_vm_id(name=vm)}" in recorded_paths
+        ]
+
+    plan = {"virtual_machines": [{"name": vm} for vm in vms]}
+
+    benchmarks: dict[str, Callable[[], Any]] = {
+        "vms_storages_mappings": lambda: inventory.vms_storages_mappings(vms=vms),
+        "vms_networks_mappings": lambda: inventory.vms_networks_mappings(vms=vms),
+        "populate_vm_ids": lambda: populate_vm_ids(plan=plan, inventory=inventory),
+    }
+    if provider_type == Provider.ProviderType.VSPHERE and isinstance(inventory, VsphereForkliftInventory):
+        datastore_ids = sorted(_extract_storage_ids(inventory.storages))
+        benchmarks["_extract_storage_ids"] = lambda: _extract_storage_ids(inventory.storages)
+        benchmarks["wait_for_datastores"] = lambda: inventory.wait_for_datastores(
+            datastore_ids=datastore_ids, timeout=1, sleep=1
+        )
+
+    return {
+        name: _benchmark(inventory=inventory, func=func, iterations=iterations) for name, func in benchmarks.items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Forklift inventory helpers against a recorded cassette")
+    parser.add_argument("cassette", help="Path to the gzip JSONL cassette recorded with --record-inventory-cassette")
+    parser.add_argument("provider_type", help="Provider type the cassette was recorded for, e.g. vsphere")
+    parser.add_argument("provider_name", help="Provider CR name the cassette was recorded for")
+    parser.add_argument("--vms", default="", help="Comma separated VM names, defaults to every VM in the cassette")
+    parser.add_argument("--iterations", type=int, default=5, help="Iterations per benchmark")
+    args = parser.parse_args()
+
+    results = benchmark_inventory_cassette(
+        cassette_path=args.cassette,
+        provider_type=args.provider_type,
+        provider_name=args.provider_name,
+        vms=[vm for vm in args.vms.split(",") if vm],
+        iterations=args.iterations,
+    )
+    print(json.dumps(results, indent=2))
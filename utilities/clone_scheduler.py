@@ -0,0 +1,157 @@
+"""Concurrent source VM cloning for class based plans.
+
+``CloneScheduler`` submits the clones of a plan together instead of blocking on every clone task
+in turn, so a multi VM class clones in about the time of its slowest clone. Concurrency is bounded
+per provider (``BaseProvider.CLONE_CONCURRENCY``) and per clone target (datastore / ESXi host, see
+``BaseProvider.clone_targets``). Providers with ``BATCH_CLONES`` get the whole batch in one
+``get_vms_by_name`` call and await the clones themselves. When a clone fails, the clones the scheduler created so far are
+deleted and dropped from the session teardown before the failure is raised.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any
+
+from simple_logger.logger import get_logger
+
+if TYPE_CHECKING:
+    from libs.base_provider import BaseProvider
+
+LOGGER = get_logger(__name__)
+
+CLONE_TARGET_CONCURRENCY = 2
+
+
+class CloneScheduler:
+    """Clone source VMs concurrently with bounded parallelism.
+
+    Example:
+        scheduler = CloneScheduler(provider=clone_provider)
+        for vm in virtual_machines:
+            scheduler.add(query=vm["name"], vm_name_suffix=suffix, session_uuid=uuid, clone_options=vm)
+        provider_vm_apis = scheduler.run()
+
+    Args:
+        provider (BaseProvider): Provider the VMs are cloned on.
+        max_per_target (int): Concurrent clones per datastore / ESXi host.
+            Defaults to CLONE_TARGET_CONCURRENCY.
+    """
+
+    def __init__(self, provider: BaseProvider, max_per_target: int = CLONE_TARGET_CONCURRENCY) -> None:
+        self.provider = provider
+        self.max_per_target = max_per_target
+        self._target_locks: dict[str, threading.BoundedSemaphore] = {}
+        self._pending: list[dict[str, Any]] = []
+        # Teardown entries of the provider clones before the first run, every later entry is ours
+        self._teardown_start = len(self._teardown_entries)
+
+    @property
+    def _teardown_entries(self) -> list[dict[str, Any]]:
+        if not self.provider.fixture_store:
+            return []
+
+        return self.provider.fixture_store["teardown"].setdefault(self.provider.type, [])
+
+    def add(self, query: str, **kwargs: Any) -> None:
+        """Queue a VM for cloning, arguments as for the provider ``get_vm_by_name`` with ``clone_vm=True``.
+
+        Args:
+            query (str): Source VM (or template) name.
+            **kwargs (Any): vm_name_suffix, session_uuid, clone_options.
+        """
+        self._pending.append({"query": query, **kwargs})
+
+    def _target_lock(self, target: str) -> threading.BoundedSemaphore:
+        return self._target_locks.setdefault(target, threading.BoundedSemaphore(self.max_per_target))
+
+    def _clone(self, clone_kwargs: dict[str, Any], targets: list[str]) -> Any:
+        with ExitStack() as stack:
+            # Sorted acquisition, clones sharing a datastore and a host can not deadlock
+            for target in targets:
+                stack.enter_context(self._target_lock(target=target))
+
+            # Every cloning provider implements get_vm_by_name, BaseProvider does not declare it
+            return self.provider.get_vm_by_name(clone_vm=True, **clone_kwargs)  # type: ignore[attr-defined]
+
+    def run(self) -> list[Any]:
+        """Clone every VM added since the previous run and wait for all of them.
+
+        Returns:
+            list[Any]: The provider VM objects, in the order the VMs were added.
+
+        Raises:
+            Exception: The failure of the first failed clone, in the order the VMs were added,
+                after every clone of this scheduler was rolled back.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+
+        LOGGER.info(f"Cloning {', '.join(_clone['query'] for _clone in pending)} on {self.provider.type}")
+        if self.provider.BATCH_CLONES:
+            return self._run_batch(pending=pending)
+
+        for _clone in pending:
+            targets = sorted(self.provider.clone_targets(clone_options=_clone.get("clone_options") or {}))
+            _clone["targets"] = targets
+            for target in targets:
+                self._target_lock(target=target)
+
+        workers = max(1, min(len(pending), self.provider.CLONE_CONCURRENCY))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._clone,
+                    clone_kwargs={key: value for key, value in _clone.items() if key != "targets"},
+                    targets=_clone["targets"],
+                )
+                for _clone in pending
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            # Clones not started yet are dropped, the running ones finish before the rollback
+            for future in futures:
+                future.cancel()
+
+        failures = [exp for future in futures if not future.cancelled() and (exp := future.exception())]
+        if failures:
+            for exp in failures[1:]:
+                LOGGER.error(f"Clone failed: {exp}")
+
+            self.rollback()
+            raise failures[0]
+
+        return [future.result() for future in futures]
+
+    def _run_batch(self, pending: list[dict[str, Any]]) -> list[Any]:
+        vms: list[Any] | None = None
+        try:
+            # BaseProvider does not declare get_vms_by_name, every BATCH_CLONES provider implements it
+            vms = self.provider.get_vms_by_name(  # type: ignore[attr-defined]
+                vms=[{**_clone, "clone_vm": True} for _clone in pending]
+            )
+        finally:
+            if vms is None:
+                self.rollback()
+
+        return vms
+
+    def rollback(self) -> None:
+        """Delete every VM cloned by this scheduler and drop it from the session teardown.
+
+        VMs that fail to delete stay in the teardown, so session teardown retries and reports them.
+        """
+        cloned = self._teardown_entries[self._teardown_start :]
+        if not cloned:
+            return
+
+        LOGGER.warning(f"Rolling back clones {', '.join(_vm['name'] for _vm in cloned)}")
+        failures = self.provider.delete_vms(names=[_vm["name"] for _vm in cloned])
+        for _vm in cloned:
+            if exp := failures.get(_vm["name"]):
+                LOGGER.error(f"Failed to delete clone {_vm['name']} on rollback: {exp}")
+                continue
+
+            self._teardown_entries.remove(_vm)
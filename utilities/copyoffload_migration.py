@@ -23,9 +23,8 @@ from ocp_resources.pod import Pod
 from ocp_resources.plan import Plan
 from rrmngmnt import Host, RootUser, User
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
-from exceptions.exceptions import MigrationNotFoundError
 from utilities.copyoffload_constants import (
     POPULATOR_INFLIGHT_LIMIT,
     POPULATOR_THROTTLED_EVENT_REASON,
@@ -34,9 +33,10 @@ from utilities.copyoffload_constants import (
     VM_POPULATOR_INFLIGHT_LIMIT,
 )
 from utilities.copyoffload_plan_secret import wait_for_copyoffload_plan_secret
-from utilities.mtv_migration import get_migration_for_plan, wait_for_migration_complate
+from utilities.mtv_migration import MigrationPollContext, wait_for_migration_complate
 from utilities.post_migration import get_ssh_credentials_from_provider_config
 from utilities.resources import create_and_store_resource
+from utilities.waiters import BackoffSampler
 
 from libs.base_provider import BaseProvider
 from libs.providers.vmware import VMWareProvider
@@ -251,7 +251,7 @@ def merge_storage_secret_extra(
     return merged
 
 
-def _filter_and_fetch_pod_logs(populate_pods: list[Pod]) -> list[tuple[Pod, str]]:
+def _filter_and_fetch_pod_logs(ocp_admin_client: DynamicClient, populate_pods: list[Any]) -> list[tuple[Any, str]]:
     """Filter populate pods and fetch logs in a single pass.
 
     Only captures logs from pods in terminal phase (Succeeded or Failed) to ensure
@@ -263,22 +263,23 @@ def _filter_and_fetch_pod_logs(populate_pods: list[Pod]) -> list[tuple[Pod, str]
     pod could be deleted between filter check and subsequent log fetch).
 
     Args:
-        populate_pods (list[Pod]): All populate pods for a migration.
+        ocp_admin_client (DynamicClient): OpenShift admin client for reading pod logs.
+        populate_pods (list[Any]): Raw instances of all populate pods for a migration.
 
     Returns:
-        list[tuple[Pod, str]]: Tuples of (pod, log_content) for pods in terminal phase
+        list[tuple[Any, str]]: Tuples of (pod_instance, log_content) for pods in terminal phase
             with readable logs containing xcopyUsed marker or copy-offload failure.
     """
-    pods_with_logs: list[tuple[Pod, str]] = []
+    pods_with_logs: list[tuple[Any, str]] = []
     for pod in populate_pods:
-        phase = pod.instance.status.phase if pod.instance.status else "Unknown"
+        phase = pod.status.phase if pod.status else "Unknown"
 
         # Only capture from terminal pods to get final xcopyUsed value
         if phase not in ("Succeeded", "Failed"):
             continue
 
         try:
-            log_content = pod.log()
+            log_content = Pod(client=ocp_admin_client, name=pod.metadata.name, namespace=pod.metadata.namespace).log()
             # Verify logs contain xcopyUsed or copy-offload failure markers
             if _XCOPY_USED_LOG_RE.search(log_content) or _COPY_OFFLOAD_FAILED_ERR_RE.search(log_content):
                 pods_with_logs.append((pod, log_content))
@@ -288,11 +289,11 @@ def _filter_and_fetch_pod_logs(populate_pods: list[Pod]) -> list[tuple[Pod, str]
     return pods_with_logs
 
 
-def _capture_logs_from_pods(pods_with_content: list[tuple[Pod, str]]) -> list[PopulatePodLogData]:
+def _capture_logs_from_pods(pods_with_content: list[tuple[Any, str]]) -> list[PopulatePodLogData]:
     """Build log data structures from pre-fetched pod logs.
 
     Args:
-        pods_with_content (list[tuple[Pod, str]]): Tuples of (pod, log_content) with
+        pods_with_content (list[tuple[Any, str]]): Tuples of (pod_instance, log_content) with
             pre-fetched log content to avoid double-reading.
 
     Returns:
@@ -300,18 +301,84 @@ def _capture_logs_from_pods(pods_with_content: list[tuple[Pod, str]]) -> list[Po
     """
     captured_logs: list[PopulatePodLogData] = []
     for pod, log_content in pods_with_content:
-        phase = pod.instance.status.phase if pod.instance.status else "Unknown"
+        pod_name = pod.metadata.name
+        phase = pod.status.phase if pod.status else "Unknown"
+        labels = pod.metadata.labels or {}
         pod_data: PopulatePodLogData = {
-            "pod_name": pod.name,
-            "pvc_name": pod.instance.metadata.labels.get(PVC_NAME_LABEL, pod.name),
-            "source_host": pod.instance.metadata.labels.get(SOURCE_HOST_LABEL, ""),
+            "pod_name": pod_name,
+            "pvc_name": labels.get(PVC_NAME_LABEL, pod_name),
+            "source_host": labels.get(SOURCE_HOST_LABEL, ""),
             "log_content": log_content,
         }
         captured_logs.append(pod_data)
-        LOGGER.debug(f"Captured logs from populate pod '{pod.name}' (phase: {phase})")
+        LOGGER.debug(f"Captured logs from populate pod '{pod_name}' (phase: {phase})")
     return captured_logs
 
 
+def _populate_pod_instances(pods: list[Any]) -> list[Any]:
+    """Filter raw pod instances down to the populate pods.
+
+    Args:
+        pods (list[Any]): Raw pod instances of a migration.
+
+    Returns:
+        list[Any]: Raw instances of the populate pods.
+    """
+    return [pod for pod in pods if pod.metadata.name.startswith(_POPULATE_POD_NAME_PREFIX)]
+
+
+def _store_populate_pod_logs(
+    ocp_admin_client: DynamicClient,
+    populate_pods: list[Any],
+    migration_uid: str,
+    fixture_store: dict[str, Any],
+) -> None:
+    """Cache the logs of finished populate pods not already in fixture_store.
+
+    Args:
+        ocp_admin_client (DynamicClient): OpenShift admin client for reading pod logs.
+        populate_pods (list[Any]): Raw instances of the populate pods of the migration.
+        migration_uid (str): Migration UID the pods belong to.
+        fixture_store (dict[str, Any]): Fixture store for caching pod logs.
+    """
+    if not populate_pods:
+        LOGGER.debug(f"No populate pods found for migration '{migration_uid}' (non-copyoffload or not yet started)")
+        return
+
+    pods_with_logs = _filter_and_fetch_pod_logs(ocp_admin_client=ocp_admin_client, populate_pods=populate_pods)
+
+    if not pods_with_logs:
+        LOGGER.debug(
+            f"Found {len(populate_pods)} populate pod(s) for migration '{migration_uid}' "
+            f"but none are ready for log capture yet"
+        )
+        return
+
+    LOGGER.info(
+        f"Capturing logs from {len(pods_with_logs)}/{len(populate_pods)} populate pod(s) "
+        f"for migration '{migration_uid}'"
+    )
+
+    if _POPULATE_POD_LOGS_CACHE_KEY not in fixture_store:
+        fixture_store[_POPULATE_POD_LOGS_CACHE_KEY] = {}
+
+    captured_logs = _capture_logs_from_pods(pods_with_logs)
+
+    if captured_logs:
+        if migration_uid not in fixture_store[_POPULATE_POD_LOGS_CACHE_KEY]:
+            fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid] = []
+
+        existing_pod_names = {log["pod_name"] for log in fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid]}
+        new_logs = [log for log in captured_logs if log["pod_name"] not in existing_pod_names]
+
+        if new_logs:
+            fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid].extend(new_logs)
+            LOGGER.info(
+                f"Captured {len(new_logs)} new populate pod log(s) for migration '{migration_uid}' "
+                f"({len(fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid])} total)"
+            )
+
+
 def capture_populate_pod_logs(
     ocp_admin_client: DynamicClient,
     namespace: str,
@@ -336,53 +403,21 @@ def capture_populate_pod_logs(
         fixture_store (dict[str, Any]): Fixture store for caching pod logs.
     """
     try:
-        populate_pods: list[Pod] = [
-            pod
-            for pod in Pod.get(
-                client=ocp_admin_client,
-                namespace=namespace,
-                label_selector=f"migration={migration_uid}",
-            )
-            if pod.name.startswith(_POPULATE_POD_NAME_PREFIX)
-        ]
-
-        if not populate_pods:
-            LOGGER.debug(f"No populate pods found for migration '{migration_uid}' (non-copyoffload or not yet started)")
-            return
-
-        pods_with_logs = _filter_and_fetch_pod_logs(populate_pods)
-
-        if not pods_with_logs:
-            LOGGER.debug(
-                f"Found {len(populate_pods)} populate pod(s) for migration '{migration_uid}' "
-                f"but none are ready for log capture yet"
-            )
-            return
-
-        LOGGER.info(
-            f"Capturing logs from {len(pods_with_logs)}/{len(populate_pods)} populate pod(s) "
-            f"for migration '{migration_uid}'"
-        )
-
-        if _POPULATE_POD_LOGS_CACHE_KEY not in fixture_store:
-            fixture_store[_POPULATE_POD_LOGS_CACHE_KEY] = {}
-
-        captured_logs = _capture_logs_from_pods(pods_with_logs)
-
-        if captured_logs:
-            if migration_uid not in fixture_store[_POPULATE_POD_LOGS_CACHE_KEY]:
-                fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid] = []
-
-            existing_pod_names = {log["pod_name"] for log in fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid]}
-            new_logs = [log for log in captured_logs if log["pod_name"] not in existing_pod_names]
-
-            if new_logs:
-                fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid].extend(new_logs)
-                LOGGER.info(
-                    f"Captured {len(new_logs)} new populate pod log(s) for migration '{migration_uid}' "
-                    f"({len(fixture_store[_POPULATE_POD_LOGS_CACHE_KEY][migration_uid])} total)"
+        _store_populate_pod_logs(
+            ocp_admin_client=ocp_admin_client,
+            populate_pods=_populate_pod_instances(
+                pods=list(
+                    Pod.get(
+                        client=ocp_admin_client,
+                        namespace=namespace,
+                        label_selector=f"migration={migration_uid}",
+                        raw=True,
+                    )
                 )
-
+            ),
+            migration_uid=migration_uid,
+            fixture_store=fixture_store,
+        )
     except ApiException as e:
         LOGGER.warning(f"Failed to capture populate pod logs for migration '{migration_uid}': {e}")
 
@@ -392,12 +427,13 @@ def create_log_capture_callback(
     namespace: str,
     plan: Plan,
     fixture_store: dict[str, Any],
-) -> Callable[[str], None]:
+) -> Callable[[MigrationPollContext], None]:
     """Create a callback for capturing populate pod logs during migration.
 
     Returns a callback function compatible with wait_for_migration_complate's
     on_status_poll parameter. The callback captures populate pod logs when
-    migration status is EXECUTING.
+    migration status is EXECUTING, reading the populate pods from the poll context
+    so it shares one pod LIST per poll with the other callbacks.
 
     Args:
         ocp_admin_client (DynamicClient): OpenShift admin client
@@ -406,34 +442,33 @@ def create_log_capture_callback(
         fixture_store (dict[str, Any]): Fixture store for caching pod logs
 
     Returns:
-        Callable[[str], None]: Callback function that accepts migration status string
+        Callable[[MigrationPollContext], None]: Callback function that accepts the migration poll context
     """
-    cached_migration_uid: list[str] = []
 
-    def _capture(status: str) -> None:
+    def _capture(context: MigrationPollContext) -> None:
         """Capture populate pod logs for one migration status poll.
 
         Args:
-            status (str): Current migration status from migration polling.
+            context (MigrationPollContext): Snapshot of the current migration status poll.
         """
-        if status == Plan.Status.EXECUTING:
+        if context.status == Plan.Status.EXECUTING:
             try:
-                if not cached_migration_uid:
-                    migration_uid = _resolve_migration_uid(plan=plan)
-                    if migration_uid is None:
-                        return
-                    cached_migration_uid.append(migration_uid)
+                migration_uid = context.migration_uid
+                if migration_uid is None:
+                    return
 
-                capture_populate_pod_logs(
+                _store_populate_pod_logs(
                     ocp_admin_client=ocp_admin_client,
-                    namespace=namespace,
-                    migration_uid=cached_migration_uid[0],
+                    populate_pods=_populate_pod_instances(
+                        pods=context.pods(namespace=namespace, label_selector=f"migration={migration_uid}")
+                    ),
+                    migration_uid=migration_uid,
                     fixture_store=fixture_store,
                 )
             except (ApiException, ValueError) as e:
                 # ApiException: K8s API failures
-                # ValueError: Invalid migration UID from _resolve_migration_uid
-                LOGGER.debug(f"Could not capture populate pod logs during migration: {e}")
+                # ValueError: Migration CR without UID
+                LOGGER.debug(f"Could not capture populate pod logs for plan '{plan.name}' during migration: {e}")
 
     return _capture
 
@@ -521,7 +556,7 @@ def wait_for_cloud_init(
             return None
 
         try:
-            for ip in TimeoutSampler(wait_timeout=300, sleep=5, func=_get_ip):
+            for ip in BackoffSampler(wait_timeout=300, sleep=5, func=_get_ip):
                 if ip:
                     ip_address = ip
                     break
@@ -551,7 +586,7 @@ def wait_for_cloud_init(
 
         LOGGER.info(f"Waiting for {file_name} on {ip_address}...")
         try:
-            for sample in TimeoutSampler(wait_timeout=timeout, sleep=10, func=_check_file):
+            for sample in BackoffSampler(wait_timeout=timeout, sleep=10, func=_check_file):
                 if sample:
                     LOGGER.info(f"{file_name} found!")
                     break
@@ -569,7 +604,7 @@ def get_migration_uid(plan: Plan) -> str:
     """Extract the migration UID from a completed Plan's migration history.
 
     Use this for completed migrations where Plan status contains migration history.
-    For in-progress migrations, use _resolve_migration_uid() which queries the live Migration CR.
+    For in-progress migrations, use MigrationPollContext.migration_uid which reads the live Migration CR.
 
     Args:
         plan (Plan): The Plan CR resource (must have completed at least one migration).
@@ -600,30 +635,6 @@ def get_migration_uid(plan: Plan) -> str:
     return migration_ref.uid
 
 
-def _resolve_migration_uid(plan: Plan) -> str | None:
-    """Resolve migration UID from the Migration CR.
-
-    Returns None when the Migration CR is not created yet (e.g. during early migration polling).
-
-    Args:
-        plan (Plan): The Plan CR resource.
-
-    Returns:
-        str | None: Migration UID when the Migration CR exists, otherwise None.
-
-    Raises:
-        ValueError: If the Migration CR exists but has no UID.
-    """
-    try:
-        migration = get_migration_for_plan(plan=plan)
-    except MigrationNotFoundError:
-        return None
-    migration_uid = migration.instance.metadata.uid
-    if not migration_uid:
-        raise ValueError(f"Migration CR for Plan '{plan.name}' has no UID")
-    return migration_uid
-
-
 def _find_populate_pods(
     ocp_admin_client: DynamicClient,
     namespace: str,
@@ -808,9 +819,10 @@ def _collect_live_populate_logs(
     uncached_pods = [pod for pod in populate_pods if pod.name not in cached_pod_names]
 
     # Fetch logs only from terminal pods with xcopyUsed or failure markers
-    pods_with_logs: list[tuple[Pod, str]] = []
+    pods_with_logs: list[tuple[Any, str]] = []
     for pod in uncached_pods:
-        phase = pod.instance.status.phase if pod.instance.status else "Unknown"
+        pod_instance = pod.instance
+        phase = pod_instance.status.phase if pod_instance.status else "Unknown"
 
         # Only capture from terminal pods to get final xcopyUsed value
         if phase not in ("Succeeded", "Failed"):
@@ -820,7 +832,7 @@ def _collect_live_populate_logs(
             log_content = pod.log()
             # Verify logs contain xcopyUsed or copy-offload failure markers
             if _XCOPY_USED_LOG_RE.search(log_content) or _COPY_OFFLOAD_FAILED_ERR_RE.search(log_content):
-                pods_with_logs.append((pod, log_content))
+                pods_with_logs.append((pod_instance, log_content))
         except ApiException as pod_err:
             LOGGER.warning(f"Failed to read logs from live populate pod '{pod.name}': {pod_err}")
 
@@ -1080,35 +1092,24 @@ def verify_xcopy_used_per_datastore(
         )
 
 
-def _count_active_populator_pods_by_host(
-    ocp_admin_client: DynamicClient,
-    namespace: str,
-    migration_uid: str,
-) -> dict[str, int]:
+def _count_active_populator_pods_by_host(populate_pods: list[Any]) -> dict[str, int]:
     """Count active populate pods for a migration grouped by sourceHost label.
 
     Matches the populator controller's per-host throttling logic: only Running and Pending
     pods with a sourceHost label are counted.
 
     Args:
-        ocp_admin_client (DynamicClient): OpenShift admin client.
-        namespace (str): Namespace where populate pods exist.
-        migration_uid (str): Migration UID to filter populate pods by.
+        populate_pods (list[Any]): Raw instances of the populate pods of the migration.
 
     Returns:
         dict[str, int]: Active populator pod count per ESXi source host.
     """
     counts: dict[str, int] = defaultdict(int)
-    for pod in _find_populate_pods(
-        ocp_admin_client=ocp_admin_client,
-        namespace=namespace,
-        migration_uid=migration_uid,
-        require_pods=False,
-    ):
-        pod_status = pod.instance.status
+    for pod in populate_pods:
+        pod_status = pod.status
         if not pod_status or pod_status.phase not in _ACTIVE_POPULATOR_POD_PHASES:
             continue
-        labels: dict[str, str] = pod.instance.metadata.labels or {}
+        labels: dict[str, str] = pod.metadata.labels or {}
         source_host: str | None = labels.get(SOURCE_HOST_LABEL)
         if source_host:
             counts[source_host] += 1
@@ -1120,42 +1121,36 @@ class _PopulatorConcurrencyTracker:
 
     def __init__(
         self,
-        plan: Plan,
-        ocp_admin_client: DynamicClient,
         target_namespace: str,
         max_populator_inflight: int,
     ) -> None:
         """Initialize tracker state for one migration execution.
 
         Args:
-            plan (Plan): The Plan CR resource defining the migration configuration.
-            ocp_admin_client (DynamicClient): OpenShift admin client for API interactions.
             target_namespace (str): Namespace where populate pods exist.
             max_populator_inflight (int): Expected ForkliftController populator in-flight limit.
         """
-        self._plan = plan
-        self._ocp_admin_client = ocp_admin_client
         self._target_namespace = target_namespace
         self._max_populator_inflight = max_populator_inflight
-        self._migration_uid: str | None = None
         self._max_concurrent_by_host: dict[str, int] = defaultdict(int)
 
-    def poll(self, _status: str) -> None:
+    def poll(self, context: MigrationPollContext) -> None:
         """Update peak concurrency counters for one migration status poll.
 
         Args:
-            _status (str): Current migration status from ``wait_for_migration_complate``.
-        """
-        if self._migration_uid is None:
-            self._migration_uid = _resolve_migration_uid(plan=self._plan)
+            context (MigrationPollContext): Snapshot of the current migration status poll.
 
-        if self._migration_uid is None:
+        Raises:
+            ValueError: If the Migration CR exists but has no UID.
+        """
+        migration_uid = context.migration_uid
+        if migration_uid is None:
             return
 
         active_by_host = _count_active_populator_pods_by_host(
-            ocp_admin_client=self._ocp_admin_client,
-            namespace=self._target_namespace,
-            migration_uid=self._migration_uid,
+            populate_pods=_populate_pod_instances(
+                pods=context.pods(namespace=self._target_namespace, label_selector=f"migration={migration_uid}")
+            )
         )
         for source_host, active_count in active_by_host.items():
             self._max_concurrent_by_host[source_host] = max(self._max_concurrent_by_host[source_host], active_count)
@@ -1289,36 +1284,34 @@ def execute_migration_monitoring_populator_inflight(
     )
 
     tracker = _PopulatorConcurrencyTracker(
-        plan=plan,
-        ocp_admin_client=ocp_admin_client,
         target_namespace=target_namespace,
         max_populator_inflight=max_populator_inflight,
     )
 
     # Create log capture callback for test_check_xcopy_used verification
-    log_capture: Callable[[str], None] = create_log_capture_callback(
+    log_capture: Callable[[MigrationPollContext], None] = create_log_capture_callback(
         ocp_admin_client=ocp_admin_client,
         namespace=target_namespace,
         plan=plan,
         fixture_store=fixture_store,
     )
 
-    # Combine callbacks - both tracker and log capture
-    def combined_callback(status: str) -> None:
+    # Combine callbacks - both tracker and log capture, sharing the populate pod LIST of the poll context
+    def combined_callback(context: MigrationPollContext) -> None:
         """Run concurrency tracking and log capture for one migration status poll.
 
         Isolates exceptions so failure in one callback doesn't prevent the other from running.
 
         Args:
-            status (str): Current migration status from migration polling.
+            context (MigrationPollContext): Snapshot of the current migration status poll.
         """
         try:
-            tracker.poll(status)
-        except ApiException as tracker_err:
+            tracker.poll(context)
+        except (ApiException, ValueError) as tracker_err:
             LOGGER.warning(f"Populator concurrency tracking failed during poll: {tracker_err}")
 
         # log_capture already isolates its own expected failure modes internally
-        log_capture(status)
+        log_capture(context)
 
     wait_for_migration_complate(plan=plan, on_status_poll=combined_callback)
     return tracker.results
@@ -1636,8 +1629,7 @@ def _build_vm_host_map(
         ValueError: If any VM is missing a 'host' field in the inventory response.
     """
     vm_host_map: dict[str, str] = {}
-    for vm_name in vm_names:
-        vm_data = source_provider_inventory.get_vm(vm_name)
+    for vm_name, vm_data in source_provider_inventory.get_vms(names=vm_names).items():
         host = _get_vm_esxi_host(vm_data=vm_data, vm_name=vm_name)
         vm_host_map[vm_name] = host
         vm_id = vm_data.get("id")
@@ -1648,7 +1640,7 @@ def _build_vm_host_map(
 
 
 def _count_active_vms_by_host(
-    plan: Plan,
+    plan_instance: Any,
     vm_host_map: dict[str, str],
 ) -> dict[str, int]:
     """Count VMs in active disk-transfer state per ESXi host from Plan status.
@@ -1659,7 +1651,7 @@ def _count_active_vms_by_host(
     then by status id.
 
     Args:
-        plan (Plan): The Plan CR resource (read live each poll).
+        plan_instance (Any): The Plan CR instance of the current poll.
         vm_host_map (dict[str, str]): Pre-built mapping of VM name/id to ESXi host.
 
     Returns:
@@ -1669,7 +1661,7 @@ def _count_active_vms_by_host(
         ValueError: If an active VM cannot be resolved to a host in ``vm_host_map``.
     """
     counts: dict[str, int] = defaultdict(int)
-    migration_status = getattr(plan.instance.status, "migration", None)
+    migration_status = getattr(plan_instance.status, "migration", None)
     if migration_status is None:
         return {}
     for vm_status in migration_status.vms or []:
@@ -1695,30 +1687,27 @@ class _VmConcurrencyTracker:
 
     def __init__(
         self,
-        plan: Plan,
         vm_host_map: dict[str, str],
         max_vm_inflight: int,
     ) -> None:
         """Initialize tracker state for one migration execution.
 
         Args:
-            plan (Plan): The Plan CR resource defining the migration configuration.
             vm_host_map (dict[str, str]): Pre-built mapping of VM name/id to ESXi host.
             max_vm_inflight (int): Expected ForkliftController VM in-flight limit.
         """
-        self._plan = plan
         self._vm_host_map = vm_host_map
         self._max_vm_inflight = max_vm_inflight
         self._max_concurrent_by_host: dict[str, int] = defaultdict(int)
 
-    def poll(self, _status: str) -> None:
+    def poll(self, context: MigrationPollContext) -> None:
         """Update peak VM concurrency counters for one migration status poll.
 
         Args:
-            _status (str): Current migration status from ``wait_for_migration_complate``.
+            context (MigrationPollContext): Snapshot of the current migration status poll.
         """
         active_by_host = _count_active_vms_by_host(
-            plan=self._plan,
+            plan_instance=context.plan_instance,
             vm_host_map=self._vm_host_map,
         )
         for host, active_count in active_by_host.items():
@@ -1801,38 +1790,38 @@ def execute_migration_monitoring_vm_and_populator_inflight(
     )
 
     vm_tracker = _VmConcurrencyTracker(
-        plan=plan,
         vm_host_map=vm_host_map,
         max_vm_inflight=max_vm_inflight,
     )
     populator_tracker = _PopulatorConcurrencyTracker(
-        plan=plan,
-        ocp_admin_client=ocp_admin_client,
         target_namespace=target_namespace,
         max_populator_inflight=max_populator_inflight,
     )
-    log_capture: Callable[[str], None] = create_log_capture_callback(
+    log_capture: Callable[[MigrationPollContext], None] = create_log_capture_callback(
         ocp_admin_client=ocp_admin_client,
         namespace=target_namespace,
         plan=plan,
         fixture_store=fixture_store,
     )
 
-    def _combined_callback(status: str) -> None:
+    def _combined_callback(context: MigrationPollContext) -> None:
         """Run all three monitors for one migration status poll.
 
+        The monitors read the Plan instance, Migration and populate pods from the shared
+        poll context, so each poll costs one pod LIST however many monitors run.
+
         Args:
-            status (str): Current migration status from migration polling.
+            context (MigrationPollContext): Snapshot of the current migration status poll.
         """
         try:
-            vm_tracker.poll(status)
+            vm_tracker.poll(context)
         except ApiException as err:
             LOGGER.warning(f"VM concurrency tracking failed during poll: {err}")
         try:
-            populator_tracker.poll(status)
+            populator_tracker.poll(context)
         except (ApiException, ValueError) as err:
             LOGGER.warning(f"Populator concurrency tracking failed during poll: {err}")
-        log_capture(status)
+        log_capture(context)
 
     wait_for_migration_complate(plan=plan, on_status_poll=_combined_callback)
     return vm_tracker.results, populator_tracker.results
@@ -7,7 +7,9 @@ from typing import TYPE_CHECKING
 from ocp_resources.plan import Plan
 from ocp_resources.secret import Secret
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
@@ -86,7 +88,7 @@ def wait_for_plan_secret(ocp_admin_client: DynamicClient, namespace: str, plan_n
     """
     LOGGER.info("Copy-offload: waiting for Forklift to create plan-specific secret...")
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=PLAN_SECRET_WAIT_TIMEOUT,
             sleep=2,
             func=lambda: _plan_secret_exists(
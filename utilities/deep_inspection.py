@@ -18,15 +18,17 @@ from ocp_resources.pod import Pod
 from ocp_resources.resource import NotFoundError
 from ocp_resources.secret import Secret
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from exceptions.exceptions import ConversionError
 from utilities.resources import create_and_store_resource
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
     from libs.base_provider import BaseProvider
     from libs.providers.vmware import VMWareProvider
+    from utilities.mtv_migration import MigrationPollContext
 
 LOGGER = get_logger(name=__name__)
 
@@ -160,7 +162,7 @@ def wait_for_conversion_phase(conversion: Conversion, phase: str, timeout: int)
     last_phase = ""
 
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=timeout,
             sleep=3,
             func=lambda: conversion.instance.status,
@@ -211,7 +213,7 @@ def wait_for_di_snapshot(
     """
     vm = source_provider.get_vm_by_name(query=vm_name)
     try:
-        for snapshots in TimeoutSampler(
+        for snapshots in BackoffSampler(
             wait_timeout=timeout,
             sleep=5,
             func=lambda: [s for s in source_provider.list_snapshots(vm) if s.name == DI_SNAPSHOT_NAME],
@@ -292,7 +294,7 @@ def wait_for_conversion_complete(conversion: Conversion, timeout: int) -> None:
     last_stage = ""
 
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=timeout,
             sleep=5,
             func=lambda: conversion.instance.status,
@@ -444,7 +446,7 @@ def wait_for_critical_conditions(
     critical: list[Any] = []
 
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=timeout,
             sleep=3,
             func=lambda: conversion.instance.status,
@@ -519,7 +521,7 @@ def wait_for_conversion_pods(
         )
 
     try:
-        for pods in TimeoutSampler(
+        for pods in BackoffSampler(
             wait_timeout=timeout,
             sleep=3,
             func=_poll,
@@ -549,7 +551,7 @@ def wait_for_conversion_pods_cleanup(
         AssertionError: If pods are still present after timeout.
     """
     try:
-        for pods in TimeoutSampler(
+        for pods in BackoffSampler(
             wait_timeout=timeout,
             sleep=5,
             func=lambda: list(
@@ -596,7 +598,7 @@ def wait_for_di_snapshot_cleanup(
     """
     vm = source_provider.get_vm_by_name(query=vm_name)
     try:
-        for snapshots in TimeoutSampler(
+        for snapshots in BackoffSampler(
             wait_timeout=timeout,
             sleep=10,
             func=lambda: [s for s in source_provider.list_snapshots(vm) if s.name == DI_SNAPSHOT_NAME],
@@ -615,19 +617,20 @@ def wait_for_di_snapshot_cleanup(
 def create_di_capture_callback(
     plan: Plan,
     fixture_store: dict[str, Any],
-) -> Callable[[str], None]:
+) -> Callable[[MigrationPollContext], None]:
     """Create callback that captures DI CR results into fixture_store during migration.
 
     Returns a callback compatible with wait_for_migration_complate's on_status_poll.
     Accumulates per-VM DI results across polls so that multi-VM plans where VMs
-    finish DI at different times are all captured.
+    finish DI at different times are all captured. Conversion CRs are read from
+    the poll context, shared with the other callbacks of the poll.
 
     Args:
         plan (Plan): Plan CR whose DI CRs to capture.
         fixture_store (dict[str, Any]): Store where captured data is saved under DI_RESULTS_KEY.
 
     Returns:
-        Callable[[str], None]: Callback that accepts migration status string.
+        Callable[[MigrationPollContext], None]: Callback that accepts the migration poll context.
     """
 
     fixture_store.pop(DI_RESULTS_KEY, None)
@@ -636,46 +639,47 @@ def create_di_capture_callback(
     captured_vm_names: set[str] = set()
     was_executing = False
 
-    def _try_capture() -> None:
-        """Query DI CRs and capture any newly-Succeeded results."""
+    def _try_capture(context: MigrationPollContext) -> None:
+        """Query DI CRs and capture any newly-Succeeded results.
+
+        Args:
+            context (MigrationPollContext): Snapshot of the current migration status poll.
+        """
         try:
-            conversions = get_plan_conversion_crs(plan_resource=plan, conversion_type=CONVERSION_TYPE_DEEP_INSPECTION)
+            conversions = context.conversions(conversion_type=CONVERSION_TYPE_DEEP_INSPECTION)
         except NotFoundError:
             LOGGER.debug(f"Plan or Conversion CR not found during DI capture for plan '{plan.name}'")
             return
 
         new_results = []
         for conv in conversions:
-            try:
-                vm_name = (conv.instance.spec.vm or {}).get("name", conv.name)
-                if vm_name in captured_vm_names:
-                    continue
-                conv_status = conv.instance.status
-                if not conv_status or conv_status.get("phase") != Conversion.Status.SUCCEEDED:
-                    continue
-                new_results.append({
-                    "vm_name": vm_name,
-                    "inspectionResult": dict(conv_status.get("inspectionResult") or {}),
-                })
-                captured_vm_names.add(vm_name)
-            except NotFoundError:
-                LOGGER.debug(f"Conversion CR '{conv.name}' disappeared during DI capture, skipping")
+            vm_name = (conv.spec.vm or {}).get("name", conv.metadata.name)
+            if vm_name in captured_vm_names:
+                continue
+            conv_status = conv.status
+            if not conv_status or conv_status.get("phase") != Conversion.Status.SUCCEEDED:
+                continue
+            new_results.append({
+                "vm_name": vm_name,
+                "inspectionResult": dict(conv_status.get("inspectionResult") or {}),
+            })
+            captured_vm_names.add(vm_name)
 
         if new_results:
             fixture_store.setdefault(DI_RESULTS_KEY, []).extend(new_results)
             LOGGER.info(f"Captured DI results for {len(new_results)} VM(s) from plan '{plan.name}'")
 
-    def _capture(status: str) -> None:
+    def _capture(context: MigrationPollContext) -> None:
         """Capture DI CR results for one migration status poll.
 
         Args:
-            status (str): Current migration status from migration polling.
+            context (MigrationPollContext): Snapshot of the current migration status poll.
         """
         nonlocal last_poll_time, was_executing
 
-        if status != Plan.Status.EXECUTING:
+        if context.status != Plan.Status.EXECUTING:
             if was_executing:
-                _try_capture()
+                _try_capture(context)
                 was_executing = False
             return
 
@@ -685,7 +689,7 @@ def create_di_capture_callback(
             return
         last_poll_time = now
 
-        _try_capture()
+        _try_capture(context)
 
     return _capture
 
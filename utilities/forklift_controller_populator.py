@@ -14,9 +14,10 @@ from ocp_resources.deployment import Deployment
 from ocp_resources.forklift_controller import ForkliftController
 from ocp_resources.resource import ResourceEditor
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from utilities.copyoffload_constants import FORKLIFT_CONTROLLER_NAME
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
@@ -155,7 +156,7 @@ def wait_for_populator_inflight_deployment(
         return get_populator_inflight_from_deployment(deployment=current_deployment) == expected_value
 
     try:
-        for ready in TimeoutSampler(
+        for ready in BackoffSampler(
             wait_timeout=FORKLIFT_CONTROLLER_CONDITION_TIMEOUT,
             sleep=2,
             func=_deployment_ready_with_limit,
@@ -447,7 +448,7 @@ def wait_for_vm_inflight_deployment(
         return get_vm_inflight_from_deployment(deployment=current_deployment) == expected_value
 
     try:
-        for ready in TimeoutSampler(
+        for ready in BackoffSampler(
             wait_timeout=FORKLIFT_CONTROLLER_CONDITION_TIMEOUT,
             sleep=2,
             func=_deployment_ready_with_limit,
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
     from ocp_resources.plan import Plan
 
+    from utilities.resources import ResourceBatch
+
 LOGGER = get_logger(__name__)
 
 # Predefined hook playbooks for testing (base64 encoded Ansible playbooks)
@@ -137,6 +139,7 @@ def create_hook_for_plan(
     fixture_store: dict[str, Any],
     ocp_admin_client: "DynamicClient",
     target_namespace: str,
+    batch: ResourceBatch | None = None,
 ) -> tuple[str, str]:
     """Create a Hook CR based on plan configuration.
 
@@ -147,6 +150,7 @@ def create_hook_for_plan(
         fixture_store (dict[str, Any]): Fixture store for resource tracking
         ocp_admin_client (DynamicClient): OpenShift admin client
         target_namespace (str): Namespace to create hook in
+        batch (ResourceBatch | None): Add the Hook to this batch instead of creating it now
 
     Returns:
         tuple[str, str]: Tuple of (hook_name, hook_namespace)
@@ -177,14 +181,16 @@ def create_hook_for_plan(
         LOGGER.info(f"Using predefined {hook_type} hook playbook for expected_result='{expected_result}'")
 
     # Create the Hook CR
-    hook = create_and_store_resource(
-        client=ocp_admin_client,
-        fixture_store=fixture_store,
-        resource=Hook,
-        namespace=target_namespace,
-        playbook=playbook,
-        image="quay.io/konveyor/hook-runner:latest",
-    )
+    hook_kwargs: dict[str, Any] = {
+        "resource": Hook,
+        "namespace": target_namespace,
+        "playbook": playbook,
+        "image": "quay.io/konveyor/hook-runner:latest",
+    }
+    if batch is not None:
+        hook = batch.add(**hook_kwargs)
+    else:
+        hook = create_and_store_resource(client=ocp_admin_client, fixture_store=fixture_store, **hook_kwargs)
 
     return hook.name, hook.namespace
 
@@ -312,6 +318,7 @@ def create_hook_if_configured(
     fixture_store: dict[str, Any],
     ocp_admin_client: "DynamicClient",
     target_namespace: str,
+    batch: ResourceBatch | None = None,
 ) -> None:
     """Create hook if configured in plan and store references.
 
@@ -322,6 +329,7 @@ def create_hook_if_configured(
         fixture_store (dict[str, Any]): Fixture store for resource tracking
         ocp_admin_client (DynamicClient): OpenShift client
         target_namespace (str): Target namespace for hook creation
+        batch (ResourceBatch | None): Add the Hook to this batch instead of creating it now
     """
     hook_config = plan.get(hook_key)
     if hook_config:
@@ -331,6 +339,7 @@ def create_hook_if_configured(
             fixture_store=fixture_store,
             ocp_admin_client=ocp_admin_client,
             target_namespace=target_namespace,
+            batch=batch,
         )
         plan[f"_{hook_type}_hook_name"] = hook_name
         plan[f"_{hook_type}_hook_namespace"] = hook_namespace
@@ -0,0 +1,210 @@
+"""Per VM migration pipeline timelines.
+
+The Plan CR ``status.migration.vms[].pipeline`` carries start/complete timestamps and progress of
+every pipeline step (DiskTransfer, ImageConversion, VirtualMachineCreation, ...). The migration
+waiters feed every Plan instance they see to a ``MigrationTimelineRecorder``; at session end each
+plan timeline is written as JSON and CSV under the data collector path, next to a per step
+aggregate of the whole session.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+TIMELINE_CSV_FIELDS = (
+    "plan",
+    "vm",
+    "step",
+    "phase",
+    "started",
+    "completed",
+    "duration_seconds",
+    "progress_completed",
+    "progress_total",
+    "unit",
+)
+
+
+def _parse_timestamp(timestamp: str | None) -> datetime | None:
+    return datetime.fromisoformat(timestamp) if timestamp else None
+
+
+def _duration_seconds(started: str | None, completed: str | None) -> float | None:
+    """Seconds between two CR timestamps, up to now for a step that is still running."""
+    if not (_started := _parse_timestamp(started)):
+        return None
+
+    _completed = _parse_timestamp(completed) or datetime.now(tz=timezone.utc)
+    return round((_completed - _started).total_seconds(), 3)
+
+
+class MigrationTimelineRecorder:
+    """Latest pipeline snapshot of every VM of one Plan."""
+
+    def __init__(self, plan_name: str, plan_namespace: str) -> None:
+        self.plan_name = plan_name
+        self.plan_namespace = plan_namespace
+        self._lock = threading.Lock()
+        self._vms: dict[str, dict[str, Any]] = {}
+
+    def record(self, plan_instance: Any) -> None:
+        """Snapshot the VM pipelines of a Plan instance.
+
+        Args:
+            plan_instance (Any): Plan resource instance, from a GET, LIST or watch event.
+        """
+        status = plan_instance.status
+        migration = status.migration if status else None
+        if not (migration and migration.vms):
+            return
+
+        with self._lock:
+            for vm in migration.vms:
+                self._vms[vm.name or vm.id] = vm.to_dict()
+
+    @property
+    def timeline(self) -> dict[str, Any]:
+        """Per VM pipeline steps with their durations."""
+        with self._lock:
+            vms = dict(self._vms)
+
+        return {
+            "plan": self.plan_name,
+            "namespace": self.plan_namespace,
+            "vms": {
+                vm_name: {
+                    "phase": vm.get("phase", ""),
+                    "started": vm.get("started"),
+                    "completed": vm.get("completed"),
+                    "duration_seconds": _duration_seconds(vm.get("started"), vm.get("completed")),
+                    "steps": [
+                        {
+                            "step": step.get("name", ""),
+                            "phase": step.get("phase", ""),
+                            "started": step.get("started"),
+                            "completed": step.get("completed"),
+                            "duration_seconds": _duration_seconds(step.get("started"), step.get("completed")),
+                            "progress_completed": (step.get("progress") or {}).get("completed"),
+                            "progress_total": (step.get("progress") or {}).get("total"),
+                            "unit": (step.get("annotations") or {}).get("unit", ""),
+                        }
+                        for step in vm.get("pipeline") or []
+                    ],
+                }
+                for vm_name, vm in vms.items()
+            },
+        }
+
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        """Flat per VM per step rows, the CSV layout."""
+        timeline = self.timeline
+        return [
+            {"plan": self.plan_name, "vm": vm_name, **step}
+            for vm_name, vm in timeline["vms"].items()
+            for step in vm["steps"]
+        ]
+
+    def export(self, directory: Path) -> None:
+        """Write the plan timeline as ``<plan>.json`` and ``<plan>.csv``.
+
+        Args:
+            directory (Path): Target directory.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"{self.plan_name}.json", "w") as fd:
+            json.dump(self.timeline, fd, indent=2)
+
+        _write_csv(path=directory / f"{self.plan_name}.csv", rows=self.rows)
+
+
+def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
+    with open(path, "w", newline="") as fd:
+        writer = csv.DictWriter(fd, fieldnames=TIMELINE_CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+class MigrationTimelineRegistry:
+    """Session wide timeline recorders, one per Plan."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._recorders: dict[tuple[str, str], MigrationTimelineRecorder] = {}
+
+    def recorder(self, plan_name: str, plan_namespace: str) -> MigrationTimelineRecorder:
+        """Get or create the recorder of a Plan."""
+        with self._lock:
+            return self._recorders.setdefault(
+                (plan_namespace, plan_name),
+                MigrationTimelineRecorder(plan_name=plan_name, plan_namespace=plan_namespace),
+            )
+
+    def record(self, plan_instance: Any) -> None:
+        """Snapshot the VM pipelines of a Plan instance into the recorder of that Plan.
+
+        Args:
+            plan_instance (Any): Plan resource instance, from a GET, LIST or watch event.
+        """
+        self.recorder(plan_name=plan_instance.metadata.name, plan_namespace=plan_instance.metadata.namespace).record(
+            plan_instance=plan_instance
+        )
+
+    @property
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per pipeline step duration statistics over every recorded VM of the session."""
+        with self._lock:
+            recorders = list(self._recorders.values())
+
+        durations: dict[str, list[float]] = {}
+        for recorder in recorders:
+            for row in recorder.rows:
+                if row["completed"] and row["duration_seconds"] is not None:
+                    durations.setdefault(row["step"], []).append(row["duration_seconds"])
+
+        return {
+            step: {
+                "count": len(_durations),
+                "total_seconds": round(sum(_durations), 3),
+                "avg_seconds": round(sum(_durations) / len(_durations), 3),
+                "max_seconds": max(_durations),
+            }
+            for step, _durations in sorted(durations.items())
+        }
+
+    def export(self, directory: Path, suffix: str = "") -> None:
+        """Write every plan timeline plus the session aggregate.
+
+        Args:
+            directory (Path): Target directory.
+            suffix (str): Suffix of the aggregate file names, e.g. the xdist worker id.
+        """
+        with self._lock:
+            recorders = [recorder for recorder in self._recorders.values() if recorder.timeline["vms"]]
+
+        if not recorders:
+            return
+
+        LOGGER.info(f"Write migration timelines of {len(recorders)} plans to {directory}")
+        for recorder in recorders:
+            recorder.export(directory=directory)
+
+        with open(directory / f"summary{suffix}.json", "w") as fd:
+            json.dump(self.summary, fd, indent=2)
+
+        _write_csv(
+            path=directory / f"timelines{suffix}.csv",
+            rows=[row for recorder in recorders for row in recorder.rows],
+        )
+
+
+MIGRATION_TIMELINES = MigrationTimelineRegistry()
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import threading
+import time
 from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+import urllib3
+from kubernetes.dynamic.exceptions import ApiException
+from ocp_resources.conversion import Conversion
 from ocp_resources.migration import Migration
 from ocp_resources.network_map import NetworkMap
 from ocp_resources.plan import Plan
+from ocp_resources.pod import Pod
 from ocp_resources.storage_map import StorageMap
 from pytest_testconfig import py_config
 from simple_logger.logger import get_logger
@@ -21,7 +27,9 @@ from exceptions.exceptions import (
 from libs.base_provider import BaseProvider
 from libs.forklift_inventory import ForkliftInventory
 from libs.providers.openshift import OCPProvider
-from utilities.resources import create_and_store_resource
+from utilities.migration_timeline import MIGRATION_TIMELINES
+from utilities.resources import ResourceBatch, create_and_store_resource
+from utilities.transfer_throughput import TRANSFER_THROUGHPUT
 from utilities.utils import gen_network_map_list
 
 if TYPE_CHECKING:
@@ -29,6 +37,12 @@ if TYPE_CHECKING:
 
 LOGGER = get_logger(__name__)
 
+PLAN_WATCH_TIMEOUT = 60
+PLAN_WATCH_RESYNC_INTERVAL = 300
+
+MIGRATIONS_ALL_SUCCEEDED = "all-succeeded"
+MIGRATIONS_ALL_EXECUTING = "all-executing"
+
 
 def get_migration_for_plan(plan: Plan) -> Migration:
     """Find Migration CR for Plan.
@@ -148,6 +162,7 @@ def create_plan_resource(
     xfs_compatibility: bool = False,
     run_preflight_inspection: bool | None = None,
     rdm_as_lun: bool | None = None,
+    batch: ResourceBatch | None = None,
 ) -> Plan:
     """Create MTV Plan CR resource.
 
@@ -188,9 +203,11 @@ def create_plan_resource(
             Defaults to None (forklift default: True).
         rdm_as_lun (bool | None): Whether to map RDM disks as LUN devices with SCSI bus
             on the target VM. Only applies to vSphere source providers. Defaults to None.
+        batch (ResourceBatch | None): Add the Plan to this batch, after the maps when they are part of it,
+            instead of creating it now. It is created and waited for Ready by ``batch.deploy()``. Defaults to None.
 
     Returns:
-        Plan: The created Plan CR resource.
+        Plan: The created Plan CR resource, not created yet when ``batch`` is given.
 
     Raises:
         ValueError: If source_provider or destination_provider ocp_resource is not set.
@@ -271,14 +288,28 @@ def create_plan_resource(
     if run_preflight_inspection is not None:
         plan_kwargs["run_preflight_inspection"] = run_preflight_inspection
 
+    def _log_plan_not_ready(plan: Plan) -> None:
+        LOGGER.error(f"Plan {plan.name} failed to reach status {Plan.Condition.Status.TRUE}\n\t{plan.instance}")
+        LOGGER.error(f"Source provider: {source_provider.ocp_resource.instance}")
+        LOGGER.error(f"Destination provider: {destination_provider.ocp_resource.instance}")
+
+    if batch is not None:
+        for key in ("client", "fixture_store", "test_name"):
+            plan_kwargs.pop(key, None)
+
+        return batch.add(
+            depends_on=[_map for _map in (storage_map, network_map) if _map in batch],
+            ready_condition=Plan.Condition.READY,
+            on_timeout=_log_plan_not_ready,
+            **plan_kwargs,
+        )
+
     plan = create_and_store_resource(**plan_kwargs)
 
     try:
         plan.wait_for_condition(condition=Plan.Condition.READY, status=Plan.Condition.Status.TRUE, timeout=360)
     except TimeoutExpiredError:
-        LOGGER.error(f"Plan {plan.name} failed to reach status {Plan.Condition.Status.TRUE}\n\t{plan.instance}")
-        LOGGER.error(f"Source provider: {source_provider.ocp_resource.instance}")
-        LOGGER.error(f"Destination provider: {destination_provider.ocp_resource.instance}")
+        _log_plan_not_ready(plan=plan)
         raise
 
     return plan
@@ -290,7 +321,7 @@ def execute_migration(
     plan: Plan,
     target_namespace: str,
     cut_over: datetime | None = None,
-    on_status_poll: Callable[[str], None] | None = None,
+    on_status_poll: Callable[[MigrationPollContext], None] | None = None,
 ) -> None:
     """Create Migration CR and wait for completion.
 
@@ -306,8 +337,8 @@ def execute_migration(
         plan (Plan): The Plan CR resource defining the migration configuration.
         target_namespace (str): Target namespace for the Migration CR.
         cut_over (datetime | None): Cut-over datetime for warm migration. Defaults to None.
-        on_status_poll (Callable[[str], None] | None): Optional callback invoked on each poll
-            with the current migration status string.
+        on_status_poll (Callable[[MigrationPollContext], None] | None): Optional callback invoked on each
+            poll with the MigrationPollContext of the poll.
 
     Raises:
         MigrationPlanExecError: If migration fails or times out.
@@ -351,7 +382,27 @@ def get_plan_migration_status(plan: Plan) -> str:
     Raises:
         None
     """
-    status = plan.instance.status
+    if terminal_status := _get_plan_terminal_status(plan_instance=plan.instance):
+        return terminal_status
+
+    # Check if Migration CR exists to confirm execution
+    try:
+        get_migration_for_plan(plan)
+        return Plan.Status.EXECUTING
+    except MigrationNotFoundError:
+        return ""
+
+
+def _get_plan_terminal_status(plan_instance: Any) -> str:
+    """Get the terminal migration status from the Plan conditions.
+
+    Args:
+        plan_instance (Any): The Plan resource instance.
+
+    Returns:
+        str: "Succeeded" or "Failed", or empty string while the migration is not finished.
+    """
+    status = plan_instance.status
     if not status:
         return ""
 
@@ -364,119 +415,513 @@ def get_plan_migration_status(plan: Plan) -> str:
                 if cond_type in (Plan.Status.SUCCEEDED, Plan.Status.FAILED):
                     return cond_type
 
-    # Check if Migration CR exists to confirm execution
-    try:
-        get_migration_for_plan(plan)
-        return Plan.Status.EXECUTING
-    except MigrationNotFoundError:
-        return ""
+    return ""
+
+
+class MigrationPollContext:
+    """Snapshot of one migration status poll, shared by every ``on_status_poll`` callback.
+
+    The migration waiters build one context per plan and poll tick and pass it to the callbacks,
+    so any number of observers costs the API traffic of one: the Plan instance comes from the
+    waiter, and the Migration and every LIST are fetched on first access and cached for the tick.
+    The Migration and its UID never change during a wait and are carried over from ``previous``.
+
+    Resources are LISTed raw, items are ResourceInstances and no per item GET is issued.
+
+    Args:
+        plan (Plan): The polled Plan.
+        status (str): Migration status of the plan at this poll.
+        plan_instance (Any): Plan instance seen by the waiter, fetched on first access when None.
+        previous (MigrationPollContext | None): Context of the previous poll of the same plan.
+    """
+
+    def __init__(
+        self,
+        plan: Plan,
+        status: str,
+        plan_instance: Any = None,
+        previous: MigrationPollContext | None = None,
+    ) -> None:
+        self.plan = plan
+        self.status = status
+        self._plan_instance = plan_instance
+        self._migration: Any = previous._migration if previous else None
+        self._resources: dict[tuple[str, str, str], list[Any]] = {}
+
+    @property
+    def plan_instance(self) -> Any:
+        if self._plan_instance is None:
+            self._plan_instance = self.plan.instance
+
+        return self._plan_instance
+
+    @property
+    def migration(self) -> Any:
+        """Migration instance owned by the plan, None until the Migration CR is created."""
+        if self._migration is None:
+            self._migration = next(
+                (
+                    migration
+                    for migration in _list_namespace_resources(resource=Migration, plan=self.plan)
+                    if any(
+                        owner_ref.get("kind") == "Plan" and owner_ref.get("name") == self.plan.name
+                        for owner_ref in migration.metadata.ownerReferences or []
+                    )
+                ),
+                None,
+            )
+
+        return self._migration
+
+    @property
+    def migration_uid(self) -> str | None:
+        """UID of the plan Migration CR, None until it is created.
+
+        Raises:
+            ValueError: If the Migration CR exists but has no UID.
+        """
+        if (migration := self.migration) is None:
+            return None
+
+        if not migration.metadata.uid:
+            raise ValueError(f"Migration CR for Plan '{self.plan.name}' has no UID")
+
+        return migration.metadata.uid
+
+    def resources(self, resource: type[Pod] | type[Conversion], namespace: str, label_selector: str) -> list[Any]:
+        """LIST resources by label once per tick.
+
+        Args:
+            resource (type[Pod] | type[Conversion]): Resource class to list.
+            namespace (str): Namespace to list in.
+            label_selector (str): Label selector of the LIST.
+
+        Returns:
+            list[Any]: Raw resource instances.
+        """
+        key = (resource.kind, namespace, label_selector)
+        if key not in self._resources:
+            self._resources[key] = list(
+                resource.get(client=self.plan.client, namespace=namespace, label_selector=label_selector, raw=True)
+            )
+
+        return self._resources[key]
+
+    def pods(self, namespace: str, label_selector: str) -> list[Any]:
+        """Pods matching a label selector, e.g. the populate pods ``migration=<uid>`` of the target namespace."""
+        return self.resources(resource=Pod, namespace=namespace, label_selector=label_selector)
+
+    def conversions(self, conversion_type: str = "") -> list[Any]:
+        """Conversion CRs created by the plan, optionally of one conversion type."""
+        label_selector = f"plan={self.plan_instance.metadata.uid}"
+        if conversion_type:
+            label_selector += f",conversion-type={conversion_type}"
+
+        return self.resources(
+            resource=Conversion, namespace=self.plan_instance.metadata.namespace, label_selector=label_selector
+        )
+
+
+class PlanStatusWatcher:
+    """Plan migration status kept current by a Plan watch instead of GET polling.
+
+    A background thread watches the Plan from the last seen resourceVersion and updates
+    ``status`` on every event, so readers never hit the API. The status is resynced with a
+    GET every ``resync_interval`` seconds and whenever the watch fails or its resourceVersion
+    expired. The Migration CR lookup that confirms execution only runs until it succeeds.
+    Every Plan instance seen is passed to ``on_plan_instance``.
+
+    Use as a context manager so the watch thread is stopped when the wait is over.
+    """
+
+    def __init__(
+        self,
+        plan: Plan,
+        watch_timeout: int = PLAN_WATCH_TIMEOUT,
+        resync_interval: int = PLAN_WATCH_RESYNC_INTERVAL,
+        on_plan_instance: Callable[[Any], None] | None = None,
+    ) -> None:
+        self.plan = plan
+        self.on_plan_instance = on_plan_instance
+        self.watch_timeout = watch_timeout
+        self.resync_interval = resync_interval
+        self.resource_version = ""
+        self.plan_instance: Any = None
+        self._status = ""
+        self._returned_status = ""
+        self._migration_found = False
+        self._last_resync = 0.0
+        self._changed = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"plan-watch-{plan.name}", daemon=True)
+
+    def __enter__(self) -> PlanStatusWatcher:
+        try:
+            self._resync()
+        except ApiException as exp:
+            LOGGER.warning(f"Plan '{self.plan.name}' initial status sync failed, the watch thread retries: {exp}")
+
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        # The thread exits on its next event or watch timeout, it is a daemon so nothing waits for it
+        self._stop.set()
+
+    @property
+    def status(self) -> str:
+        """Current migration status, falls back to polling if the watch thread died."""
+        if self._thread.ident is not None and not self._thread.is_alive() and not self._stop.is_set():
+            # A GET keeps plan_instance current too, readers of it rely on it like on the status
+            self._resync()
+
+        with self._changed:
+            return self._status
+
+    def next_status(self, timeout: float = 1) -> str:
+        """Wait until the status changes or ``timeout`` seconds pass.
+
+        Args:
+            timeout (float): Maximum seconds to wait for a status transition.
+
+        Returns:
+            str: The current migration status.
+        """
+        if not self._thread.is_alive():
+            time.sleep(timeout)
+            return self.status
+
+        with self._changed:
+            self._changed.wait_for(predicate=lambda: self._status != self._returned_status, timeout=timeout)
+            self._returned_status = self._status
+            return self._status
+
+    def _update(self, plan_instance: Any) -> None:
+        self.plan_instance = plan_instance
+        self.resource_version = plan_instance.metadata.resourceVersion
+        if self.on_plan_instance is not None:
+            # A failing observer must not stop the watch
+            try:
+                self.on_plan_instance(plan_instance)
+            except (ApiException, urllib3.exceptions.HTTPError, AttributeError, KeyError, TypeError, ValueError) as exp:
+                LOGGER.error(f"Plan '{self.plan.name}' instance callback failed: {exp}")
+
+        status = _get_plan_terminal_status(plan_instance=plan_instance)
+        if not status and not self._migration_found:
+            try:
+                get_migration_for_plan(self.plan)
+                self._migration_found = True
+            except MigrationNotFoundError:
+                pass
+            except (ApiException, urllib3.exceptions.HTTPError) as exp:
+                LOGGER.warning(f"Plan '{self.plan.name}' Migration CR lookup failed, retrying on the next event: {exp}")
+
+        if not status and self._migration_found:
+            status = Plan.Status.EXECUTING
+
+        with self._changed:
+            if status != self._status:
+                self._status = status
+                self._changed.notify_all()
+
+    def _resync(self) -> None:
+        self._update(plan_instance=self.plan.instance)
+        self._last_resync = time.monotonic()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if not self.resource_version or time.monotonic() - self._last_resync >= self.resync_interval:
+                    self._resync()
+
+                for event in self.plan.watcher(timeout=self.watch_timeout, resource_version=self.resource_version):
+                    if self._stop.is_set():
+                        return
+
+                    # ERROR events carry a Status object, e.g. 410 Gone once the resourceVersion expired
+                    if event["type"] == "ERROR":
+                        LOGGER.debug(f"Plan '{self.plan.name}' watch error, resyncing: {event['raw_object']}")
+                        self.resource_version = ""
+                        break
+
+                    self._update(plan_instance=event["object"])
+
+            except (ApiException, urllib3.exceptions.HTTPError) as exp:
+                LOGGER.warning(f"Plan '{self.plan.name}' watch failed, resyncing: {exp}")
+                self.resource_version = ""
+                self._stop.wait(timeout=1)
 
 
 def wait_for_migration_complate(
     plan: Plan,
     *,
-    on_status_poll: Callable[[str], None] | None = None,
+    on_status_poll: Callable[[MigrationPollContext], None] | None = None,
 ) -> None:
     """Wait for migration to complete.
 
     Args:
         plan (Plan): The Plan resource to monitor
-        on_status_poll (Callable[[str], None] | None): Optional callback invoked on each poll
-            with the current migration status string
+        on_status_poll (Callable[[MigrationPollContext], None] | None): Optional callback invoked on each poll
+            with the MigrationPollContext of the poll
 
     Raises:
         MigrationPlanExecError: If migration fails or doesn't reach expected condition within timeout
     """
     try:
         last_status: str = ""
+        context: MigrationPollContext | None = None
+
+        with PlanStatusWatcher(plan=plan, on_plan_instance=MIGRATION_TIMELINES.record) as watcher:
+            # next_status returns on every transition and at least once a second for on_status_poll
+            for sample in TimeoutSampler(
+                func=watcher.next_status,
+                sleep=0,
+                wait_timeout=py_config["plan_wait_timeout"],
+            ):
+                if sample != last_status:
+                    LOGGER.info(f"Plan '{plan.name}' migration status: '{sample}'")
+                    last_status = sample
+
+                TRANSFER_THROUGHPUT.sample(plan_instance=watcher.plan_instance)
+                if on_status_poll is not None:
+                    context = MigrationPollContext(
+                        plan=plan, status=sample, plan_instance=watcher.plan_instance, previous=context
+                    )
+                    on_status_poll(context)
 
-        for sample in TimeoutSampler(
-            func=get_plan_migration_status,
-            sleep=1,
-            wait_timeout=py_config["plan_wait_timeout"],
-            plan=plan,
-        ):
-            if sample != last_status:
-                LOGGER.info(f"Plan '{plan.name}' migration status: '{sample}'")
-                last_status = sample
-
-            if on_status_poll is not None:
-                on_status_poll(sample)
-
-            if sample == Plan.Status.SUCCEEDED:
-                return
+                if sample == Plan.Status.SUCCEEDED:
+                    return
 
-            elif sample == Plan.Status.FAILED:
-                raise MigrationPlanExecError()
+                elif sample == Plan.Status.FAILED:
+                    raise MigrationPlanExecError()
 
     except (TimeoutExpiredError, MigrationPlanExecError):
         raise MigrationPlanExecError(
             f"Plan {plan.name} failed to reach the expected condition. \nstatus:\n\t{plan.instance}"
         )
 
+    finally:
+        TRANSFER_THROUGHPUT.finish(plan=plan)
+
 
 def wait_for_dual_migration_completion(
     plan_1: Plan,
     plan_2: Plan,
-    callback_1: Callable[[str], None],
-    callback_2: Callable[[str], None],
+    callback_1: Callable[[MigrationPollContext], None],
+    callback_2: Callable[[MigrationPollContext], None],
 ) -> None:
     """Poll two migration plans until both complete, invoking callbacks on each poll.
 
     Args:
         plan_1 (Plan): First migration plan to monitor.
         plan_2 (Plan): Second migration plan to monitor.
-        callback_1 (Callable[[str], None]): Status callback for plan 1.
-        callback_2 (Callable[[str], None]): Status callback for plan 2.
+        callback_1 (Callable[[MigrationPollContext], None]): Status callback for plan 1.
+        callback_2 (Callable[[MigrationPollContext], None]): Status callback for plan 2.
 
     Raises:
         MigrationPlanExecError: If either plan fails or timeout expires before both complete.
     """
-    plans = [plan_1, plan_2]
-    callbacks = {plan_1.name: callback_1, plan_2.name: callback_2}
+    wait_for_migrations(
+        plans=[plan_1, plan_2],
+        callbacks={plan_1.name or "": callback_1, plan_2.name or "": callback_2},
+        until=MIGRATIONS_ALL_SUCCEEDED,
+    )
+
+
+def _list_namespace_resources(resource: type[Plan] | type[Migration], plan: Plan) -> list[Any]:
+    """LIST all resources of a kind in the Plan namespace with one request.
+
+    Args:
+        resource (type[Plan] | type[Migration]): Resource class to list.
+        plan (Plan): Plan providing the client and namespace.
+
+    Returns:
+        list[Any]: Raw resource instances, no per item GET is issued.
+    """
+    return list(resource.get(client=plan.client, namespace=plan.namespace, raw=True))
 
-    LOGGER.info(f"Waiting for {len(plans)} migrations to complete")
+
+def _validate_plans_namespace(plans: list[Plan]) -> None:
+    """Validate plans are a non-empty list of Plans of one namespace.
+
+    Args:
+        plans (list[Plan]): Plans to validate.
+
+    Raises:
+        ValueError: If plans is empty or the plans are not all in the same namespace.
+    """
+    if not plans:
+        raise ValueError("At least one plan is required")
+
+    if len({plan.namespace for plan in plans}) > 1:
+        raise ValueError(f"Plans must share one namespace: {[f'{plan.namespace}/{plan.name}' for plan in plans]}")
+
+
+def get_plans_migration_status(
+    plans: list[Plan], on_plan_instance: Callable[[Any], None] | None = None
+) -> dict[str, str]:
+    """Get the migration status of several Plans of one namespace.
+
+    Costs one Plan LIST, plus one Migration LIST while any plan has no terminal condition,
+    regardless of the number of plans.
+
+    Args:
+        plans (list[Plan]): Plans to check, all in the same namespace.
+        on_plan_instance (Callable[[Any], None] | None): Optional callback invoked with the
+            listed instance of every requested plan.
+
+    Returns:
+        dict[str, str]: Plan name to status ("Executing", "Succeeded", "Failed", or empty string if unknown).
+
+    Raises:
+        ValueError: If plans is empty or the plans are not all in the same namespace.
+    """
+    _validate_plans_namespace(plans=plans)
+    plan_names = [plan.name or "" for plan in plans]
+    plan_instances = {
+        plan_instance.metadata.name: plan_instance
+        for plan_instance in _list_namespace_resources(resource=Plan, plan=plans[0])
+    }
+    if on_plan_instance is not None:
+        for plan_name in plan_names:
+            if plan_name in plan_instances:
+                on_plan_instance(plan_instances[plan_name])
+
+    statuses = {
+        plan_name: _get_plan_terminal_status(plan_instance=plan_instances[plan_name])
+        if plan_name in plan_instances
+        else ""
+        for plan_name in plan_names
+    }
+
+    if pending := {name for name, status in statuses.items() if not status}:
+        # A Migration CR owned by the plan confirms execution
+        for migration in _list_namespace_resources(resource=Migration, plan=plans[0]):
+            for owner_ref in migration.metadata.ownerReferences or []:
+                if owner_ref.get("kind") == "Plan" and owner_ref.get("name") in pending:
+                    statuses[owner_ref["name"]] = Plan.Status.EXECUTING
+
+    return statuses
+
+
+def _record_plan_instance(plan_instance: Any) -> None:
+    """Feed a polled Plan instance to the pipeline timeline and disk transfer throughput recorders."""
+    MIGRATION_TIMELINES.record(plan_instance=plan_instance)
+    TRANSFER_THROUGHPUT.sample(plan_instance=plan_instance)
+
+
+def wait_for_migrations(
+    plans: list[Plan],
+    callbacks: dict[str, Callable[[MigrationPollContext], None]] | None = None,
+    until: str = MIGRATIONS_ALL_SUCCEEDED,
+    timeout: int | None = None,
+    sleep: int = 1,
+) -> None:
+    """Wait for any number of migration plans of one namespace, dispatching their status to callbacks.
+
+    Every poll fetches all statuses with get_plans_migration_status, so the API load does not
+    grow with the number of plans.
+
+    Args:
+        plans (list[Plan]): Plans to monitor, all in the same namespace.
+        callbacks (dict[str, Callable[[MigrationPollContext], None]] | None): Plan name to status poll
+            callback. Callbacks are invoked with the MigrationPollContext of their plan on each poll until
+            that plan succeeded.
+        until (str): MIGRATIONS_ALL_SUCCEEDED to wait for every plan to succeed, or
+            MIGRATIONS_ALL_EXECUTING to validate every plan is executing at the same time.
+        timeout (int | None): Timeout in seconds. Defaults to the plan_wait_timeout config.
+        sleep (int): Seconds between polls.
+
+    Raises:
+        MigrationPlanExecError: If a plan fails or timeout expires before all plans succeeded
+            (MIGRATIONS_ALL_SUCCEEDED).
+        AssertionError: If a plan finishes before all plans are executing, or timeout expires
+            first (MIGRATIONS_ALL_EXECUTING).
+        ValueError: If ``until`` is unknown, plans is empty or the plans are not all in the same namespace.
+    """
+    if until not in (MIGRATIONS_ALL_SUCCEEDED, MIGRATIONS_ALL_EXECUTING):
+        raise ValueError(f"Unknown migrations wait condition '{until}'")
+
+    # Raised here, get_plans_migration_status errors are retried by the TimeoutSampler
+    _validate_plans_namespace(plans=plans)
+
+    callbacks = callbacks or {}
     completed_plans: set[str] = set()
-    last_statuses: dict[str, str] = {plan.name: "" for plan in plans}
+    last_statuses: dict[str, str] = {plan.name or "": "" for plan in plans}
+    plan_instances: dict[str, Any] = {}
+    contexts: dict[str, MigrationPollContext] = {}
+    LOGGER.info(f"Waiting until {until} for {len(plans)} migrations: {list(last_statuses)}")
+
+    def _on_plan_instance(plan_instance: Any) -> None:
+        _record_plan_instance(plan_instance=plan_instance)
+        plan_instances[plan_instance.metadata.name] = plan_instance
 
     try:
-        for _ in TimeoutSampler(
-            func=lambda: None,
-            sleep=1,
-            wait_timeout=py_config["plan_wait_timeout"],
+        for statuses in TimeoutSampler(
+            func=get_plans_migration_status,
+            sleep=sleep,
+            wait_timeout=timeout or py_config["plan_wait_timeout"],
+            plans=plans,
+            on_plan_instance=_on_plan_instance,
         ):
             for plan in plans:
+                plan_name = plan.name or ""
                 # Skip if already completed
-                if plan.name in completed_plans:
+                if plan_name in completed_plans:
                     continue
 
-                # Fetch and log status on change
-                status = get_plan_migration_status(plan=plan)
-                if status != last_statuses[plan.name]:
-                    LOGGER.info(f"Plan '{plan.name}' migration status: '{status}'")
-                    last_statuses[plan.name] = status
+                status = statuses[plan_name]
+                if status != last_statuses[plan_name]:
+                    LOGGER.info(f"Plan '{plan_name}' migration status: '{status}'")
+                    last_statuses[plan_name] = status
+
+                if plan_name in callbacks:
+                    contexts[plan_name] = MigrationPollContext(
+                        plan=plan,
+                        status=status,
+                        plan_instance=plan_instances.get(plan_name),
+                        previous=contexts.get(plan_name),
+                    )
+                    callbacks[plan_name](contexts[plan_name])
+
+                if until == MIGRATIONS_ALL_EXECUTING:
+                    if status in (Plan.Status.SUCCEEDED, Plan.Status.FAILED):
+                        status_msg = ", ".join([f"{name}: {stat}" for name, stat in statuses.items()])
+                        raise AssertionError(
+                            f"Plan {plan_name} reached {status} before all plans were executing simultaneously. "
+                            f"Statuses: {status_msg}"
+                        )
 
-                # Invoke callback for this plan
-                callbacks[plan.name](status)
+                elif status == Plan.Status.SUCCEEDED:
+                    completed_plans.add(plan_name)
+                    LOGGER.info(f"Migration '{plan_name}' completed")
 
-                # Handle terminal states
-                if status == Plan.Status.SUCCEEDED:
-                    completed_plans.add(plan.name)
-                    LOGGER.info(f"Migration '{plan.name}' completed")
                 elif status == Plan.Status.FAILED:
-                    raise MigrationPlanExecError(f"Plan {plan.name} failed. \nstatus:\n\t{plan.instance}")
+                    raise MigrationPlanExecError(f"Plan {plan_name} failed. \nstatus:\n\t{plan.instance}")
+
+            if until == MIGRATIONS_ALL_EXECUTING and all(
+                status == Plan.Status.EXECUTING for status in statuses.values()
+            ):
+                LOGGER.info("SUCCESS: All migrations are executing simultaneously")
+                return
 
-            # Break when all plans have completed
             if len(completed_plans) == len(plans):
-                break
+                return
 
     except TimeoutExpiredError as timeout_err:
-        expected_plans = {plan.name for plan in plans}
+        if until == MIGRATIONS_ALL_EXECUTING:
+            raise AssertionError("Failed to validate all migrations executing simultaneously within timeout") from None
+
         raise MigrationPlanExecError(
             f"One or more migrations failed to complete within timeout. "
-            f"Completed: {completed_plans}, Expected: {expected_plans}"
+            f"Completed: {completed_plans}, Expected: {set(last_statuses)}"
         ) from timeout_err
 
+    finally:
+        if until == MIGRATIONS_ALL_SUCCEEDED:
+            for plan in plans:
+                TRANSFER_THROUGHPUT.finish(plan=plan)
+
 
 def get_storage_migration_map(
     fixture_store: dict[str, Any],
@@ -494,6 +939,7 @@ def get_storage_migration_map(
     offload_plugin_config: dict[str, Any] | None = None,
     access_mode: str | None = None,
     volume_mode: str | None = None,
+    batch: ResourceBatch | None = None,
 ) -> StorageMap:
     """
     Create a storage map for VM migration.
@@ -524,9 +970,10 @@ def get_storage_migration_map(
         offload_plugin_config: Copy-offload plugin configuration (optional, required if datastore_id is set)
         access_mode: Access mode for copy-offload (optional, used only in copy-offload mode)
         volume_mode: Volume mode for copy-offload (optional, used only in copy-offload mode)
+        batch: Add the storage map to this resource batch instead of creating it now (optional)
 
     Returns:
-        StorageMap: Created storage map resource
+        StorageMap: Created storage map resource, not created yet when batch is given
 
     Raises:
         ValueError: If required parameters are not provided or invalid
@@ -603,6 +1050,17 @@ def get_storage_migration_map(
                 "source": storage,
             })
 
+    if batch is not None:
+        return batch.add(
+            resource=StorageMap,
+            namespace=target_namespace,
+            mapping=storage_map_list,
+            source_provider_name=source_provider.ocp_resource.name,
+            source_provider_namespace=source_provider.ocp_resource.namespace,
+            destination_provider_name=destination_provider.ocp_resource.name,
+            destination_provider_namespace=destination_provider.ocp_resource.namespace,
+        )
+
     storage_map = create_and_store_resource(
         fixture_store=fixture_store,
         resource=StorageMap,
@@ -627,6 +1085,7 @@ def get_network_migration_map(
     source_provider_inventory: ForkliftInventory,
     vms: list[str],
     per_nic_network_map: bool = False,
+    batch: ResourceBatch | None = None,
 ) -> NetworkMap:
     """Create a NetworkMap resource for migration.
 
@@ -640,9 +1099,10 @@ def get_network_migration_map(
         source_provider_inventory (ForkliftInventory): Source provider inventory.
         vms (list[str]): VM names to query.
         per_nic_network_map (bool): Create one map entry per NIC without deduplication.
+        batch (ResourceBatch | None): Add the NetworkMap to this batch instead of creating it now.
 
     Returns:
-        NetworkMap: The created NetworkMap resource.
+        NetworkMap: The created NetworkMap resource, not created yet when ``batch`` is given.
 
     Raises:
         ValueError: If provider resources are not set.
@@ -661,6 +1121,17 @@ def get_network_migration_map(
         vms=vms,
         per_nic_network_map=per_nic_network_map,
     )
+    if batch is not None:
+        return batch.add(
+            resource=NetworkMap,
+            namespace=target_namespace,
+            mapping=network_map_list,
+            source_provider_name=source_provider.ocp_resource.name,
+            source_provider_namespace=source_provider.ocp_resource.namespace,
+            destination_provider_name=destination_provider.ocp_resource.name,
+            destination_provider_namespace=destination_provider.ocp_resource.namespace,
+        )
+
     network_map = create_and_store_resource(
         fixture_store=fixture_store,
         resource=NetworkMap,
@@ -706,7 +1177,7 @@ def verify_vm_disk_count(destination_provider, plan, target_namespace):
 def wait_for_concurrent_migration_execution(
     plan_list: list[Plan],
     timeout: int = 120,
-    callbacks: dict[str, Callable[[str], None]] | None = None,
+    callbacks: dict[str, Callable[[MigrationPollContext], None]] | None = None,
 ) -> None:
     """Wait for multiple migration plans to be executing simultaneously.
 
@@ -718,7 +1189,7 @@ def wait_for_concurrent_migration_execution(
         plan_list: List of Plan resources to monitor.
         timeout: Timeout in seconds to wait for simultaneous execution.
         callbacks: Optional dict mapping plan names to status poll callbacks. Callbacks are
-            invoked with the current status string for their respective plan on each poll.
+            invoked with the MigrationPollContext of their respective plan on each poll.
 
     Returns:
         None
@@ -726,43 +1197,4 @@ def wait_for_concurrent_migration_execution(
     Raises:
         AssertionError: If plans do not execute simultaneously or if any plan completes early.
     """
-    LOGGER.info(f"Validating {len(plan_list)} migrations enter executing state simultaneously")
-    plans_executing = {plan.name: False for plan in plan_list}
-    callbacks = callbacks or {}
-
-    try:
-        for current_statuses in TimeoutSampler(
-            func=lambda: {plan.name: get_plan_migration_status(plan) for plan in plan_list},
-            sleep=2,
-            wait_timeout=timeout,
-        ):
-            # Update executing state for each plan and invoke callbacks
-            for plan in plan_list:
-                status = current_statuses[plan.name]
-
-                # Invoke callback if provided
-                if plan.name in callbacks:
-                    callbacks[plan.name](status)
-
-                if status == Plan.Status.EXECUTING:
-                    if not plans_executing[plan.name]:
-                        LOGGER.info(f"Plan '{plan.name}' is now executing")
-                    plans_executing[plan.name] = True
-                    continue
-
-                # Check for early completion failure
-                elif status in (Plan.Status.SUCCEEDED, Plan.Status.FAILED):
-                    # Construct error message with status of all plans
-                    status_msg = ", ".join([f"{name}: {stat}" for name, stat in current_statuses.items()])
-                    raise AssertionError(
-                        f"Plan {plan.name} reached {status} before all plans were executing simultaneously. "
-                        f"Statuses: {status_msg}"
-                    )
-
-            # Check if all plans are executing
-            if all(plans_executing.values()):
-                LOGGER.info("SUCCESS: All migrations are executing simultaneously")
-                return
-
-    except TimeoutExpiredError:
-        raise AssertionError("Failed to validate all migrations executing simultaneously within timeout") from None
+    wait_for_migrations(plans=plan_list, callbacks=callbacks, until=MIGRATIONS_ALL_EXECUTING, timeout=timeout, sleep=2)
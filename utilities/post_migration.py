@@ -21,7 +21,7 @@ from paramiko.ssh_exception import AuthenticationException, ChannelException, No
 from pyhelper_utils.exceptions import CommandExecFailed
 from pytest_testconfig import py_config
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from libs.base_provider import BaseProvider
 from libs.forklift_inventory import ForkliftInventory
@@ -31,6 +31,7 @@ from utilities.naming import resolve_destination_vm_name
 from utilities.ssh_utils import SSHConnectionManager, VMSSHConnection, run_cmd_in_vm
 from utilities.utils import get_cluster_version, get_value_from_py_config, rhv_provider
 from utilities.vmware_guest_operations import DATA_INTEGRITY_FILE
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from libs.providers.openshift import OCPProvider
@@ -146,7 +147,7 @@ def check_ssh_connectivity(
             return False
 
     try:
-        for sample in TimeoutSampler(wait_timeout=timeout, sleep=retry_delay, func=_test_connectivity):
+        for sample in BackoffSampler(wait_timeout=timeout, sleep=retry_delay, func=_test_connectivity):
             if sample:
                 return
     except TimeoutExpiredError as e:
@@ -212,7 +213,7 @@ def verify_data_integrity(
 
     marker_content: str | None = None
     try:
-        for sample in TimeoutSampler(wait_timeout=timeout, sleep=retry_delay, func=_read_marker):
+        for sample in BackoffSampler(wait_timeout=timeout, sleep=retry_delay, func=_read_marker):
             if sample is not None:
                 marker_content = sample
                 break
@@ -302,7 +303,7 @@ def verify_luks_encryption(
     # None = transient failure (retry); empty list = no LUKS devices (definitive → assert)
     luks_devices: list[dict[str, Any]] | None = None
     try:
-        for sample in TimeoutSampler(wait_timeout=timeout, sleep=retry_delay, func=_check_luks):
+        for sample in BackoffSampler(wait_timeout=timeout, sleep=retry_delay, func=_check_luks):
             if sample is not None:
                 luks_devices = sample
                 break
@@ -705,7 +706,7 @@ def check_static_ip_preservation(
 
     try:
         matched_interfaces: list[dict[str, Any]] | None = None
-        for sample in TimeoutSampler(wait_timeout=timeout, sleep=retry_delay, func=verify_all_static_ips):
+        for sample in BackoffSampler(wait_timeout=timeout, sleep=retry_delay, func=verify_all_static_ips):
             if sample:
                 matched_interfaces = sample
                 break
@@ -1737,26 +1738,48 @@ def check_vms(
             LOGGER.error(f"SSL configuration check failed: {exp}")
             res.setdefault("_provider", []).append(f"check_ssl_configuration - {str(exp)}")
 
+    # All source VMs in one bulk lookup, VMware retrieves their properties with a single API call
+    vm_names = [vm["name"] for vm in plan["virtual_machines"]]
+    source_vms = dict(
+        zip(
+            vm_names,
+            source_provider.vm_dicts(
+                names=vm_names,
+                namespace=source_vms_namespace,
+                source=True,
+                source_provider_inventory=source_provider_inventory,
+            ),
+        )
+    )
+
+    # Destination VMs in one bulk lookup per guest agent setting, OCP lists the namespace resources once for each
+    destination_vm_kwargs: dict[str, Any] = {"namespace": vm_namespace}
+    if (guest_agent_timeout := plan.get("guest_agent_timeout")) is not None:
+        destination_vm_kwargs["guest_agent_timeout"] = guest_agent_timeout
+
+    destination_vms: dict[str, dict[str, Any]] = {}
+    for wait_for_guest_agent in (True, False):
+        vms = [vm for vm in plan["virtual_machines"] if bool(vm.get("guest_agent")) is wait_for_guest_agent]
+        if vms:
+            destination_vms.update(
+                zip(
+                    [vm["name"] for vm in vms],
+                    destination_provider.vm_dicts(
+                        names=[resolve_destination_vm_name(vm) for vm in vms],
+                        wait_for_guest_agent=wait_for_guest_agent,
+                        **destination_vm_kwargs,
+                    ),
+                )
+            )
+
     for vm in plan["virtual_machines"]:
         vm_name = vm["name"]
         destination_vm_name = resolve_destination_vm_name(vm)
         res[vm_name] = []
 
-        source_vm = source_provider.vm_dict(
-            name=vm_name,
-            namespace=source_vms_namespace,
-            source=True,
-            source_provider_inventory=source_provider_inventory,
-        )
+        source_vm = source_vms[vm_name]
         vm_guest_agent = vm.get("guest_agent")
-        vm_kwargs = {
-            "wait_for_guest_agent": vm_guest_agent,
-            "name": destination_vm_name,
-            "namespace": vm_namespace,
-        }
-        if (guest_agent_timeout := plan.get("guest_agent_timeout")) is not None:
-            vm_kwargs["guest_agent_timeout"] = guest_agent_timeout
-        destination_vm = destination_provider.vm_dict(**vm_kwargs)
+        destination_vm = destination_vms[vm_name]
 
         # Group 1: All providers — destination checks
         try:
@@ -20,7 +20,7 @@ INVENTORY_SYNC_WORKAROUND_JIRA = "MTV-6072"
 _QUICK_CHECK_TIMEOUT = 30
 
 
-def force_inventory_refresh(provider: Provider) -> None:
+def force_inventory_refresh(provider: Provider, inventory: ForkliftInventory | None = None) -> None:
     """Force Forklift provider inventory refresh by patching spec.settings._refresh.
 
     Waits for Ready (not Validated) because _refresh triggers reconciliation; Ready
@@ -28,6 +28,8 @@ def force_inventory_refresh(provider: Provider) -> None:
 
     Args:
         provider (Provider): Forklift Provider resource to refresh.
+        inventory (ForkliftInventory | None): Inventory client whose response cache is dropped
+            after the refresh. Defaults to None.
 
     Raises:
         TimeoutExpiredError: If the provider does not become Ready within the timeout.
@@ -38,6 +40,9 @@ def force_inventory_refresh(provider: Provider) -> None:
     ResourceEditor(patches={provider: patch}).update()
     provider.wait_for_condition(condition="Ready", status="True", timeout=_INVENTORY_REFRESH_READY_TIMEOUT)
 
+    if inventory is not None:
+        inventory.invalidate_cache()
+
 
 def collect_cross_datastore_ids(
     virtual_machines: list[dict[str, Any]],
@@ -118,7 +123,10 @@ def wait_for_cloned_vms_in_forklift_inventory(
 ) -> None:
     """Wait for cloned VMs in Forklift inventory with MTV-6066 workarounds gated by MTV-6072.
 
-    For vSphere when MTV-6072 is open: first tries each VM for _QUICK_CHECK_TIMEOUT seconds.
+    All VMs are waited on together through ``ForkliftInventory.wait_for_vms``, which lists the
+    inventory once per tick for every pending name.
+
+    For vSphere when MTV-6072 is open: first waits for all VMs for _QUICK_CHECK_TIMEOUT seconds.
     VMs that appear quickly are done with no patch overhead. Only VMs that fail the quick check
     trigger a provider refresh + host/datastore inventory wait + full retry. When MTV-6072 is
     resolved, ``workaround_active`` becomes False and the plain wait path runs for all providers.
@@ -141,6 +149,9 @@ def wait_for_cloned_vms_in_forklift_inventory(
         ValueError: If source_provider.ocp_resource is not set when workaround is active
         TimeoutExpiredError: If a VM does not appear in inventory within the timeout
     """
+    # Cached VM lists predate the clones
+    source_provider_inventory.invalidate_cache()
+
     workaround_active = jira_issue_open(INVENTORY_SYNC_WORKAROUND_JIRA) is not False
     is_vsphere = source_provider.type == Provider.ProviderType.VSPHERE
     vsphere_inventory: VsphereForkliftInventory | None = None
@@ -152,14 +163,16 @@ def wait_for_cloned_vms_in_forklift_inventory(
             )
         vsphere_inventory = source_provider_inventory
 
-        # Quick check: try each VM for _QUICK_CHECK_TIMEOUT seconds first.
+        # Quick check: give all VMs _QUICK_CHECK_TIMEOUT seconds together first.
         # Avoids the 180s force_inventory_refresh overhead when VMs sync quickly on their own.
         failed_vm_names: list[str] = []
-        for vm_name in cloned_vm_names:
-            try:
-                source_provider_inventory.wait_for_vm(name=vm_name, timeout=_QUICK_CHECK_TIMEOUT)
-            except TimeoutExpiredError:
-                failed_vm_names.append(vm_name)
+        try:
+            source_provider_inventory.wait_for_vms(names=cloned_vm_names, timeout=_QUICK_CHECK_TIMEOUT)
+        except TimeoutExpiredError:
+            # vSphere VMs are ready as soon as they are listed, so anything not listed failed
+            source_provider_inventory.invalidate_cache(url_path_prefix=source_provider_inventory.vms_path)
+            visible_vm_names = set(source_provider_inventory.vms_names)
+            failed_vm_names = [vm_name for vm_name in cloned_vm_names if vm_name not in visible_vm_names]
 
         if failed_vm_names:
             # VMs not found in quick check — force refresh + prerequisites + full retry
@@ -168,18 +181,16 @@ def wait_for_cloned_vms_in_forklift_inventory(
             LOGGER.info(
                 f"Quick inventory check timed out for {failed_vm_names}; forcing provider refresh (MTV-6072 workaround)"
             )
-            force_inventory_refresh(source_provider.ocp_resource)
+            force_inventory_refresh(provider=source_provider.ocp_resource, inventory=source_provider_inventory)
             _wait_for_vsphere_host_and_datastore_inventory(
                 source_provider_inventory=vsphere_inventory,
                 virtual_machines=virtual_machines,
                 copyoffload_config=copyoffload_config,
                 inventory_timeout=inventory_timeout,
             )
-            for vm_name in failed_vm_names:
-                source_provider_inventory.wait_for_vm(name=vm_name, timeout=inventory_timeout)
+            source_provider_inventory.wait_for_vms(names=failed_vm_names, timeout=inventory_timeout)
 
         return
 
-    # Non-vSphere or workaround inactive — plain wait per VM
-    for vm_name in cloned_vm_names:
-        source_provider_inventory.wait_for_vm(name=vm_name, timeout=inventory_timeout)
+    # Non-vSphere or workaround inactive — plain batched wait for all VMs
+    source_provider_inventory.wait_for_vms(names=cloned_vm_names, timeout=inventory_timeout)
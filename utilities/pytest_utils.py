@@ -22,14 +22,17 @@ from ocp_resources.provider import Provider
 from ocp_resources.secret import Secret
 from ocp_resources.storage_map import StorageMap
 from ocp_resources.virtual_machine import VirtualMachine
+from pyVmomi import vmodl
 from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError
 
-from exceptions.exceptions import SessionTeardownError
+from exceptions.exceptions import SessionTeardownError, VmCloneError
 from libs.providers.openstack import OpenStackProvider
 from libs.providers.rhv import OvirtProvider
-from libs.providers.vmware import VMWareProvider
+from libs.providers.vmware import LINKED_CLONE_BASE_SNAPSHOTS, VMWareProvider
 from utilities.migration_utils import append_leftovers, archive_plan, cancel_migration, check_dv_pvc_pv_deleted
 from utilities.utils import delete_all_vms, get_cluster_client
+from utilities.vmware_vm_pool import VM_POOL_LEASES, VMwareVmPool
 
 if TYPE_CHECKING:
     import pytest
@@ -152,6 +155,8 @@ def teardown_resources(
     openstack_cloned_vms = session_teardown_resources.get(Provider.ProviderType.OPENSTACK, [])
     rhv_cloned_vms = session_teardown_resources.get(Provider.ProviderType.RHV, [])
     openstack_volume_snapshots = session_teardown_resources.get("VolumeSnapshot", [])
+    vmware_linked_clone_bases = session_teardown_resources.get(LINKED_CLONE_BASE_SNAPSHOTS, [])
+    vmware_pool_leases = session_teardown_resources.get(VM_POOL_LEASES, [])
 
     # Resources that was created by running migration
     pods = session_teardown_resources.get(Pod.kind, [])
@@ -325,7 +330,10 @@ def teardown_resources(
             LOGGER.error(f"Failed to cleanup namespace {namespace['name']}: {exc}")
             leftovers.setdefault(Namespace.kind, []).append(namespace)
 
-    if vmware_cloned_vms:
+    if vmware_cloned_vms or vmware_linked_clone_bases or vmware_pool_leases:
+        # Base snapshots not removed by the end of the block are leftovers, also when connecting fails
+        remaining_linked_clone_bases = list(vmware_linked_clone_bases)
+        remaining_pool_leases = list(vmware_pool_leases)
         try:
             # Use clone provider (vCenter) for cleanup when configured, to avoid
             # stale vCenter inventory records when source provider is ESXi
@@ -343,20 +351,42 @@ def teardown_resources(
                 username=cleanup_provider_data["username"],
                 password=cleanup_provider_data["password"],
             ) as vmware_provider:
-                for _vm in vmware_cloned_vms:
-                    _cloned_vm_name = _vm["name"]
+                # Leased pool VMs are reverted and returned to the pool, not deleted
+                vm_pool = VMwareVmPool(provider=vmware_provider)
+                for _vm in vmware_pool_leases:
                     try:
-                        vmware_provider.delete_vm(vm_name=_cloned_vm_name)
-                    except Exception as exc:
-                        LOGGER.error(f"Failed to delete cloned vm {_cloned_vm_name}: {exc}")
-                        leftovers.setdefault(vmware_provider.type, []).append({
-                            "cloned_vm_name": _cloned_vm_name,
-                        })
+                        vm_pool.release(vm_name=_vm["name"])
+                        remaining_pool_leases.remove(_vm)
+                    except (ValueError, VmCloneError, TimeoutExpiredError, vmodl.MethodFault) as exc:
+                        LOGGER.error(f"Failed to return vm {_vm['name']} to the VM pool: {exc}")
+
+                failed_deletions = vmware_provider.delete_vms(names=[_vm["name"] for _vm in vmware_cloned_vms])
+                for _cloned_vm_name, deletion_error in failed_deletions.items():
+                    LOGGER.error(f"Failed to delete cloned vm {_cloned_vm_name}: {deletion_error}")
+                    leftovers.setdefault(vmware_provider.type, []).append({
+                        "cloned_vm_name": _cloned_vm_name,
+                    })
+
+                # Linked clone base snapshots, after the linked clones using them are deleted
+                for _snapshot in vmware_linked_clone_bases:
+                    try:
+                        vmware_provider.remove_snapshots(vm_name=_snapshot["vm_name"], name=_snapshot["name"])
+                        remaining_linked_clone_bases.remove(_snapshot)
+                    except (ValueError, VmCloneError, TimeoutExpiredError, vmodl.MethodFault) as exc:
+                        LOGGER.error(
+                            f"Failed to remove snapshot {_snapshot['name']} of vm {_snapshot['vm_name']}: {exc}"
+                        )
 
         except Exception as exc:
             LOGGER.error(f"Failed to connect to VMware provider for cleanup: {exc}")
             leftovers.setdefault(Provider.ProviderType.VSPHERE, []).extend(vmware_cloned_vms)
 
+        if remaining_linked_clone_bases:
+            leftovers.setdefault(LINKED_CLONE_BASE_SNAPSHOTS, []).extend(remaining_linked_clone_bases)
+
+        if remaining_pool_leases:
+            leftovers.setdefault(VM_POOL_LEASES, []).extend(remaining_pool_leases)
+
     if openstack_cloned_vms:
         try:
             source_provider_data = session_store["source_provider_data"]
@@ -372,15 +402,12 @@ def teardown_resources(
                 user_domain_id=source_provider_data["user_domain_id"],
                 project_domain_id=source_provider_data["project_domain_id"],
             ) as openstack_provider:
-                for _vm in openstack_cloned_vms:
-                    _cloned_vm_name = _vm["name"]
-                    try:
-                        openstack_provider.delete_vm(vm_name=_cloned_vm_name)
-                    except Exception as exc:
-                        LOGGER.error(f"Failed to delete cloned vm {_cloned_vm_name}: {exc}")
-                        leftovers.setdefault(openstack_provider.type, []).append({
-                            "cloned_vm_name": _cloned_vm_name,
-                        })
+                failed_deletions = openstack_provider.delete_vms(names=[_vm["name"] for _vm in openstack_cloned_vms])
+                for _cloned_vm_name, deletion_error in failed_deletions.items():
+                    LOGGER.error(f"Failed to delete cloned vm {_cloned_vm_name}: {deletion_error}")
+                    leftovers.setdefault(openstack_provider.type, []).append({
+                        "cloned_vm_name": _cloned_vm_name,
+                    })
         except Exception as exc:
             LOGGER.error(f"Failed to connect to OpenStack provider for cleanup: {exc}")
             leftovers.setdefault(Provider.ProviderType.OPENSTACK, openstack_cloned_vms)
@@ -395,15 +422,12 @@ def teardown_resources(
                 password=source_provider_data["password"],
                 insecure=source_provider_data.get("insecure", True),
             ) as rhv_provider:
-                for _vm in rhv_cloned_vms:
-                    _cloned_vm_name = _vm["name"]
-                    try:
-                        rhv_provider.delete_vm(vm_name=_cloned_vm_name)
-                    except Exception as exc:
-                        LOGGER.error(f"Failed to delete cloned vm {_cloned_vm_name}: {exc}")
-                        leftovers.setdefault(rhv_provider.type, []).append({
-                            "cloned_vm_name": _cloned_vm_name,
-                        })
+                failed_deletions = rhv_provider.delete_vms(names=[_vm["name"] for _vm in rhv_cloned_vms])
+                for _cloned_vm_name, deletion_error in failed_deletions.items():
+                    LOGGER.error(f"Failed to delete cloned vm {_cloned_vm_name}: {deletion_error}")
+                    leftovers.setdefault(rhv_provider.type, []).append({
+                        "cloned_vm_name": _cloned_vm_name,
+                    })
         except Exception as exc:
             LOGGER.error(f"Failed to connect to RHV provider for cleanup: {exc}")
             leftovers.setdefault(Provider.ProviderType.RHV, rhv_cloned_vms)
@@ -1,3 +1,6 @@
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import yaml
@@ -7,6 +10,7 @@ from ocp_resources.namespace import Namespace
 from ocp_resources.plan import Plan
 from ocp_resources.resource import Resource
 from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError
 
 from utilities.naming import generate_name_with_uuid
 
@@ -15,14 +19,20 @@ if TYPE_CHECKING:
 
 LOGGER = get_logger(__name__)
 
+RESOURCE_BATCH_POOL_SIZE = 8
+RESOURCE_READY_TIMEOUT = 360
 
-def create_and_store_resource(
+# fixture_store["teardown"] is shared by every thread deploying resources
+_TEARDOWN_LOCK = threading.Lock()
+
+
+def _build_resource(
     client: "DynamicClient",
     fixture_store: dict[str, Any],
     resource: type[Resource],
-    test_name: str | None = None,
     **kwargs: Any,
 ) -> Any:
+    """Resolve the resource name and instantiate it, without creating it on the cluster."""
     kwargs["client"] = client
 
     _resource_name = kwargs.get("name")
@@ -51,23 +61,177 @@ def create_and_store_resource(
 
     kwargs["name"] = _resource_name
 
-    _resource = resource(**kwargs)
+    return resource(**kwargs)
+
+
+def _store_resources(fixture_store: dict[str, Any], resources: list[Any], test_name: str | None = None) -> None:
+    """Register resources for teardown in one locked update of fixture_store."""
+    with _TEARDOWN_LOCK:
+        for _resource in resources:
+            LOGGER.info(f"Storing {_resource.kind} {_resource.name} in fixture store")
+            _resource_dict = {"name": _resource.name, "namespace": _resource.namespace, "module": _resource.__module__}
+
+            if test_name:
+                _resource_dict["test_name"] = test_name
+
+            fixture_store["teardown"].setdefault(_resource.kind, []).append(_resource_dict)
+
+
+def create_and_store_resource(
+    client: "DynamicClient",
+    fixture_store: dict[str, Any],
+    resource: type[Resource],
+    test_name: str | None = None,
+    **kwargs: Any,
+) -> Any:
+    _resource = _build_resource(client=client, fixture_store=fixture_store, resource=resource, **kwargs)
 
     try:
         _resource.deploy(wait=True)
     except ConflictError:
-        LOGGER.warning(f"{_resource.kind} {_resource_name} already exists, reusing it.")
+        LOGGER.warning(f"{_resource.kind} {_resource.name} already exists, reusing it.")
         _resource.wait()
 
-    LOGGER.info(f"Storing {_resource.kind} {_resource.name} in fixture store")
-    _resource_dict = {"name": _resource.name, "namespace": _resource.namespace, "module": _resource.__module__}
+    _store_resources(fixture_store=fixture_store, resources=[_resource], test_name=test_name)
 
-    if test_name:
-        _resource_dict["test_name"] = test_name
+    return _resource
 
-    fixture_store["teardown"].setdefault(_resource.kind, []).append(_resource_dict)
 
-    return _resource
+class ResourceBatch:
+    """Create several resources concurrently, in dependency order.
+
+    Resources are instantiated by ``add`` with their final name, so dependents can reference
+    them (e.g. a Plan referencing its StorageMap and NetworkMap) before anything is created.
+    ``deploy`` creates the resources in waves: every resource whose dependencies are ready is
+    created concurrently, then the whole wave waits for existence and readiness together.
+    All resources a deploy attempted are registered for teardown in one update, also on failure.
+
+    Example:
+        batch = ResourceBatch(client=ocp_admin_client, fixture_store=fixture_store)
+        storage_map = batch.add(resource=StorageMap, namespace=target_namespace, mapping=...)
+        network_map = batch.add(resource=NetworkMap, namespace=target_namespace, mapping=...)
+        plan = batch.add(
+            resource=Plan,
+            depends_on=[storage_map, network_map],
+            ready_condition=Plan.Condition.READY,
+            storage_map_name=storage_map.name,
+            ...
+        )
+        batch.deploy()
+
+    Args:
+        client (DynamicClient): OpenShift client.
+        fixture_store (dict[str, Any]): Fixture store for resource tracking.
+        test_name (str | None): Test name stored with every resource teardown entry.
+    """
+
+    def __init__(self, client: "DynamicClient", fixture_store: dict[str, Any], test_name: str | None = None) -> None:
+        self.client = client
+        self.fixture_store = fixture_store
+        self.test_name = test_name
+        self._resources: list[Any] = []
+        self._depends_on: dict[int, list[Any]] = {}
+        self._ready_conditions: dict[int, tuple[str, int]] = {}
+        self._on_timeout: dict[int, Callable[[Any], None]] = {}
+
+    def __contains__(self, _resource: Any) -> bool:
+        return any(_resource is _added for _added in self._resources)
+
+    def add(
+        self,
+        resource: type[Resource],
+        depends_on: Iterable[Any] = (),
+        ready_condition: str | None = None,
+        ready_timeout: int = RESOURCE_READY_TIMEOUT,
+        on_timeout: Callable[[Any], None] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Add a resource to the batch, arguments as for ``create_and_store_resource``.
+
+        Args:
+            resource (type[Resource]): Resource class to create.
+            depends_on (Iterable[Any]): Resources of this batch that must be ready before this one is created.
+            ready_condition (str | None): Condition to wait for with status True after creation.
+            ready_timeout (int): Timeout in seconds of the ready condition.
+            on_timeout (Callable[[Any], None] | None): Called with the resource when it does not reach
+                its ready condition in time, e.g. to log its status, before the timeout is raised.
+            **kwargs (Any): Resource arguments.
+
+        Returns:
+            Any: The resource instance, not created until ``deploy``.
+
+        Raises:
+            ValueError: If a dependency is not part of this batch.
+        """
+        depends_on = list(depends_on)
+        for dependency in depends_on:
+            if dependency not in self:
+                raise ValueError(f"{dependency.kind} {dependency.name} is not part of the resource batch")
+
+        _resource = _build_resource(client=self.client, fixture_store=self.fixture_store, resource=resource, **kwargs)
+        self._resources.append(_resource)
+        self._depends_on[id(_resource)] = depends_on
+        if ready_condition:
+            self._ready_conditions[id(_resource)] = (ready_condition, ready_timeout)
+
+        if on_timeout:
+            self._on_timeout[id(_resource)] = on_timeout
+
+        return _resource
+
+    def _create(self, _resource: Any) -> None:
+        try:
+            _resource.deploy(wait=False)
+        except ConflictError:
+            LOGGER.warning(f"{_resource.kind} {_resource.name} already exists, reusing it.")
+
+    def _wait_ready(self, _resource: Any) -> None:
+        _resource.wait()
+        if ready_condition := self._ready_conditions.get(id(_resource)):
+            condition, timeout = ready_condition
+            try:
+                _resource.wait_for_condition(
+                    condition=condition, status=Resource.Condition.Status.TRUE, timeout=timeout
+                )
+            except TimeoutExpiredError:
+                if on_timeout := self._on_timeout.get(id(_resource)):
+                    on_timeout(_resource)
+                raise
+
+    def deploy(self) -> list[Any]:
+        """Create every resource of the batch and wait until they are ready.
+
+        Returns:
+            list[Any]: The created resources, in the order they were added.
+
+        Raises:
+            TimeoutExpiredError: If a resource does not exist or reach its ready condition in time.
+        """
+        ready: set[int] = set()
+        attempted: list[Any] = []
+        pending = list(self._resources)
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(pending), RESOURCE_BATCH_POOL_SIZE) or 1) as executor:
+                while pending:
+                    # add() only accepts dependencies added before, so every wave is non-empty
+                    wave = [
+                        _resource
+                        for _resource in pending
+                        if all(id(dependency) in ready for dependency in self._depends_on[id(_resource)])
+                    ]
+                    pending = [_resource for _resource in pending if all(_resource is not _r for _r in wave)]
+                    LOGGER.info(f"Creating {', '.join(f'{_r.kind} {_r.name}' for _r in wave)}")
+
+                    attempted.extend(wave)
+                    # list() re-raises the first failure, the executor still finishes the rest of the wave
+                    list(executor.map(self._create, wave))
+                    list(executor.map(self._wait_ready, wave))
+                    ready.update(id(_resource) for _resource in wave)
+
+        finally:
+            _store_resources(fixture_store=self.fixture_store, resources=attempted, test_name=self.test_name)
+
+        return list(self._resources)
 
 
 def get_or_create_namespace(
@@ -17,13 +17,14 @@ from paramiko.ssh_exception import AuthenticationException, ChannelException, No
 from pyVmomi import vim
 from simple_logger.logger import get_logger
 
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from exceptions.exceptions import GuestCommandError, SSHConnectionSetupError
 from utilities.naming import resolve_destination_vm_name
 from utilities.post_migration import get_ssh_credentials_from_provider_config
 from utilities.ssh_utils import SSHConnectionManager, VMSSHConnection, run_cmd_in_vm
 from utilities.vmware_guest_operations import run_command_in_vmware_guest
+from utilities.waiters import BackoffSampler
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
@@ -152,7 +153,7 @@ def _get_pvc_device_targets(
     pvc_devices: dict[str, str] = {}
     sample = None
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=_VMI_VOLUME_STATUS_TIMEOUT,
             sleep=_VMI_VOLUME_STATUS_POLL_INTERVAL,
             func=lambda: cnv_vm.vmi.instance if cnv_vm.vmi else None,
@@ -718,7 +719,7 @@ def _win_get_shared_drive_letter(ssh_conn: VMSSHConnection, vm_label: str, volum
 
     drive_letter: str | None = None
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=_WIN_VOLUME_DISCOVERY_TIMEOUT,
             sleep=_WIN_VOLUME_DISCOVERY_POLL_INTERVAL,
             func=_try_get_drive_letter,
@@ -733,7 +734,7 @@ def _win_get_shared_drive_letter(ssh_conn: VMSSHConnection, vm_label: str, volum
             f"by test_label_shared_disk before migration."
         ) from exc
 
-    # Type narrowing: TimeoutSampler guarantees either break (drive_letter set) or TimeoutExpiredError
+    # Type narrowing: BackoffSampler guarantees either break (drive_letter set) or TimeoutExpiredError
     assert drive_letter is not None
     LOGGER.info(f"{vm_label}: Shared volume '{volume_label}' is drive {drive_letter}:")
     return drive_letter
@@ -916,7 +917,7 @@ def verify_shared_disk_data_windows(
             return None
 
     try:
-        for sample in TimeoutSampler(
+        for sample in BackoffSampler(
             wait_timeout=_WIN_VERIFICATION_RETRY_TIMEOUT,
             sleep=_WIN_VERIFICATION_RETRY_INTERVAL,
             func=_attempt,
@@ -0,0 +1,313 @@
+"""Disk transfer throughput of running migrations.
+
+The migration waiters hand every Plan instance they see to ``TRANSFER_THROUGHPUT``. It samples the
+DiskTransfer step ``progress.completed`` of every VM at most once per ``interval`` seconds,
+derives instantaneous and average throughput, and warns when a transfer made no progress for
+``stall_intervals`` samples. Finished plans are summarized per plan and per storage class /
+source datastore of the plan StorageMap, and reported as junit properties of the running test.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from kubernetes.dynamic.exceptions import ApiException
+from ocp_resources.plan import Plan
+from ocp_resources.storage_map import StorageMap
+from simple_logger.logger import get_logger
+from urllib3.exceptions import HTTPError
+
+LOGGER = get_logger(__name__)
+
+DISK_TRANSFER_STEP = "DiskTransfer"
+THROUGHPUT_SAMPLE_INTERVAL = 10
+THROUGHPUT_STALL_INTERVALS = 6
+
+# Forklift reports DiskTransfer progress in MB for every provider, other units are converted
+_UNIT_TO_MB = {"MB": 1.0, "MiB": 1.0, "GB": 1024.0, "GiB": 1024.0, "KB": 1 / 1024, "KiB": 1 / 1024}
+
+
+def _transfer_seconds(started: str | None, completed: str | None) -> float | None:
+    if not (started and completed):
+        return None
+
+    return (datetime.fromisoformat(completed) - datetime.fromisoformat(started)).total_seconds()
+
+
+class _VmTransfer:
+    """DiskTransfer samples of one VM."""
+
+    def __init__(self) -> None:
+        self.samples: list[tuple[float, float]] = []
+        self.total_mb = 0.0
+        self.started: str | None = None
+        self.completed: str | None = None
+        self.peak_mb_per_s = 0.0
+        self.stalled_samples = 0
+        self.stalls = 0
+
+    def sample(self, step: dict[str, Any], now: float, stall_intervals: int) -> bool:
+        """Add a progress sample, returns True when the transfer just stalled."""
+        unit_factor = _UNIT_TO_MB.get((step.get("annotations") or {}).get("unit", "MB"), 1.0)
+        progress = step.get("progress") or {}
+        completed_mb = (progress.get("completed") or 0) * unit_factor
+        self.total_mb = (progress.get("total") or 0) * unit_factor
+        self.started = step.get("started")
+        self.completed = step.get("completed")
+
+        if self.samples:
+            last_time, last_mb = self.samples[-1]
+            if completed_mb > last_mb:
+                if now > last_time:
+                    self.peak_mb_per_s = max(self.peak_mb_per_s, (completed_mb - last_mb) / (now - last_time))
+                self.stalled_samples = 0
+            elif not self.completed:
+                self.stalled_samples += 1
+
+        self.samples.append((now, completed_mb))
+        if self.stalled_samples == stall_intervals:
+            self.stalls += 1
+            return True
+
+        return False
+
+    @property
+    def transferred_mb(self) -> float:
+        return self.samples[-1][1] if self.samples else 0.0
+
+    @property
+    def seconds(self) -> float:
+        """Transfer duration from the CR timestamps, or the sampled span while still running."""
+        if (seconds := _transfer_seconds(started=self.started, completed=self.completed)) is not None:
+            return seconds
+
+        return self.samples[-1][0] - self.samples[0][0] if self.samples else 0.0
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        return {
+            "transferred_mb": round(self.transferred_mb, 1),
+            "total_mb": round(self.total_mb, 1),
+            "seconds": round(self.seconds, 1),
+            "avg_mb_per_s": round(self.transferred_mb / self.seconds, 2) if self.seconds else 0.0,
+            "peak_mb_per_s": round(self.peak_mb_per_s, 2),
+            "stalls": self.stalls,
+        }
+
+
+class TransferThroughputSampler:
+    """Session wide DiskTransfer throughput per plan and VM."""
+
+    def __init__(
+        self, interval: float = THROUGHPUT_SAMPLE_INTERVAL, stall_intervals: int = THROUGHPUT_STALL_INTERVALS
+    ) -> None:
+        self.interval = interval
+        self.stall_intervals = stall_intervals
+        self._lock = threading.Lock()
+        self._transfers: dict[tuple[str, str], dict[str, _VmTransfer]] = {}
+        self._last_sample: dict[tuple[str, str], float] = {}
+        self._latest: dict[tuple[str, str], Any] = {}
+        self._summaries: dict[tuple[str, str], dict[str, Any]] = {}
+        self._unreported: list[tuple[str, str]] = []
+
+    def sample(self, plan_instance: Any) -> None:
+        """Sample the DiskTransfer progress of every VM of a Plan instance.
+
+        Calls within ``interval`` seconds of the previous sample of the same plan are ignored,
+        so waiters can call this on every poll.
+
+        Args:
+            plan_instance (Any): Plan resource instance, from a GET, LIST or watch event.
+        """
+        if plan_instance is None:
+            return
+
+        key = (plan_instance.metadata.namespace, plan_instance.metadata.name)
+        with self._lock:
+            # Kept so finish() can take a final sample of a rate limited update
+            self._latest[key] = plan_instance
+            if time.monotonic() - self._last_sample.get(key, 0.0) >= self.interval:
+                self._sample(key=key, plan_instance=plan_instance)
+
+    def _sample(self, key: tuple[str, str], plan_instance: Any) -> None:
+        status = plan_instance.status
+        migration = status.migration if status else None
+        if not (migration and migration.vms):
+            return
+
+        now = time.monotonic()
+        self._last_sample[key] = now
+        transfers = self._transfers.setdefault(key, {})
+        for vm in migration.vms:
+            for step in vm.pipeline or []:
+                if step.name != DISK_TRANSFER_STEP or not step.started:
+                    continue
+
+                vm_name = vm.name or vm.id
+                step_dict = step.to_dict()
+                if transfers.setdefault(vm_name, _VmTransfer()).sample(
+                    step=step_dict, now=now, stall_intervals=self.stall_intervals
+                ):
+                    progress = step_dict.get("progress") or {}
+                    LOGGER.warning(
+                        f"Disk transfer of VM '{vm_name}' in plan '{key[1]}' made no progress for "
+                        f"{self.stall_intervals} samples ({self.stall_intervals * self.interval}s) "
+                        f"at {progress.get('completed')}/{progress.get('total')}"
+                    )
+
+    def finish(self, plan: Plan) -> dict[str, Any] | None:
+        """Summarize the throughput of a finished plan and queue it for the junit properties.
+
+        Never raises, it runs in the ``finally`` of the migration waiters and must not hide their failure.
+
+        Args:
+            plan (Plan): The migrated Plan, its StorageMap provides the storage class and datastore keys.
+
+        Returns:
+            dict[str, Any] | None: The plan summary, None if no disk transfer was sampled or the
+                summary failed.
+        """
+        try:
+            return self._finish(plan=plan)
+        except (ApiException, HTTPError, AttributeError, KeyError, TypeError, ValueError) as exp:
+            LOGGER.warning(f"Failed to summarize the disk transfer throughput of plan '{plan.name}': {exp}")
+            return None
+
+    def _finish(self, plan: Plan) -> dict[str, Any] | None:
+        key = (plan.namespace or "", plan.name or "")
+        with self._lock:
+            if key not in self._summaries and (plan_instance := self._latest.pop(key, None)) is not None:
+                self._sample(key=key, plan_instance=plan_instance)
+
+            transfers = self._transfers.get(key)
+            if not transfers or key in self._summaries:
+                return self._summaries.get(key)
+
+            vms = {vm_name: transfer.summary for vm_name, transfer in transfers.items()}
+
+        storage_classes, datastores = _plan_storage_keys(plan=plan)
+        transferred_mb = sum(vm["transferred_mb"] for vm in vms.values())
+        # Wall time from the first transfer start to the last transfer end, VMs transfer concurrently
+        seconds = max(vm["seconds"] for vm in vms.values())
+        if all(transfer.started and transfer.completed for transfer in transfers.values()):
+            seconds = (
+                _transfer_seconds(
+                    started=min(transfer.started for transfer in transfers.values() if transfer.started),
+                    completed=max(transfer.completed for transfer in transfers.values() if transfer.completed),
+                )
+                or seconds
+            )
+        summary = {
+            "plan": plan.name,
+            "storage_class": storage_classes,
+            "datastores": datastores,
+            "transferred_mb": round(transferred_mb, 1),
+            "seconds": round(seconds, 1),
+            "avg_mb_per_s": round(transferred_mb / seconds, 2) if seconds else 0.0,
+            "stalls": sum(vm["stalls"] for vm in vms.values()),
+            "vms": vms,
+        }
+        LOGGER.info(
+            f"Plan '{plan.name}' disk transfer: {summary['transferred_mb']} MB in {summary['seconds']}s "
+            f"({summary['avg_mb_per_s']} MB/s) to storage class '{storage_classes}'"
+        )
+        with self._lock:
+            self._summaries[key] = summary
+            self._unreported.append(key)
+
+        return summary
+
+    @property
+    def storage_summary(self) -> dict[str, dict[str, float]]:
+        """Throughput per storage class / source datastores over all finished plans."""
+        with self._lock:
+            summaries = list(self._summaries.values())
+
+        storage: dict[str, dict[str, float]] = {}
+        for summary in summaries:
+            _storage = storage.setdefault(
+                f"{summary['storage_class']}/{summary['datastores']}",
+                {"plans": 0, "transferred_mb": 0.0, "seconds": 0.0},
+            )
+            _storage["plans"] += 1
+            _storage["transferred_mb"] += summary["transferred_mb"]
+            _storage["seconds"] += summary["seconds"]
+
+        for _storage in storage.values():
+            _storage["avg_mb_per_s"] = (
+                round(_storage["transferred_mb"] / _storage["seconds"], 2) if _storage["seconds"] else 0.0
+            )
+
+        return storage
+
+    def pop_junit_properties(self) -> list[tuple[str, Any]]:
+        """Junit properties of the plans finished since the previous call.
+
+        Returns:
+            list[tuple[str, Any]]: (name, value) pairs for ``item.user_properties``.
+        """
+        with self._lock:
+            summaries = [self._summaries[key] for key in self._unreported]
+            self._unreported.clear()
+
+        properties: list[tuple[str, Any]] = []
+        for summary in summaries:
+            prefix = f"disk_transfer.{summary['plan']}"
+            properties.extend(
+                (f"{prefix}.{field}", summary[field])
+                for field in ("storage_class", "datastores", "transferred_mb", "seconds", "avg_mb_per_s", "stalls")
+            )
+            properties.extend(
+                (f"{prefix}.vm.{vm_name}.avg_mb_per_s", vm["avg_mb_per_s"]) for vm_name, vm in summary["vms"].items()
+            )
+
+        if summaries:
+            properties.extend(
+                (f"disk_transfer.storage.{storage_key}.avg_mb_per_s", storage["avg_mb_per_s"])
+                for storage_key, storage in self.storage_summary.items()
+            )
+
+        return properties
+
+    def export(self, path: Path) -> None:
+        """Write the plan and storage summaries as JSON.
+
+        Args:
+            path (Path): Target JSON file.
+        """
+        with self._lock:
+            plans = list(self._summaries.values())
+
+        if plans:
+            LOGGER.info(f"Write disk transfer throughput of {len(plans)} plans to {path}")
+            with open(path, "w") as fd:
+                json.dump({"plans": plans, "storage": self.storage_summary}, fd, indent=2)
+
+
+def _plan_storage_keys(plan: Plan) -> tuple[str, str]:
+    """Destination storage classes and source datastores of the plan StorageMap, comma separated."""
+    try:
+        plan_map = plan.instance.spec.map
+        storage_map_ref = plan_map.storage if plan_map else None
+        if not storage_map_ref:
+            return "", ""
+
+        storage_map = StorageMap(client=plan.client, name=storage_map_ref.name, namespace=storage_map_ref.namespace)
+        entries = storage_map.instance.spec.map or []
+    except ApiException as exp:
+        LOGGER.warning(f"Failed to read the StorageMap of plan '{plan.name}': {exp}")
+        return "", ""
+
+    storage_classes = sorted({
+        entry.destination.storageClass for entry in entries if entry.destination and entry.destination.storageClass
+    })
+    datastores = sorted({entry.source.name or entry.source.id for entry in entries if entry.source})
+    return ",".join(storage_classes), ",".join(datastores)
+
+
+TRANSFER_THROUGHPUT = TransferThroughputSampler()
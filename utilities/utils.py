@@ -259,7 +259,8 @@ def get_per_nic_networks(
             yet present in the inventory as cloned VMs.
     """
     if isinstance(source_provider, OvirtProvider):
-        missing_vms = [vm for vm in vms if vm not in source_provider_inventory.vms_names]
+        inventory_vm_names = set(source_provider_inventory.vms_names)
+        missing_vms = [vm for vm in vms if vm not in inventory_vm_names]
         if missing_vms:
             raise ValueError(
                 f"per_nic_network_map is not supported for RHV templates {missing_vms}: RHV templates "
@@ -403,6 +404,7 @@ def create_source_provider(
     elif vmware_provider(provider_data=source_provider_data_copy):
         source_provider = VMWareProvider
         provider_args["host"] = source_provider_data_copy["fqdn"]
+        provider_args["vm_pool_size"] = py_config.get("vm_pool_size", 0)
         secret_string_data["user"] = source_provider_data_copy["username"]
         secret_string_data["password"] = source_provider_data_copy["password"]
         # Pass copyoffload configuration if present
@@ -855,15 +857,14 @@ def populate_vm_ids(plan: dict[str, Any], inventory: ForkliftInventory) -> None:
 
     Raises:
         ValueError: If the plan is malformed (not a dict or missing 'virtual_machines' list),
-            or if inventory.get_vm raises ValueError when a VM is not found.
+            or if inventory.get_vm_id raises ValueError when a VM is not found.
     """
     if not isinstance(plan, dict) or not isinstance(plan.get("virtual_machines"), list):
         raise ValueError("plan must contain 'virtual_machines' list")
 
     for vm in plan["virtual_machines"]:
         vm_name = vm["name"]
-        vm_data = inventory.get_vm(vm_name)
-        vm["id"] = vm_data["id"]
+        vm["id"] = inventory.get_vm_id(name=vm_name)
 
 
 def extract_vm_from_plan(
@@ -0,0 +1,194 @@
+"""Event driven vSphere task waits.
+
+``VSphereTaskWaiter`` registers every awaited task as a filter of one dedicated PropertyCollector
+and a single dispatcher thread blocks on ``WaitForUpdatesEx``, handing state, progress, error and
+result changes to the waiting threads. Awaiting a task costs a CreateFilter and a Destroy call
+instead of a ``task.info`` fetch per poll, however many tasks are in flight. The dispatcher exits
+when no task is awaited and is restarted by the next wait.
+"""
+
+from __future__ import annotations
+
+import http.client
+import threading
+import time
+from typing import Any
+
+from pyVmomi import vim, vmodl
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.waiters import WAIT_STATS
+
+LOGGER = get_logger(__name__)
+
+TASK_INFO_PATHS = ("info.state", "info.error", "info.result", "info.progress")
+TASK_UPDATES_MAX_WAIT = 30
+
+
+class TaskWait:
+    """Latest state of one awaited task, filled in by the dispatcher thread."""
+
+    def __init__(self, action_name: str) -> None:
+        self.action_name = action_name
+        self.state: str | None = None
+        self.error: Any = None
+        self.result: Any = None
+        self.progress: int | None = None
+        self.updates = 0
+        # The dispatcher stopped before the task finished, the caller has to poll for the remaining seconds
+        self.lost = False
+        self.remaining: float = 0
+        self.done = threading.Event()
+
+    def update(self, changes: list[Any]) -> None:
+        self.updates += 1
+        for change in changes:
+            value = None if change.op == "remove" else change.val
+            setattr(self, change.name.removeprefix("info."), value)
+
+        if self.state in (vim.TaskInfo.State.success, vim.TaskInfo.State.error):
+            self.done.set()
+        elif self.progress is not None:
+            # Use f-string format - parameterized format ("%s", arg) not properly handled by simple_logger
+            LOGGER.info(f"{self.action_name} progress: {self.progress}%")
+
+
+class VSphereTaskWaiter:
+    """Await any number of vSphere tasks of one session with one WaitForUpdatesEx loop.
+
+    Args:
+        service_instance (vim.ServiceInstance): The connected vSphere service instance.
+        max_wait_seconds (int): WaitForUpdatesEx timeout, also how long an idle dispatcher lives.
+            Defaults to TASK_UPDATES_MAX_WAIT.
+    """
+
+    def __init__(self, service_instance: vim.ServiceInstance, max_wait_seconds: int = TASK_UPDATES_MAX_WAIT) -> None:
+        self.service_instance = service_instance
+        self.max_wait_seconds = max_wait_seconds
+        self._lock = threading.Lock()
+        self._collector: vmodl.query.PropertyCollector | None = None
+        self._dispatcher: threading.Thread | None = None
+        self._waits: dict[str, TaskWait] = {}
+
+    def _start(self) -> vmodl.query.PropertyCollector:
+        """Create the collector on first use and start the dispatcher if it is not running, under the lock."""
+        if self._collector is None:
+            # A dedicated collector, WaitForUpdatesEx must not consume updates of other filters
+            self._collector = self.service_instance.RetrieveContent().propertyCollector.CreatePropertyCollector()
+
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, args=(self._collector,), name="vsphere-task-waiter", daemon=True
+            )
+            self._dispatcher.start()
+
+        return self._collector
+
+    def _dispatch(self, collector: vmodl.query.PropertyCollector) -> None:
+        options = vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=self.max_wait_seconds)  # type: ignore[attr-defined]
+        version = ""
+        try:
+            while True:
+                with self._lock:
+                    if not self._waits:
+                        self._dispatcher = None
+                        return
+
+                update_set = collector.WaitForUpdatesEx(version=version, options=options)
+                if not update_set:
+                    continue
+
+                version = update_set.version
+                for filter_update in update_set.filterSet or []:
+                    for object_update in filter_update.objectSet or []:
+                        with self._lock:
+                            task_wait = self._waits.get(object_update.obj._moId)
+                        if task_wait:
+                            task_wait.update(changes=object_update.changeSet or [])
+
+        except (vmodl.MethodFault, OSError, http.client.HTTPException) as exp:
+            LOGGER.warning(f"vSphere task updates failed, falling back to polling: {exp}")
+
+        finally:
+            failed = False
+            with self._lock:
+                if self._dispatcher is threading.current_thread():
+                    failed = True
+                    self._dispatcher = None
+                    self._collector = None
+                    for task_wait in self._waits.values():
+                        # A wait already done by a terminal update keeps its final state
+                        if not task_wait.done.is_set():
+                            task_wait.lost = True
+                            task_wait.done.set()
+
+            if failed:
+                # Destroying the collector also removes the filters of the lost waits
+                try:
+                    collector.DestroyPropertyCollector()
+                except (vmodl.MethodFault, OSError, http.client.HTTPException) as exp:
+                    LOGGER.debug(f"Failed to destroy the vSphere task property collector: {exp}")
+
+    def wait(self, task: vim.Task, action_name: str, wait_timeout: float) -> TaskWait:
+        """Block until a task succeeded or failed.
+
+        Args:
+            task (vim.Task): The task to wait for.
+            action_name (str): Action name for the progress logs.
+            wait_timeout (float): Time in seconds to wait for the task.
+
+        Returns:
+            TaskWait: The final task state, ``lost`` with the ``remaining`` seconds of wait_timeout when the
+                update loop failed before the task finished.
+
+        Raises:
+            TimeoutExpiredError: If the task did not finish within wait_timeout.
+        """
+        task_id = task._moId
+        task_wait = TaskWait(action_name=action_name)
+        start = time.monotonic()
+        with self._lock:
+            self._waits[task_id] = task_wait
+            collector = self._start()
+
+        property_filter = None
+        try:
+            collector_spec = vmodl.query.PropertyCollector
+            try:
+                property_filter = collector.CreateFilter(
+                    spec=collector_spec.FilterSpec(
+                        objectSet=[collector_spec.ObjectSpec(obj=task)],
+                        propSet=[collector_spec.PropertySpec(type=vim.Task, pathSet=list(TASK_INFO_PATHS))],
+                    ),
+                    partialUpdates=True,
+                )
+            except vmodl.MethodFault as exp:
+                # E.g. a failing dispatcher destroyed the collector after it was handed out, or the session expired
+                LOGGER.warning(f"Failed to watch task {task_id}, falling back to polling: {exp}")
+                task_wait.lost = True
+                task_wait.done.set()
+
+            finished = task_wait.done.wait(timeout=wait_timeout)
+        finally:
+            with self._lock:
+                self._waits.pop(task_id, None)
+            if property_filter is not None and not task_wait.lost:
+                try:
+                    property_filter.Destroy()
+                except vmodl.fault.ManagedObjectNotFound:
+                    LOGGER.debug(f"Property filter of task {task_id} is already gone")
+
+        WAIT_STATS.record(
+            site=f"{__name__}.VSphereTaskWaiter.wait",
+            polls=task_wait.updates,
+            seconds=time.monotonic() - start,
+            timed_out=not finished,
+        )
+        if task_wait.lost:
+            task_wait.remaining = max(wait_timeout - (time.monotonic() - start), 0)
+
+        if not finished:
+            raise TimeoutExpiredError(value=f"{action_name}: task {task_id} is {task_wait.state} after {wait_timeout}s")
+
+        return task_wait
@@ -0,0 +1,291 @@
+"""Persistent pool of ready VMware clones, reused across sessions.
+
+Instead of cloning a base VM for every test class, ``VMwareVmPool`` keeps up to ``size`` clones per
+base VM (and CTK setting) on the source provider. Each member has a ``clean`` snapshot taken right
+after it was cloned and carries its pool metadata as JSON in the VM annotation:
+
+    mtv-api-tests-vm-pool:{"base": ..., "ctk": ..., "pool_name": ..., "lease": null}
+
+A lease renames the member to the session clone name and records the session in ``lease`` with one
+ReconfigVM_Task guarded by the config ``changeVersion``, so concurrent sessions can not lease the
+same member. Session teardown returns the member: it reverts to the clean snapshot, drops the
+snapshots taken by the tests and gets its pool name back. Leases older than ``lease_ttl`` belong to
+sessions that never returned them and are reclaimed.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from pyVmomi import vim
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError
+
+from exceptions.exceptions import VmCloneError
+
+if TYPE_CHECKING:
+    from libs.providers.vmware import VMWareProvider
+
+LOGGER = get_logger(__name__)
+
+VM_POOL_ANNOTATION_PREFIX = "mtv-api-tests-vm-pool:"
+VM_POOL_CLEAN_SNAPSHOT = "mtv-api-tests-vm-pool-clean"
+VM_POOL_NAME_PREFIX = "mtv-pool"
+VM_POOL_LEASE_TTL = 6 * 3600
+# fixture_store teardown key of the leased VMs, returned to the pool instead of deleted
+VM_POOL_LEASES = "VMwarePoolLease"
+# Clone options that change what clone_vm creates, VMs cloned with them can not come from the pool
+VM_POOL_INCOMPATIBLE_OPTIONS = frozenset({
+    "add_disks",
+    "clone_name",
+    "disk_type",
+    "migrate_shared_disks",
+    "preserve_name_format",
+    "target_datastore_id",
+    "target_esxi_host",
+})
+
+
+def _pool_data(annotation: str | None) -> dict[str, Any] | None:
+    if not annotation or not annotation.startswith(VM_POOL_ANNOTATION_PREFIX):
+        return None
+
+    return json.loads(annotation.removeprefix(VM_POOL_ANNOTATION_PREFIX))
+
+
+def _pool_annotation(data: dict[str, Any]) -> str:
+    return f"{VM_POOL_ANNOTATION_PREFIX}{json.dumps(data, sort_keys=True)}"
+
+
+class VMwareVmPool:
+    """Lease ready clones of base VMs instead of cloning them.
+
+    Args:
+        provider (VMWareProvider): The provider the pool VMs live on.
+        size (int): Maximum pool members per base VM and CTK setting. Concurrent sessions growing
+            the same pool may overshoot it by a member each.
+        lease_ttl (int): Seconds after which a lease is stale and its member reclaimed.
+            Defaults to VM_POOL_LEASE_TTL.
+    """
+
+    def __init__(self, provider: VMWareProvider, size: int = 0, lease_ttl: int = VM_POOL_LEASE_TTL) -> None:
+        self.provider = provider
+        self.size = size
+        self.lease_ttl = lease_ttl
+        # Serializes the leases of this process, other sessions are excluded by changeVersion
+        self._lock = threading.Lock()
+        # Members being cloned per (base VM, CTK), counted against size
+        self._creating: dict[tuple[str, bool], int] = {}
+
+    def _members(self, base_vm_name: str, ctk: bool) -> list[tuple[vim.VirtualMachine, dict[str, Any], str]]:
+        """Pool members of a base VM with their pool data and config changeVersion, one PropertyCollector call."""
+        members = []
+        for vm, properties in self.provider.retrieve_properties(
+            vimtype=[vim.VirtualMachine], path_set=["config.annotation", "config.changeVersion"]
+        ):
+            data = _pool_data(annotation=properties.get("config.annotation"))
+            if data and data["base"] == base_vm_name and data["ctk"] == ctk:
+                members.append((vm, data, properties.get("config.changeVersion", "")))
+
+        return members
+
+    def _reconfigure(
+        self, vm: vim.VirtualMachine, name: str, data: dict[str, Any], change_version: str | None = None
+    ) -> bool:
+        """Rename a member and write its pool data, only if its config is still at change_version."""
+        spec = vim.vm.ConfigSpec(name=name, annotation=_pool_annotation(data=data))
+        if change_version:
+            spec.changeVersion = change_version
+
+        try:
+            self.provider.wait_task(task=vm.ReconfigVM_Task(spec=spec), action_name=f"Updating pool VM {name}")
+        except VmCloneError as exp:
+            LOGGER.info(f"Pool VM {data['pool_name']} changed concurrently, skipping it: {exp}")
+            return False
+
+        finally:
+            self.provider.invalidate_obj_index(vimtype=vim.VirtualMachine)
+
+        return True
+
+    def _lease_data(self, data: dict[str, Any], clone_vm_name: str, session_uuid: str) -> dict[str, Any]:
+        return {**data, "lease": {"session": session_uuid, "name": clone_vm_name, "leased_at": int(time.time())}}
+
+    def _leased(self, vm: vim.VirtualMachine, pool_name: str, clone_vm_name: str) -> vim.VirtualMachine:
+        LOGGER.info(f"Leased pool VM {pool_name} as {clone_vm_name}")
+        if self.provider.fixture_store:
+            self.provider.fixture_store["teardown"].setdefault(VM_POOL_LEASES, []).append({"name": clone_vm_name})
+
+        return vm
+
+    def _revert(self, vm: vim.VirtualMachine, data: dict[str, Any]) -> None:
+        """Revert a member to its clean snapshot and drop later snapshots."""
+        clean_snapshots = [tree for tree in self.provider.snapshot_trees(vm=vm) if tree.name == VM_POOL_CLEAN_SNAPSHOT]
+        if not clean_snapshots:
+            raise VmCloneError(f"Pool VM {data['pool_name']} has no '{VM_POOL_CLEAN_SNAPSHOT}' snapshot")
+
+        clean_snapshot = clean_snapshots[0]
+        self.provider.wait_task(
+            task=clean_snapshot.snapshot.RevertToSnapshot_Task(),
+            action_name=f"Reverting pool VM {data['pool_name']}",
+            wait_timeout=60 * 10,
+            sleep=5,
+        )
+        for child in clean_snapshot.childSnapshotList or []:
+            self.provider.wait_task(
+                task=child.snapshot.RemoveSnapshot_Task(removeChildren=True, consolidate=True),
+                action_name=f"Removing snapshot '{child.name}' of pool VM {data['pool_name']}",
+                wait_timeout=60 * 10,
+                sleep=5,
+            )
+
+    def _reset(self, vm: vim.VirtualMachine, data: dict[str, Any]) -> bool:
+        """Revert a member and give it its pool name back."""
+        self._revert(vm=vm, data=data)
+        return self._reconfigure(vm=vm, name=data["pool_name"], data={**data, "lease": None})
+
+    def _reclaim(self, vm: vim.VirtualMachine, data: dict[str, Any], session_vm_name: str, session_uuid: str) -> bool:
+        """Revert a member already claimed by this session and write its lease back."""
+        try:
+            self._revert(vm=vm, data=data)
+            # The revert restores the annotation of the clean snapshot, write the lease again
+            return self._reconfigure(
+                vm=vm,
+                name=session_vm_name,
+                data=self._lease_data(data=data, clone_vm_name=session_vm_name, session_uuid=session_uuid),
+            )
+        except (VmCloneError, TimeoutExpiredError) as exp:
+            # Its fresh lease keeps it from being leased again until it goes stale
+            LOGGER.error(f"Failed to reclaim pool VM {data['pool_name']}, skipping it: {exp}")
+            return False
+
+    def _claim(
+        self, members: list[tuple[vim.VirtualMachine, dict[str, Any], str]], session_vm_name: str, session_uuid: str
+    ) -> tuple[vim.VirtualMachine, dict[str, Any], bool] | None:
+        """Lease the first free or stale member at the changeVersion it was read at.
+
+        A concurrent lease or reclaim of the same member fails on the changeVersion, before a stale
+        member is reverted. Returns the member, its pool data and whether its lease was stale.
+        """
+        for vm, data, change_version in members:
+            lease = data.get("lease")
+            if lease and time.time() - lease["leased_at"] < self.lease_ttl:
+                continue
+
+            if self._reconfigure(
+                vm=vm,
+                name=session_vm_name,
+                data=self._lease_data(data=data, clone_vm_name=session_vm_name, session_uuid=session_uuid),
+                change_version=change_version,
+            ):
+                if lease:
+                    LOGGER.warning(f"Reclaiming pool VM {data['pool_name']}, stale lease of session {lease['session']}")
+
+                return vm, data, bool(lease)
+
+        return None
+
+    def _create_member(self, base_vm_name: str, ctk: bool, clone_vm_name: str, session_uuid: str) -> vim.VirtualMachine:
+        """Clone a new pool member, snapshot it clean and lease it right away, it is never free unleased."""
+        vm = self.provider.clone_vm(
+            source_vm_name=base_vm_name,
+            clone_vm_name=base_vm_name,
+            session_uuid=VM_POOL_NAME_PREFIX,
+            enable_ctk=ctk,
+            track_teardown=False,
+        )
+        pool_name = vm.name
+        # Until it is leased the clone carries no pool data, nothing would ever delete or reuse it
+        leased = False
+        try:
+            self.provider.create_snapshot(vm=vm, name=VM_POOL_CLEAN_SNAPSHOT, description="Clean state of a pool VM")
+            data = {"base": base_vm_name, "ctk": ctk, "pool_name": pool_name, "lease": None}
+            leased = self._reconfigure(
+                vm=vm,
+                name=clone_vm_name,
+                data=self._lease_data(data=data, clone_vm_name=clone_vm_name, session_uuid=session_uuid),
+            )
+        finally:
+            if not leased:
+                self.provider.delete_vm(vm_name=pool_name)
+
+        if not leased:
+            raise VmCloneError(f"Failed to lease new pool VM {pool_name}")
+
+        LOGGER.info(f"Added pool VM {pool_name} of {base_vm_name}")
+        return self._leased(vm=vm, pool_name=pool_name, clone_vm_name=clone_vm_name)
+
+    def lease(
+        self, base_vm_name: str, clone_vm_name: str, session_uuid: str, clone_options: dict[str, Any]
+    ) -> vim.VirtualMachine | None:
+        """Lease a pool member of a base VM as a session clone.
+
+        Args:
+            base_vm_name (str): The VM or template the clone is cloned from.
+            clone_vm_name (str): Base of the session clone name, as passed to clone_vm.
+            session_uuid (str): The session identifier.
+            clone_options (dict[str, Any]): The clone options of the VM.
+
+        Returns:
+            vim.VirtualMachine | None: The leased VM renamed to a session clone name, None when
+                the clone options need a fresh clone or the pool is exhausted.
+        """
+        if (
+            self.provider.copyoffload_config
+            or VM_POOL_INCOMPATIBLE_OPTIONS & clone_options.keys()
+            or clone_options.get("clone_mode", "full") != "full"
+            or clone_options.get("regenerate_mac") is False
+        ):
+            return None
+
+        ctk = bool(clone_options.get("enable_ctk"))
+        key = (base_vm_name, ctk)
+        session_vm_name = self.provider._generate_clone_vm_name(session_uuid=session_uuid, base_name=clone_vm_name)
+        while True:
+            with self._lock:
+                members = self._members(base_vm_name=base_vm_name, ctk=ctk)
+                claimed = self._claim(members=members, session_vm_name=session_vm_name, session_uuid=session_uuid)
+                if claimed is None:
+                    if len(members) + self._creating.get(key, 0) >= self.size:
+                        LOGGER.info(f"VM pool of {base_vm_name} is exhausted ({len(members)} members leased), cloning")
+                        return None
+
+                    # Members are cloned outside the lock, concurrent leases of a growing pool clone in parallel
+                    self._creating[key] = self._creating.get(key, 0) + 1
+                    break
+
+            # Reverts take minutes, stale members are reclaimed outside the lock like members are cloned
+            vm, data, stale = claimed
+            if not stale or self._reclaim(vm=vm, data=data, session_vm_name=session_vm_name, session_uuid=session_uuid):
+                return self._leased(vm=vm, pool_name=data["pool_name"], clone_vm_name=session_vm_name)
+
+        try:
+            return self._create_member(
+                base_vm_name=base_vm_name, ctk=ctk, clone_vm_name=session_vm_name, session_uuid=session_uuid
+            )
+        finally:
+            with self._lock:
+                self._creating[key] -= 1
+
+    def release(self, vm_name: str) -> None:
+        """Return a leased VM to the pool.
+
+        Args:
+            vm_name (str): The session name of the leased VM.
+
+        Raises:
+            ValueError: If the VM is not a pool member.
+            VmCloneError: If the VM has no clean snapshot or was changed while it was returned.
+        """
+        vm = self.provider.get_obj(vimtype=[vim.VirtualMachine], name=vm_name)
+        data = _pool_data(annotation=vm.config.annotation)
+        if not data:
+            raise ValueError(f"VM {vm_name} is not a pool VM")
+
+        if not self._reset(vm=vm, data=data):
+            raise VmCloneError(f"Pool VM {vm_name} changed while it was returned")
+
+        LOGGER.info(f"Returned {vm_name} to the pool as {data['pool_name']}")
@@ -0,0 +1,145 @@
+"""Adaptive backoff polling shared by the TimeoutSampler waits.
+
+``BackoffSampler`` is a drop-in ``TimeoutSampler`` whose ``sleep`` is the per-site ceiling: polls
+start at ``initial_sleep`` and grow exponentially with jitter up to that ceiling, so short waits
+react fast and long waits put less load on the APIs. Every wait is recorded per call site in
+``WAIT_STATS``, which is exported at session end.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+
+LOGGER = get_logger(__name__)
+
+BACKOFF_INITIAL_SLEEP = 1
+BACKOFF_FACTOR = 1.5
+BACKOFF_JITTER = 0.2
+
+
+class WaitStatsRegistry:
+    """Per call site wait statistics: waits, polls, timeouts and wait durations."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, float]] = {}
+
+    def record(self, site: str, polls: int, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            _stats = self._stats.setdefault(
+                site, {"waits": 0, "polls": 0, "timeouts": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            _stats["waits"] += 1
+            _stats["polls"] += polls
+            _stats["timeouts"] += int(timed_out)
+            _stats["total_seconds"] += seconds
+            _stats["max_seconds"] = max(_stats["max_seconds"], seconds)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    @property
+    def stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                site: {
+                    **_stats,
+                    "avg_polls": round(_stats["polls"] / _stats["waits"], 2),
+                    "avg_seconds": round(_stats["total_seconds"] / _stats["waits"], 3),
+                }
+                for site, _stats in sorted(self._stats.items())
+            }
+
+    def export(self, path: Path) -> None:
+        """Write the per site statistics as JSON.
+
+        Args:
+            path (Path): Target JSON file.
+        """
+        if stats := self.stats:
+            LOGGER.info(f"Write wait statistics of {len(stats)} call sites to {path}")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as fd:
+                json.dump(stats, fd, indent=2)
+
+
+WAIT_STATS = WaitStatsRegistry()
+
+
+class _BackoffPoll:
+    """Poll function wrapper that advances the sampler backoff before every call.
+
+    Exposes the wrapped function as ``func`` so TimeoutSampler logs the original function name.
+    """
+
+    def __init__(self, func: Callable, sampler: BackoffSampler) -> None:
+        self.func = func
+        self.sampler = sampler
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.sampler.advance()
+        return self.func(*args, **kwargs)
+
+
+class BackoffSampler(TimeoutSampler):
+    """TimeoutSampler with jittered exponential backoff, capped at ``sleep``.
+
+    Args:
+        wait_timeout (float): Time in seconds to wait for func to return a value equating to True.
+        sleep (float): Backoff ceiling in seconds for this call site.
+        func (Callable): Function to poll.
+        initial_sleep (float): Sleep after the first poll. Defaults to BACKOFF_INITIAL_SLEEP.
+        backoff_factor (float): Sleep growth per poll. Defaults to BACKOFF_FACTOR.
+        jitter (float): Fraction the sleep is randomly shortened by, spreads concurrent waiters.
+            Defaults to BACKOFF_JITTER.
+        site (str): Call site name in WAIT_STATS. Defaults to the qualified name of func.
+        **kwargs (Any): Passed to TimeoutSampler (exceptions_dict, print_log, func kwargs, ...).
+    """
+
+    def __init__(
+        self,
+        wait_timeout: float,
+        sleep: float,
+        func: Callable,
+        initial_sleep: float = BACKOFF_INITIAL_SLEEP,
+        backoff_factor: float = BACKOFF_FACTOR,
+        jitter: float = BACKOFF_JITTER,
+        site: str = "",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(wait_timeout=wait_timeout, sleep=sleep, func=func, **kwargs)
+        self.max_sleep = sleep
+        self.initial_sleep = min(initial_sleep, sleep)
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.site = site or f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+        self.polls = 0
+        self.func = _BackoffPoll(func=func, sampler=self)
+
+    def advance(self) -> None:
+        """Count a poll and set the sleep TimeoutSampler applies after it."""
+        delay = min(self.max_sleep, self.initial_sleep * self.backoff_factor**self.polls)
+        self.polls += 1
+        self.sleep = delay * random.uniform(1 - self.jitter, 1)
+
+    def __iter__(self) -> Any:
+        self.polls = 0
+        start = time.monotonic()
+        timed_out = False
+        try:
+            yield from super().__iter__()
+        except TimeoutExpiredError:
+            timed_out = True
+            raise
+        finally:
+            WAIT_STATS.record(site=self.site, polls=self.polls, seconds=time.monotonic() - start, timed_out=timed_out)